@@ -2,10 +2,12 @@ from .topology_zoo_analysis import analyze_graph as analyze_topology_zoo
 from .sndlib_analysis import analyze_graph as analyze_sndlib
 from .rocketfuel_analysis import analyze_graph as analyze_rocketfuel 
 from .caida_analysis import analyze_graph as analyze_caida
+from .distance_metrics import compute_distance_metrics
 
 __all__ = [
     "analyze_topology_zoo",
     "analyze_sndlib",
     "analyze_rocketfuel",
     "analyze_caida",
+    "compute_distance_metrics",
 ]
@@ -7,8 +7,12 @@ except ModuleNotFoundError:
     import sys
     sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
     from backend.database_handler import save_analysis_results
+from backend.analyzers.distance_metrics import compute_distance_metrics
+from backend.analyzers.sparse_backend import build_csr_backend
+from backend.analyzers.time_budget import MetricRunner, AnalysisCancelled, pick
+from backend.search_index import node_label_text
 
-def analyze_graph(graph_file, project_name="CAIDA", database_path="./network_analysis.db"):
+def analyze_graph(graph_file, project_name="CAIDA", database_path="./network_analysis.db", G=None, save=True):
     """
     Analysiert eine einzelne GraphML-Datei aus dem CAIDA-Datensatz und speichert die Ergebnisse
     in der SQLite-Datenbank. Die Ergebnisse werden auch als Dictionary zurückgegeben.
@@ -17,13 +21,18 @@ def analyze_graph(graph_file, project_name="CAIDA", database_path="./network_ana
       graph_file (str): Pfad zur GraphML-Datei, die analysiert werden soll.
       project_name (str): Name des Projekts oder der Datenquelle (Standard: "CAIDA").
       database_path (str): Pfad zur SQLite-Datenbank.
+      G (networkx.Graph): Bereits eingelesener Graph (optional). Wenn angegeben, wird
+                          graph_file nicht erneut eingelesen.
+      save (bool): Ergebnisse direkt in der Datenbank speichern. Bei False übernimmt
+                   der Aufrufer das Speichern (z.B. gesammelt über database_handler.save_many).
       
     Rückgabe:
       dict: Ein Dictionary mit den berechneten Netzwerkmetriken.
     """
     try:
         # Graph einlesen
-        G = nx.read_graphml(graph_file)
+        if G is None:
+            G = nx.read_graphml(graph_file)
 
         
 
@@ -38,30 +47,39 @@ def analyze_graph(graph_file, project_name="CAIDA", database_path="./network_ana
         is_directed = G.is_directed()
         print("Is the graph directed?", is_directed)
 
+        # Optionales Sparse-Backend: Der Graph wird bei Bedarf einmalig in eine CSR-Matrix
+        # umgewandelt, auf der die folgenden Metriken vektorisiert berechnet werden.
+        csr = build_csr_backend(G)
+
+        # Laufzeitmessung, Zeitbudgets und Abbruchprüfung je Metrik
+        runner = MetricRunner(G)
+
         # Konnektivitäts-Metriken
         is_strongly_connected = nx.is_strongly_connected(G)
         is_weakly_connected = nx.is_weakly_connected(G)
         print("The graph is strongly connected:", is_strongly_connected)
         print("The graph is weakly connected:", is_weakly_connected)
 
-        node_connectivity = nx.node_connectivity(G) if is_strongly_connected else "N/A"
-        edge_connectivity = nx.edge_connectivity(G) if is_strongly_connected else "N/A"
+        node_connectivity = runner.run("node_connectivity", nx.node_connectivity, G) if is_strongly_connected else "N/A"
+        edge_connectivity = runner.run("edge_connectivity", nx.edge_connectivity, G) if is_strongly_connected else "N/A"
         print("Node connectivity:", node_connectivity)
         print("Edge connectivity:", edge_connectivity)
 
         # Multigraph-Check und Planarität
         is_multigraph = isinstance(G, nx.MultiDiGraph)
-        is_planar, _ = nx.check_planarity(G)
+        is_planar = runner.run("is_planar", nx.is_planar, G)
         print("G is a MultiDiGraph:", is_multigraph)
         print("Is the graph planar:", is_planar)
 
         # Strukturmetriken für stark verbundene Graphen
         if is_strongly_connected:
+            # Durchmesser und Radius aus einem gemeinsamen BFS-Durchlauf
+            distance_metrics = runner.run("distance_metrics", compute_distance_metrics, G, closeness=False, csr=csr)
             is_tree = nx.is_tree(G)
             is_forest = nx.is_forest(G)
-            diameter = nx.diameter(G)
-            graph_radius = nx.radius(G)
-            is_bipartite = nx.is_bipartite(G)
+            diameter = pick(distance_metrics, "diameter")
+            graph_radius = pick(distance_metrics, "radius")
+            is_bipartite = csr.is_bipartite() if csr else nx.is_bipartite(G)
             print("Is the graph a tree?", is_tree)
             print("Is the graph a forest?", is_forest)
             print("Diameter:", diameter)
@@ -71,7 +89,7 @@ def analyze_graph(graph_file, project_name="CAIDA", database_path="./network_ana
             is_tree = is_forest = diameter = graph_radius = is_bipartite = "N/A"
 
         # Dichte
-        density = nx.density(G)
+        density = csr.density() if csr else nx.density(G)
         print("Density:", density)
 
         # Ergebnisse zusammenfassen
@@ -93,13 +111,20 @@ def analyze_graph(graph_file, project_name="CAIDA", database_path="./network_ana
             "radius": graph_radius,
             "is_bipartite": is_bipartite,
             "density": density,
+            "metric_timings": json.dumps(runner.timings),
+            "timed_out_metrics": ", ".join(runner.timed_out) or None,
+            # Für den Suchindex, nicht für "analysis_results"
+            "node_labels": node_label_text(G),
         }
 
         # Speichere die Ergebnisse in der SQLite-Datenbank
-        save_analysis_results(database_path, results)
+        if save:
+            save_analysis_results(database_path, results)
 
         return results
 
+    except AnalysisCancelled:
+        raise
     except Exception as e:
         print(f"Fehler bei der Analyse von {graph_file}: {e}")
         return {"project_name": project_name, "file_name": os.path.basename(graph_file), "error": str(e)}
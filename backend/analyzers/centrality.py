@@ -0,0 +1,128 @@
+import math
+import random
+import networkx as nx
+from backend.analyzers import settings
+
+def use_approximation(G, node_threshold=None):
+    """
+    Entscheidet, ob die Zentralitäten für diesen Graphen approximiert werden.
+    """
+    threshold = settings.APPROXIMATION_NODE_THRESHOLD if node_threshold is None else node_threshold
+    return G.number_of_nodes() > threshold
+
+def approximation_error_bound(n, sample_size, delta=None):
+    """
+    Hoeffding-Schranke für die Pivot-Stichprobe: Mit Wahrscheinlichkeit 1 - delta weicht
+    jeder (auf [0, 1] normierte) Schätzwert für alle n Knoten gleichzeitig um höchstens
+    diesen Wert vom exakten Wert ab.
+    """
+    if n < 2 or sample_size >= n:
+        return 0.0
+    delta = settings.APPROXIMATION_CONFIDENCE_DELTA if delta is None else delta
+    return math.sqrt(math.log(2 * n / delta) / (2 * sample_size))
+
+def _sample_pivots(G, sample_size, rng):
+    """
+    Wählt die Pivot-Knoten. Bei ungerichteten Graphen wird jede Zusammenhangskomponente
+    proportional zu ihrer Größe (mindestens ein Pivot) berücksichtigt, damit auch kleine
+    Komponenten einen Schätzwert erhalten. Rückgabe: Liste von (Pivots, Komponentengröße).
+    """
+    n = G.number_of_nodes()
+    if G.is_directed():
+        nodes = list(G)
+        return [(rng.sample(nodes, min(sample_size, n)), n)]
+
+    strata = []
+    for component in nx.connected_components(G):
+        size = len(component)
+        k = min(size, max(1, round(sample_size * size / n)))
+        strata.append((rng.sample(sorted(component, key=str), k), size))
+    return strata
+
+def approximate_closeness_centrality(G, sample_size, seed=None):
+    """
+    Schätzt die Closeness-Zentralität (wie nx.closeness_centrality mit wf_improved=True)
+    über Breitensuchen von einer Stichprobe aus Pivot-Knoten (Eppstein-Wang-Verfahren).
+    Die Summe der Distanzen eines Knotens wird aus den Distanzen zu den Pivots hochgerechnet.
+
+    Parameter:
+      G (networkx.Graph): Der zu analysierende Graph.
+      sample_size (int): Anzahl der Pivot-Knoten.
+      seed (int): Seed für die Auswahl der Pivots.
+
+    Rückgabe:
+      dict: Knoten -> geschätzte Closeness-Zentralität.
+    """
+    n = G.number_of_nodes()
+    rng = random.Random(seed)
+    distance_sums = dict.fromkeys(G, 0)
+    reached_by = dict.fromkeys(G, 0)
+    scale = dict.fromkeys(G, 1.0)
+    component_size = dict.fromkeys(G, n)
+
+    for pivots, size in _sample_pivots(G, sample_size, rng):
+        for pivot in pivots:
+            # Bei gerichteten Graphen zählen (wie in NetworkX) die eingehenden Distanzen,
+            # also die Distanzen vom Pivot zum Knoten.
+            for node, distance in nx.single_source_shortest_path_length(G, pivot).items():
+                distance_sums[node] += distance
+                reached_by[node] += 1
+                scale[node] = size / len(pivots)
+                component_size[node] = size
+
+    closeness = {}
+    for node in G:
+        if reached_by[node] == 0 or n < 2:
+            closeness[node] = 0.0
+            continue
+        if G.is_directed():
+            # Anzahl der Knoten, die diesen Knoten erreichen, ebenfalls hochrechnen
+            reachable = max(0.0, scale[node] * reached_by[node] - 1)
+        else:
+            # Ungerichtet: Die Pivots liegen in der Komponente des Knotens, deren Größe exakt bekannt ist
+            reachable = component_size[node] - 1
+        total_distance = scale[node] * distance_sums[node]
+        if total_distance > 0 and reachable > 0:
+            closeness[node] = (reachable / total_distance) * (reachable / (n - 1))
+        else:
+            closeness[node] = 0.0
+    return closeness
+
+def compute_centralities(G, approximate=None, exact_closeness=None, sample_size=None, seed=None):
+    """
+    Berechnet Betweenness- und Closeness-Zentralität. Oberhalb von
+    settings.APPROXIMATION_NODE_THRESHOLD Knoten (oder mit approximate=True) werden beide
+    Metriken über eine Stichprobe von sample_size Pivot-Knoten mit festem Seed approximiert.
+
+    Parameter:
+      G (networkx.Graph): Der zu analysierende Graph.
+      approximate (bool): Modus erzwingen; None = automatisch anhand der Knotenzahl.
+      exact_closeness (dict): Bereits exakt berechnete Closeness (z.B. aus compute_distance_metrics).
+      sample_size (int): Anzahl der Pivots (Standard: settings.APPROXIMATION_SAMPLE_SIZE).
+      seed (int): Seed (Standard: settings.APPROXIMATION_SEED).
+
+    Rückgabe:
+      tuple: (betweenness, closeness, info). info enthält "centrality_mode" ("exact" oder
+             "approximate"), "centrality_sample_size" und "centrality_error" (Fehlerschranke).
+    """
+    if approximate is None:
+        approximate = use_approximation(G)
+    n = G.number_of_nodes()
+    sample_size = settings.APPROXIMATION_SAMPLE_SIZE if sample_size is None else sample_size
+    seed = settings.APPROXIMATION_SEED if seed is None else seed
+
+    if not approximate or sample_size >= n:
+        betweenness = nx.betweenness_centrality(G)
+        closeness = exact_closeness if exact_closeness is not None else nx.closeness_centrality(G)
+        info = {"centrality_mode": "exact", "centrality_sample_size": None, "centrality_error": None}
+        return betweenness, closeness, info
+
+    print(f"Approximiere Zentralitäten mit {sample_size} Pivots (Seed {seed}) für {n} Knoten.")
+    betweenness = nx.betweenness_centrality(G, k=sample_size, seed=seed)
+    closeness = approximate_closeness_centrality(G, sample_size, seed=seed)
+    info = {
+        "centrality_mode": "approximate",
+        "centrality_sample_size": sample_size,
+        "centrality_error": approximation_error_bound(n, sample_size),
+    }
+    return betweenness, closeness, info
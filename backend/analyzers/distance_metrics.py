@@ -0,0 +1,103 @@
+import networkx as nx
+
+def _bfs_lengths(G, source):
+    """
+    Liefert die Hop-Distanzen von source zu allen erreichbaren Knoten (Breitensuche).
+    """
+    return nx.single_source_shortest_path_length(G, source)
+
+def compute_distance_metrics(G, closeness=True, csr=None):
+    """
+    Berechnet alle distanzbasierten Metriken eines Graphen in einem einzigen
+    All-Pairs-Durchlauf: Für jeden Knoten wird genau eine Breitensuche ausgeführt,
+    aus deren Ergebnis Exzentrizität, globale Effizienz und Closeness-Zentralität
+    gleichzeitig abgeleitet werden. Die Distanzen eines Knotens werden nach der
+    Auswertung sofort verworfen (Speicherbedarf O(n) statt O(n²)).
+
+    Die Werte entsprechen denen von nx.eccentricity, nx.diameter, nx.radius, nx.center,
+    nx.periphery, nx.global_efficiency und nx.closeness_centrality, die sonst jeweils
+    eigene All-Pairs-Berechnungen durchführen.
+
+    Parameter:
+      G (networkx.Graph): Der zu analysierende Graph.
+      closeness (bool): Closeness-Zentralität mitberechnen. Bei gerichteten Graphen
+                        erfordert das (wie in NetworkX) einen zweiten Durchlauf über
+                        die eingehenden Kanten.
+      csr (CSRGraph): Optionales Sparse-Backend (siehe sparse_backend.build_csr_backend).
+                      Wenn angegeben, werden die Distanzen vektorisiert blockweise berechnet.
+
+    Rückgabe:
+      dict: Mit den Schlüsseln
+        "eccentricity", "diameter", "radius", "center", "periphery" (None, falls der Graph
+        nicht (stark) zusammenhängend ist), "global_efficiency" (None bei gerichteten
+        Graphen) und "closeness_centrality" (None, falls nicht angefordert).
+    """
+    if csr is not None:
+        return csr.distance_metrics(closeness=closeness)
+
+    n = G.number_of_nodes()
+    directed = G.is_directed()
+    # Closeness verwendet bei gerichteten Graphen die eingehenden Distanzen
+    closeness_in_sweep = closeness and not directed
+
+    eccentricity = {}
+    all_reached = True
+    efficiency_sum = 0
+    closeness_centrality = {} if closeness else None
+
+    for source in G:
+        lengths = _bfs_lengths(G, source)
+
+        if len(lengths) != n:
+            all_reached = False
+        elif all_reached:
+            eccentricity[source] = max(lengths.values())
+
+        if not directed:
+            for distance in lengths.values():
+                if distance > 0:
+                    efficiency_sum += 1 / distance
+
+        if closeness_in_sweep:
+            closeness_centrality[source] = _closeness_from_lengths(lengths, n)
+
+    if closeness and directed:
+        reversed_G = G.reverse(copy=False)
+        for source in G:
+            closeness_centrality[source] = _closeness_from_lengths(_bfs_lengths(reversed_G, source), n)
+
+    metrics = {
+        "eccentricity": None,
+        "diameter": None,
+        "radius": None,
+        "center": None,
+        "periphery": None,
+        "global_efficiency": None,
+        "closeness_centrality": closeness_centrality,
+    }
+
+    if not directed:
+        denom = n * (n - 1)
+        metrics["global_efficiency"] = efficiency_sum / denom if denom != 0 else 0
+
+    if all_reached and n > 0:
+        diameter = max(eccentricity.values())
+        radius = min(eccentricity.values())
+        metrics["eccentricity"] = eccentricity
+        metrics["diameter"] = diameter
+        metrics["radius"] = radius
+        metrics["center"] = [v for v in eccentricity if eccentricity[v] == radius]
+        metrics["periphery"] = [v for v in eccentricity if eccentricity[v] == diameter]
+
+    return metrics
+
+def _closeness_from_lengths(lengths, n):
+    """
+    Closeness-Zentralität eines Knotens aus seinen BFS-Distanzen
+    (Wasserman-Faust-Normierung wie nx.closeness_centrality mit wf_improved=True).
+    """
+    totsp = sum(lengths.values())
+    if totsp > 0.0 and n > 1:
+        reachable = len(lengths) - 1
+        return (reachable / totsp) * (reachable / (n - 1))
+    return 0.0
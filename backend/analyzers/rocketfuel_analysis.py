@@ -7,8 +7,12 @@ except ModuleNotFoundError:
     import sys
     sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
     from backend.database_handler import save_analysis_results
+from backend.analyzers.distance_metrics import compute_distance_metrics
+from backend.analyzers.sparse_backend import build_csr_backend
+from backend.analyzers.time_budget import MetricRunner, AnalysisCancelled, pick
+from backend.search_index import node_label_text
 
-def analyze_graph(graph_file, project_name="Rocketfuel", database_path="./network_analysis.db"):
+def analyze_graph(graph_file, project_name="Rocketfuel", database_path="./network_analysis.db", G=None, save=True):
     """
     Analysiert eine einzelne GraphML-Datei aus dem Rocketfuel-Datensatz und speichert die Ergebnisse
     in der SQLite-Datenbank. Die Ergebnisse werden auch als Dictionary zurückgegeben.
@@ -17,13 +21,18 @@ def analyze_graph(graph_file, project_name="Rocketfuel", database_path="./networ
       graph_file (str): Pfad zur GraphML-Datei, die analysiert werden soll.
       project_name (str): Name des Projekts (Standard: "Rocketfuel").
       database_path (str): Pfad zur SQLite-Datenbank.
+      G (networkx.Graph): Bereits eingelesener Graph (optional). Wenn angegeben, wird
+                          graph_file nicht erneut eingelesen.
+      save (bool): Ergebnisse direkt in der Datenbank speichern. Bei False übernimmt
+                   der Aufrufer das Speichern (z.B. gesammelt über database_handler.save_many).
     
     Rückgabe:
       dict: Ein Dictionary mit den berechneten Netzwerkmetriken.
     """
     try:
         # Graph einlesen
-        G = nx.read_graphml(graph_file)
+        if G is None:
+            G = nx.read_graphml(graph_file)
 
         # Basis-Metriken
         number_of_nodes = G.number_of_nodes()
@@ -35,26 +44,37 @@ def analyze_graph(graph_file, project_name="Rocketfuel", database_path="./networ
         is_directed = G.is_directed()
         print("Is the graph directed?", is_directed)
 
+        # Optionales Sparse-Backend: Der Graph wird bei Bedarf einmalig in eine CSR-Matrix
+        # umgewandelt, auf der die folgenden Metriken vektorisiert berechnet werden.
+        csr = build_csr_backend(G)
+
+        # Laufzeitmessung, Zeitbudgets und Abbruchprüfung je Metrik
+        runner = MetricRunner(G)
+
         # Konnektivität
         is_connected = nx.is_connected(G)
         print("The graph is connected:", is_connected)
-        node_connectivity = nx.node_connectivity(G) if is_connected else "N/A"
-        edge_connectivity = nx.edge_connectivity(G) if is_connected else "N/A"
+        node_connectivity = runner.run("node_connectivity", nx.node_connectivity, G) if is_connected else "N/A"
+        edge_connectivity = runner.run("edge_connectivity", nx.edge_connectivity, G) if is_connected else "N/A"
         print("The node connectivity of the graph is:", node_connectivity)
         print("The edge connectivity of the graph is:", edge_connectivity)
 
+        # Distanzbasierte Metriken (Effizienz, Zentrum, Durchmesser, Radius, Peripherie)
+        # werden gemeinsam in einem einzigen All-Pairs-BFS-Durchlauf berechnet.
+        distance_metrics = runner.run("distance_metrics", compute_distance_metrics, G, closeness=False, csr=csr) if is_connected else None
+
         # Effizienz
-        global_efficiency = nx.global_efficiency(G) if is_connected else "N/A"
-        local_efficiency = nx.local_efficiency(G)
+        global_efficiency = pick(distance_metrics, "global_efficiency") if is_connected else "N/A"
+        local_efficiency = runner.run("local_efficiency", nx.local_efficiency, G)
         print("Global efficiency:", global_efficiency)
         print("Local efficiency:", local_efficiency)
 
         # Zusätzliche Metriken bei verbundenen Graphen
         if is_connected:
-            graph_center = nx.center(G)
-            diameter = nx.diameter(G)
-            graph_radius = nx.radius(G)
-            graph_periphery = nx.periphery(G)
+            graph_center = pick(distance_metrics, "center")
+            diameter = pick(distance_metrics, "diameter")
+            graph_radius = pick(distance_metrics, "radius")
+            graph_periphery = pick(distance_metrics, "periphery")
             print("Center of the graph:", graph_center)
             print("Diameter:", diameter)
             print("Radius of graph:", graph_radius)
@@ -65,10 +85,10 @@ def analyze_graph(graph_file, project_name="Rocketfuel", database_path="./networ
         # Eigenschaften
         is_tree = nx.is_tree(G) if not G.is_directed() else False
         is_forest = nx.is_forest(G) if not G.is_directed() else False
-        is_bipartite = nx.is_bipartite(G)
-        is_planar, _ = nx.check_planarity(G)
+        is_bipartite = csr.is_bipartite() if csr else nx.is_bipartite(G)
+        is_planar = runner.run("is_planar", nx.is_planar, G)
         is_multigraph = isinstance(G, nx.MultiGraph)
-        density = nx.density(G)
+        density = csr.density() if csr else nx.density(G)
 
         print("Is the graph a tree?", is_tree)
         print("Is the graph a forest?", is_forest)
@@ -98,14 +118,21 @@ def analyze_graph(graph_file, project_name="Rocketfuel", database_path="./networ
             "is_forest": is_forest,
             "is_bipartite": is_bipartite,
             "is_planar": is_planar,
-            "is_multigraph": is_multigraph
+            "is_multigraph": is_multigraph,
+            "metric_timings": json.dumps(runner.timings),
+            "timed_out_metrics": ", ".join(runner.timed_out) or None,
+            # Für den Suchindex, nicht für "analysis_results"
+            "node_labels": node_label_text(G),
         }
 
         # Ergebnisse in der Datenbank speichern
-        save_analysis_results(database_path, results)
+        if save:
+            save_analysis_results(database_path, results)
 
         return results
 
+    except AnalysisCancelled:
+        raise
     except Exception as e:
         print(f"Fehler bei der Analyse von {graph_file}: {e}")
         return {"project_name": project_name, "file_name": os.path.basename(graph_file), "error": str(e)}
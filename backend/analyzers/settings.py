@@ -0,0 +1,55 @@
+# Zentrale Einstellungen für die Analyzer.
+# Die Werte können vor dem Start einer Analyse angepasst werden (z.B. settings.APPROXIMATION_SAMPLE_SIZE = 512).
+
+# Ab dieser Knotenzahl werden Betweenness- und Closeness-Zentralität per Pivot-Stichprobe
+# approximiert statt exakt berechnet (exakt: O(V·E)).
+APPROXIMATION_NODE_THRESHOLD = 5000
+
+# Anzahl der Pivot-Knoten (Quellen) im approximativen Modus
+APPROXIMATION_SAMPLE_SIZE = 256
+
+# Fester Seed, damit approximierte Ergebnisse reproduzierbar sind
+APPROXIMATION_SEED = 42
+
+# Irrtumswahrscheinlichkeit für die angegebene Fehlerschranke (0.05 = gilt mit 95 % Wahrscheinlichkeit)
+APPROXIMATION_CONFIDENCE_DELTA = 0.05
+
+# Rechen-Backend für PageRank, Gradzentralität, Dichte, Bipartitheit und Distanzmetriken:
+#   "networkx" = reine NetworkX-Berechnung
+#   "sparse"   = vektorisiert über eine SciPy-CSR-Adjazenzmatrix
+#   "auto"     = "sparse" ab SPARSE_NODE_THRESHOLD Knoten (falls SciPy installiert ist)
+COMPUTE_BACKEND = "auto"
+SPARSE_NODE_THRESHOLD = 2000
+
+# Anzahl der Quellknoten, deren Distanzen im Sparse-Backend gleichzeitig berechnet werden
+SPARSE_BATCH_SIZE = 256
+
+# Zeitbudget in Sekunden je teurer Metrik (None = unbegrenzt). Metriken, die ihr Budget
+# überschreiten, werden abgebrochen und mit dem Wert "Timeout" gespeichert.
+METRIC_TIME_BUDGETS = {
+    "node_connectivity": 600,
+    "edge_connectivity": 600,
+    "local_efficiency": 600,
+    "distance_metrics": 600,
+    "centralities": 600,
+    "pagerank": 600,
+    "is_planar": 600,
+}
+
+# Teure Metriken (Namen wie in METRIC_TIME_BUDGETS), die nicht berechnet werden und den
+# Wert "N/A" erhalten, z.B. ("node_connectivity", "edge_connectivity").
+# Das Kommandozeilenwerkzeug (backend/cli.py) setzt diesen Wert über --metrics/--skip-metrics.
+SKIPPED_METRICS = ()
+
+# Zeitbudgets gelten erst ab dieser Knotenzahl; kleinere Graphen werden ohne eigenen
+# Prozess direkt berechnet (nur die Laufzeit wird gemessen).
+TIME_BUDGET_NODE_THRESHOLD = 1000
+
+# Version der Analyselogik. Muss erhöht werden, wenn sich die berechneten Werte ändern,
+# damit zwischengespeicherte Ergebnisse (Ergebnis-Cache) nicht mehr verwendet werden.
+# 2: Kennzahlen der Knotenmetriken (max/mean/p95) und Knotenbezeichnungen für den Suchindex
+ANALYZER_VERSION = 2
+
+# Ergebnisse unveränderter Dateien (gleicher Inhalt, gleiche Einstellungen) aus dem
+# Ergebnis-Cache der Datenbank übernehmen, statt sie erneut zu analysieren.
+RESULT_CACHE_ENABLED = True
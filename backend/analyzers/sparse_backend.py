@@ -0,0 +1,203 @@
+import networkx as nx
+from backend.analyzers import settings
+
+try:
+    import numpy as np
+    import scipy.sparse as sparse
+    from scipy.sparse import csgraph
+    SCIPY_AVAILABLE = True
+except ImportError:  # SciPy/NumPy sind optional, ohne sie wird NetworkX verwendet
+    SCIPY_AVAILABLE = False
+
+def build_csr_backend(G, backend=None):
+    """
+    Wählt das Rechen-Backend für einen Graphen und wandelt ihn bei Bedarf einmalig
+    in eine CSR-Adjazenzmatrix um.
+
+    Parameter:
+      G (networkx.Graph): Der zu analysierende Graph.
+      backend (str): "networkx", "sparse" oder "auto" (Standard: settings.COMPUTE_BACKEND).
+                     "auto" verwendet das Sparse-Backend ab settings.SPARSE_NODE_THRESHOLD Knoten.
+
+    Rückgabe:
+      CSRGraph oder None: None bedeutet, dass die Metriken mit NetworkX berechnet werden.
+    """
+    backend = settings.COMPUTE_BACKEND if backend is None else backend
+    if backend == "networkx" or not SCIPY_AVAILABLE:
+        if backend == "sparse":
+            print("SciPy/NumPy nicht verfügbar, verwende NetworkX-Backend.")
+        return None
+    if backend == "auto" and G.number_of_nodes() < settings.SPARSE_NODE_THRESHOLD:
+        return None
+    if G.number_of_nodes() == 0:
+        return None
+    return CSRGraph(G)
+
+class CSRGraph:
+    """
+    Hält einen Graphen als SciPy-CSR-Matrix und berechnet Metriken vektorisiert.
+    Alle Ergebnisse werden wieder den ursprünglichen Knoten-IDs zugeordnet, sodass
+    sie identisch zu den NetworkX-Ergebnissen weiterverarbeitet und gespeichert werden können.
+
+    Parallele Kanten eines Multigraphen werden als Mehrfacheinträge (Summe) gezählt,
+    wie bei nx.to_scipy_sparse_array.
+    """
+
+    def __init__(self, G):
+        self.nodelist = list(G)
+        self.n = len(self.nodelist)
+        self.directed = G.is_directed()
+        self.number_of_edges = G.number_of_edges()
+        # Ungewichtete Adjazenz (Kantenanzahl je Knotenpaar)
+        self.A = nx.to_scipy_sparse_array(G, nodelist=self.nodelist, weight=None, dtype=float, format="csr")
+        # Gewichtete Matrix nur, falls Kantengewichte vorhanden sind (für PageRank wie in NetworkX)
+        has_weights = any("weight" in data for _, _, data in G.edges(data=True))
+        self.W = (
+            nx.to_scipy_sparse_array(G, nodelist=self.nodelist, weight="weight", dtype=float, format="csr")
+            if has_weights else self.A
+        )
+
+    def _to_dict(self, values):
+        return dict(zip(self.nodelist, map(float, values)))
+
+    def degree_centrality(self):
+        """
+        Entspricht nx.degree_centrality (Schleifen zählen bei ungerichteten Graphen doppelt).
+        """
+        if self.n <= 1:
+            return {node: 1.0 for node in self.nodelist}
+        if self.directed:
+            degree = self.A.sum(axis=1) + self.A.sum(axis=0)
+        else:
+            degree = self.A.sum(axis=1) + self.A.diagonal()
+        return self._to_dict(degree / (self.n - 1))
+
+    def density(self):
+        """
+        Entspricht nx.density.
+        """
+        if self.n <= 1:
+            return 0
+        d = self.number_of_edges / (self.n * (self.n - 1))
+        return d if self.directed else d * 2
+
+    def pagerank(self, alpha=0.85, max_iter=100, tol=1.0e-6):
+        """
+        PageRank per Potenziteration mit einer dünn besetzten Matrix-Vektor-Multiplikation
+        je Iteration (gleiche Definition und Abbruchbedingung wie nx.pagerank).
+        """
+        N = self.n
+        S = np.asarray(self.W.sum(axis=1)).ravel()
+        nonzero = S != 0
+        S[nonzero] = 1.0 / S[nonzero]
+        M = sparse.csr_array(sparse.diags(S) @ self.W)
+        is_dangling = np.where(~nonzero)[0]
+
+        p = np.repeat(1.0 / N, N)
+        x = p.copy()
+        for _ in range(max_iter):
+            xlast = x
+            x = alpha * (x @ M + x[is_dangling].sum() * p) + (1 - alpha) * p
+            if np.absolute(x - xlast).sum() < N * tol:
+                return self._to_dict(x)
+        raise nx.PowerIterationFailedConvergence(max_iter)
+
+    def _bfs_levels(self, U):
+        """
+        Gleichzeitige Breitensuche von je einer Wurzel pro Zusammenhangskomponente
+        über Sparse-Matrix-Vektor-Produkte. Rückgabe: BFS-Ebene jedes Knotens.
+        """
+        n_components, labels = csgraph.connected_components(U, directed=False)
+        roots = np.unique(labels, return_index=True)[1]
+        level = np.full(self.n, -1, dtype=np.int64)
+        frontier = np.zeros(self.n, dtype=bool)
+        frontier[roots] = True
+        level[roots] = 0
+        depth = 0
+        while frontier.any():
+            depth += 1
+            reached = (U @ frontier.astype(float)) > 0
+            frontier = reached & (level < 0)
+            level[frontier] = depth
+        return level
+
+    def is_bipartite(self):
+        """
+        Entspricht nx.is_bipartite: Zwei-Färbung über die Parität der BFS-Ebenen.
+        Der Graph ist genau dann bipartit, wenn keine Kante zwei Knoten gleicher Parität verbindet.
+        """
+        U = (self.A + self.A.T) if self.directed else self.A
+        U = sparse.csr_array(U)
+        level = self._bfs_levels(U)
+        rows, cols = U.nonzero()
+        return bool(np.all((level[rows] - level[cols]) % 2 == 1))
+
+    def distance_metrics(self, closeness=True, batch_size=None):
+        """
+        Vektorisierte Variante von compute_distance_metrics: Die Hop-Distanzen werden
+        blockweise für batch_size Quellen gleichzeitig berechnet (csgraph.shortest_path,
+        ungewichtet), sodass höchstens batch_size x n Distanzen im Speicher liegen.
+        Rückgabe im selben Format wie compute_distance_metrics.
+        """
+        batch_size = settings.SPARSE_BATCH_SIZE if batch_size is None else batch_size
+        n = self.n
+        eccentricity = np.zeros(n)
+        all_reached = True
+        efficiency_sum = 0.0
+        closeness_values = np.zeros(n) if closeness else None
+
+        for start in range(0, n, batch_size):
+            indices = np.arange(start, min(start + batch_size, n))
+            D = csgraph.shortest_path(self.A, directed=self.directed, unweighted=True, indices=indices)
+            finite = np.isfinite(D)
+            if all_reached and not finite.all():
+                all_reached = False
+            if all_reached:
+                eccentricity[indices] = D.max(axis=1)
+            if not self.directed:
+                with np.errstate(divide="ignore"):
+                    efficiency_sum += np.where(finite & (D > 0), 1.0 / D, 0.0).sum()
+                if closeness:
+                    closeness_values[indices] = self._closeness_block(D, finite)
+
+        if closeness and self.directed:
+            # Eingehende Distanzen: Breitensuche auf der transponierten Matrix
+            AT = sparse.csr_array(self.A.T)
+            for start in range(0, n, batch_size):
+                indices = np.arange(start, min(start + batch_size, n))
+                D = csgraph.shortest_path(AT, directed=True, unweighted=True, indices=indices)
+                closeness_values[indices] = self._closeness_block(D, np.isfinite(D))
+
+        metrics = {
+            "eccentricity": None,
+            "diameter": None,
+            "radius": None,
+            "center": None,
+            "periphery": None,
+            "global_efficiency": None,
+            "closeness_centrality": self._to_dict(closeness_values) if closeness else None,
+        }
+        if not self.directed:
+            denom = n * (n - 1)
+            metrics["global_efficiency"] = float(efficiency_sum / denom) if denom != 0 else 0
+        if all_reached and n > 0:
+            diameter = int(eccentricity.max())
+            radius = int(eccentricity.min())
+            metrics["eccentricity"] = {node: int(e) for node, e in zip(self.nodelist, eccentricity)}
+            metrics["diameter"] = diameter
+            metrics["radius"] = radius
+            metrics["center"] = [self.nodelist[i] for i in np.flatnonzero(eccentricity == radius)]
+            metrics["periphery"] = [self.nodelist[i] for i in np.flatnonzero(eccentricity == diameter)]
+        return metrics
+
+    def _closeness_block(self, D, finite):
+        """
+        Closeness (wf_improved) für einen Block von Distanzzeilen.
+        """
+        reachable = finite.sum(axis=1) - 1
+        totsp = np.where(finite, D, 0).sum(axis=1)
+        values = np.zeros(D.shape[0])
+        if self.n > 1:
+            valid = totsp > 0
+            values[valid] = (reachable[valid] / totsp[valid]) * (reachable[valid] / (self.n - 1))
+        return values
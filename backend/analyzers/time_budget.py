@@ -0,0 +1,151 @@
+import sys
+import time
+import multiprocessing
+from backend.analyzers import settings
+
+# Wert, der für Metriken gespeichert wird, die ihr Zeitbudget überschritten haben
+TIMEOUT = "Timeout"
+
+# Wert für Metriken, die über settings.SKIPPED_METRICS abgewählt wurden (wie nicht anwendbare Metriken)
+SKIPPED = "N/A"
+
+class AnalysisCancelled(Exception):
+    """
+    Wird ausgelöst, wenn die Analyse über das Abbruch-Event abgebrochen wurde.
+    """
+
+# Prozessweites Abbruch-Event (multiprocessing.Event), gesetzt über set_cancel_event()
+_cancel_event = None
+
+def set_cancel_event(event):
+    """
+    Registriert das Abbruch-Event für den aktuellen Prozess.
+    Wird auch als initializer des ProcessPoolExecutor verwendet.
+    """
+    global _cancel_event
+    _cancel_event = event
+
+def is_cancelled():
+    return _cancel_event is not None and _cancel_event.is_set()
+
+def check_cancelled():
+    """
+    Löst AnalysisCancelled aus, falls ein Abbruch angefordert wurde.
+    """
+    if is_cancelled():
+        raise AnalysisCancelled("Analyse wurde abgebrochen.")
+
+def is_timeout(value):
+    return isinstance(value, str) and value == TIMEOUT
+
+def is_skipped(value):
+    return isinstance(value, str) and value == SKIPPED
+
+def pick(metrics, key):
+    """
+    Liest einen Wert aus einem Metrik-Dictionary; war die Berechnung im Timeout oder
+    wurde sie übersprungen, ist auch der abgeleitete Wert TIMEOUT bzw. SKIPPED.
+    """
+    return metrics if is_timeout(metrics) or is_skipped(metrics) else metrics[key]
+
+# multiprocessing-Kontext für die Kindprozesse der Zeitbudgets, gesetzt über set_mp_context()
+_context = None
+
+def set_mp_context(context):
+    """
+    Legt den multiprocessing-Kontext für die Kindprozesse der Zeitbudgets im aktuellen
+    Prozess fest (None = Standard, siehe _mp_context()). Prozesse mit weiteren Threads
+    (z.B. die GUI mit ihren Qt-Threads) übergeben hier forkserver oder spawn.
+    """
+    global _context
+    _context = context
+
+def _mp_context():
+    if _context is not None:
+        return _context
+    # fork vermeidet das erneute Serialisieren des Graphen für den Kindprozess. Das ist nur
+    # sicher, weil der Standard in Prozessen ohne fremde Threads greift (Kommandozeile,
+    # Worker-Prozesse); das Kind ruft nur func auf und schreibt in die Pipe.
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+def _run_child(connection, func, args, kwargs):
+    try:
+        connection.send((True, func(*args, **kwargs)))
+    except BaseException as e:
+        connection.send((False, e))
+    finally:
+        connection.close()
+
+class MetricRunner:
+    """
+    Führt die Metrikberechnungen eines Graphen aus, misst die Laufzeit jeder Metrik und
+    setzt (ab settings.TIME_BUDGET_NODE_THRESHOLD Knoten) die Zeitbudgets aus
+    settings.METRIC_TIME_BUDGETS durch.
+
+    Metriken mit Zeitbudget laufen in einem eigenen Prozess, der nach Ablauf des Budgets
+    oder bei einem Abbruch beendet wird. Die Metrik erhält dann den Wert TIMEOUT, und die
+    übrigen Metriken werden normal weiterberechnet.
+
+    Metriken aus settings.SKIPPED_METRICS werden nicht berechnet und erhalten den Wert SKIPPED.
+    """
+
+    def __init__(self, G, budgets=None):
+        self.budgets = settings.METRIC_TIME_BUDGETS if budgets is None else budgets
+        self.enforce_budgets = G.number_of_nodes() >= settings.TIME_BUDGET_NODE_THRESHOLD
+        self.skipped = set(settings.SKIPPED_METRICS)
+        self.timings = {}
+        self.timed_out = []
+
+    def run(self, name, func, *args, **kwargs):
+        """
+        Berechnet eine Metrik: func(*args, **kwargs).
+
+        Rückgabe:
+          Ergebnis von func, TIMEOUT, falls das Zeitbudget überschritten wurde,
+          oder SKIPPED, falls die Metrik abgewählt ist.
+        """
+        check_cancelled()
+        if name in self.skipped:
+            return SKIPPED
+        budget = self.budgets.get(name) if self.enforce_budgets else None
+        start = time.perf_counter()
+        if budget is None:
+            value = func(*args, **kwargs)
+        else:
+            value = self._run_with_budget(name, budget, func, args, kwargs)
+        self.timings[name] = round(time.perf_counter() - start, 4)
+        if is_timeout(value):
+            self.timed_out.append(name)
+            print(f"Metrik '{name}' hat das Zeitbudget von {budget} s überschritten.")
+        return value
+
+    def _run_with_budget(self, name, budget, func, args, kwargs):
+        context = _mp_context()
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_run_child, args=(sender, func, args, kwargs), name=f"metric-{name}", daemon=True
+        )
+        process.start()
+        sender.close()
+        deadline = time.monotonic() + budget
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if receiver.poll(max(0.0, min(0.2, remaining))):
+                    success, value = receiver.recv()
+                    if not success:
+                        raise value
+                    return value
+                if is_cancelled():
+                    raise AnalysisCancelled("Analyse wurde abgebrochen.")
+                if remaining <= 0:
+                    return TIMEOUT
+                if not process.is_alive() and not receiver.poll():
+                    raise RuntimeError(f"Berechnung von '{name}' wurde unerwartet beendet.")
+        finally:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+            receiver.close()
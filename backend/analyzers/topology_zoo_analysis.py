@@ -7,8 +7,14 @@ except ModuleNotFoundError:
     import sys
     sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
     from backend.database_handler import save_analysis_results
+from backend.analyzers.distance_metrics import compute_distance_metrics
+from backend.analyzers.sparse_backend import build_csr_backend
+from backend.analyzers.time_budget import MetricRunner, AnalysisCancelled, is_skipped, is_timeout, pick
+from backend.analyzers.centrality import compute_centralities, use_approximation
+from backend.node_metrics import add_node_metrics
+from backend.search_index import node_label_text
 
-def analyze_graph(graph_file, project_name="Topology Zoo", database_path="./network_analysis.db"):
+def analyze_graph(graph_file, project_name="Topology Zoo", database_path="./network_analysis.db", G=None, save=True):
     """
     Analysiert eine einzelne GraphML-Datei und speichert die Ergebnisse in der SQLite-Datenbank.
     Zusätzlich wird ein Ergebnis-Dictionary erzeugt, das später auch für den JSON-Export genutzt werden kann.
@@ -17,13 +23,18 @@ def analyze_graph(graph_file, project_name="Topology Zoo", database_path="./netw
       graph_file (str): Pfad zur GraphML-Datei, die analysiert werden soll.
       project_name (str): Name des Projekts oder der Datenquelle (Default: "Topology Zoo").
       database_path (str): Pfad zur SQLite-Datenbank.
+      G (networkx.Graph): Bereits eingelesener Graph (optional). Wenn angegeben, wird
+                          graph_file nicht erneut eingelesen.
+      save (bool): Ergebnisse direkt in der Datenbank speichern. Bei False übernimmt
+                   der Aufrufer das Speichern (z.B. gesammelt über database_handler.save_many).
     
     Rückgabe:
       dict: Ein Dictionary mit den berechneten Netzwerkmetriken.
     """
     try:
         # Lese den Graph aus der GraphML-Datei
-        G = nx.read_graphml(graph_file)
+        if G is None:
+            G = nx.read_graphml(graph_file)
         print(f"Analysiere Datei: {graph_file}")
         
         # Knoten und Kanten
@@ -36,40 +47,66 @@ def analyze_graph(graph_file, project_name="Topology Zoo", database_path="./netw
         # Prüfen, ob der Graph gerichtet ist
         is_directed = G.is_directed()
         print("Is the graph directed?", is_directed)
+
+        # Optionales Sparse-Backend: Der Graph wird bei Bedarf einmalig in eine CSR-Matrix
+        # umgewandelt, auf der die folgenden Metriken vektorisiert berechnet werden.
+        csr = build_csr_backend(G)
+
+        # Laufzeitmessung, Zeitbudgets und Abbruchprüfung je Metrik
+        runner = MetricRunner(G)
         
         # Konnektivität (nur für ungerichtete Graphen)
         is_connected = nx.is_connected(G) if not G.is_directed() else False
         print("The graph is connected:", is_connected)
-        node_connectivity = nx.node_connectivity(G) if is_connected else "N/A"
-        edge_connectivity = nx.edge_connectivity(G) if is_connected else "N/A"
+        node_connectivity = runner.run("node_connectivity", nx.node_connectivity, G) if is_connected else "N/A"
+        edge_connectivity = runner.run("edge_connectivity", nx.edge_connectivity, G) if is_connected else "N/A"
         
+        # Bei großen Graphen werden Betweenness und Closeness per Pivot-Stichprobe approximiert
+        approximate = use_approximation(G)
+
+        # Distanzbasierte Metriken (Effizienz, Closeness, Zentrum, Durchmesser, Radius,
+        # Peripherie) werden gemeinsam in einem einzigen All-Pairs-BFS-Durchlauf berechnet.
+        # Im approximativen Modus wird der Durchlauf nur noch für zusammenhängende Graphen benötigt.
+        if is_connected or not approximate:
+            distance_metrics = runner.run("distance_metrics", compute_distance_metrics, G, closeness=not approximate, csr=csr)
+        else:
+            distance_metrics = None
+
         # Effizienz
-        global_efficiency = nx.global_efficiency(G) if is_connected else "N/A"
-        local_efficiency = nx.local_efficiency(G)
+        global_efficiency = pick(distance_metrics, "global_efficiency") if is_connected else "N/A"
+        local_efficiency = runner.run("local_efficiency", nx.local_efficiency, G)
         
         # Zentralitätsmetriken
-        graph_center = nx.center(G) if is_connected else "N/A"
-        degree_centrality = nx.degree_centrality(G)
-        betweenness_centrality = nx.betweenness_centrality(G)
-        closeness_centrality = nx.closeness_centrality(G)
+        graph_center = pick(distance_metrics, "center") if is_connected else "N/A"
+        degree_centrality = csr.degree_centrality() if csr else nx.degree_centrality(G)
+        centralities = runner.run(
+            "centralities",
+            compute_centralities,
+            G,
+            approximate=approximate,
+            exact_closeness=pick(distance_metrics, "closeness_centrality") if distance_metrics and not is_skipped(distance_metrics) else None,
+        )
+        if is_timeout(centralities) or is_skipped(centralities):
+            centralities = (centralities, centralities, {"centrality_mode": centralities, "centrality_sample_size": None, "centrality_error": None})
+        betweenness_centrality, closeness_centrality, centrality_info = centralities
         
         # PageRank
-        pagerank = nx.pagerank(G)
+        pagerank = runner.run("pagerank", csr.pagerank) if csr else runner.run("pagerank", nx.pagerank, G)
         
         # Graphstruktur
-        diameter = nx.diameter(G) if is_connected else "N/A"
-        graph_radius = nx.radius(G) if is_connected else "N/A"
-        graph_periphery = nx.periphery(G) if is_connected else "N/A"
+        diameter = pick(distance_metrics, "diameter") if is_connected else "N/A"
+        graph_radius = pick(distance_metrics, "radius") if is_connected else "N/A"
+        graph_periphery = pick(distance_metrics, "periphery") if is_connected else "N/A"
         
         # Baum- und Waldstruktur (nur für ungerichtete Graphen)
         is_tree = nx.is_tree(G) if not G.is_directed() else False
         is_forest = nx.is_forest(G) if not G.is_directed() else False
         
         # Weitere Eigenschaften
-        is_bipartite = nx.is_bipartite(G)
-        is_planar, embedding = nx.check_planarity(G)
+        is_bipartite = csr.is_bipartite() if csr else nx.is_bipartite(G)
+        is_planar = runner.run("is_planar", nx.is_planar, G)
         is_multigraph = isinstance(G, nx.MultiGraph)
-        density = nx.density(G)
+        density = csr.density() if csr else nx.density(G)
         
         # Ergebnisse zusammenstellen
         results = {
@@ -84,10 +121,9 @@ def analyze_graph(graph_file, project_name="Topology Zoo", database_path="./netw
             "global_efficiency": global_efficiency,
             "local_efficiency": local_efficiency,
             "graph_center": str(graph_center),
-            "degree_centrality": json.dumps(degree_centrality),
-            "betweenness_centrality": json.dumps(betweenness_centrality),
-            "closeness_centrality": json.dumps(closeness_centrality),
-            "pagerank": json.dumps(pagerank),
+            "centrality_mode": centrality_info["centrality_mode"],
+            "centrality_sample_size": centrality_info["centrality_sample_size"],
+            "centrality_error": centrality_info["centrality_error"],
             "diameter": diameter,
             "radius": graph_radius,
             "periphery": str(graph_periphery),
@@ -96,14 +132,30 @@ def analyze_graph(graph_file, project_name="Topology Zoo", database_path="./netw
             "is_forest": is_forest,
             "is_bipartite": is_bipartite,
             "is_planar": is_planar,
-            "is_multigraph": is_multigraph
+            "is_multigraph": is_multigraph,
+            "metric_timings": json.dumps(runner.timings),
+            "timed_out_metrics": ", ".join(runner.timed_out) or None,
+            # Für den Suchindex, nicht für "analysis_results"
+            "node_labels": node_label_text(G),
         }
+
+        # Knotenwerte für die Tabelle "node_metrics" und Kennzahlen (max/mean/p95) je Metrik
+        add_node_metrics(
+            results,
+            degree_centrality=degree_centrality,
+            betweenness_centrality=betweenness_centrality,
+            closeness_centrality=closeness_centrality,
+            pagerank=pagerank,
+        )
         
         # Speichere die Ergebnisse in der SQLite-Datenbank
-        save_analysis_results(database_path, results)
+        if save:
+            save_analysis_results(database_path, results)
         
         return results
 
+    except AnalysisCancelled:
+        raise
     except Exception as e:
         print(f"Fehler bei der Analyse von {graph_file}: {e}")
         return {"project_name": project_name, "file_name": os.path.basename(graph_file), "error": str(e)}
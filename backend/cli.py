@@ -0,0 +1,227 @@
+# Kommandozeilenwerkzeug für die Stapelanalyse ohne GUI (z.B. per cron auf einem Server).
+# Importiert weder PyQt5 noch matplotlib.
+#
+# Beispiele:
+#   python -m backend.cli daten/ --database ./network_analysis.db
+#   python -m backend.cli "zoo/**/*.graphml" --workers 8 --skip-metrics node_connectivity edge_connectivity
+#   python -m backend.cli as-rel/*.txt.bz2 --format csv --output ergebnisse.csv --export ergebnisse.parquet
+
+import os
+import sys
+import csv
+import glob
+import json
+import time
+import argparse
+import contextlib
+
+from backend import pipeline
+from backend.analyzers import settings
+from backend.database_handler import initialize_database
+from backend.utils import get_file_extension
+
+# Eingabeformate (siehe backend/file_converter.py), auch gzip/bz2-komprimiert
+INPUT_EXTENSIONS = (".graphml", ".xml", ".cch", ".txt")
+
+# Metriken, die über --metrics/--skip-metrics gewählt werden können
+SELECTABLE_METRICS = tuple(settings.METRIC_TIME_BUDGETS)
+
+# Spalten der Ausgabe je Datei
+OUTPUT_FIELDS = (
+    "file", "status", "seconds", "project_name", "number_of_nodes", "number_of_edges",
+    "density", "diameter", "timed_out_metrics", "error",
+)
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.cli",
+        description="Analysiert Netzwerkdateien ohne GUI und speichert die Ergebnisse in der Datenbank.",
+    )
+    parser.add_argument(
+        "inputs", nargs="+",
+        help="Dateien, Verzeichnisse oder Glob-Muster (z.B. \"daten/**/*.xml\")",
+    )
+    parser.add_argument("-d", "--database", default="./network_analysis.db", help="Pfad zur SQLite-Datenbank")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=os.cpu_count() or 1,
+        help="Anzahl paralleler Prozesse (1 = sequenziell, Standard: Anzahl der CPU-Kerne)",
+    )
+    parser.add_argument("-r", "--recursive", action="store_true", help="Verzeichnisse rekursiv durchsuchen")
+    metrics = parser.add_mutually_exclusive_group()
+    metrics.add_argument(
+        "--metrics", nargs="+", choices=SELECTABLE_METRICS, metavar="METRIK",
+        help=f"Nur diese teuren Metriken berechnen ({', '.join(SELECTABLE_METRICS)})",
+    )
+    metrics.add_argument(
+        "--skip-metrics", nargs="+", choices=SELECTABLE_METRICS, metavar="METRIK",
+        help="Diese teuren Metriken nicht berechnen (Wert \"N/A\")",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Ergebnis-Cache nicht verwenden")
+    parser.add_argument(
+        "-f", "--format", choices=("text", "json", "csv"), default="text",
+        help="Ausgabeformat der Ergebnisse je Datei (json = eine JSON-Zeile je Datei)",
+    )
+    parser.add_argument("-o", "--output", help="Ergebnisse in diese Datei statt auf die Standardausgabe schreiben")
+    parser.add_argument(
+        "--export", metavar="DATEI",
+        help="Nach der Analyse alle Ergebnisse der Datenbank spaltenorientiert exportieren (.parquet oder .npz)",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true",
+        help="Ausgaben der Analyse (Metrikwerte, Konvertierung) auf der Fehlerausgabe anzeigen",
+    )
+    return parser
+
+##############################################################################
+# Eingabedateien
+##############################################################################
+def _is_input_file(path):
+    return os.path.isfile(path) and get_file_extension(path) in INPUT_EXTENSIONS
+
+def collect_input_files(inputs, recursive=False):
+    """
+    Löst Dateien, Verzeichnisse und Glob-Muster zu einer sortierten Liste von Eingabedateien auf.
+    GraphML-Dateien, die aus einer danebenliegenden Eingabedatei erzeugt wurden
+    (z.B. "germany50.graphml" neben "germany50.xml"), werden übersprungen.
+    """
+    files = set()
+    for entry in inputs:
+        if os.path.isdir(entry):
+            pattern = os.path.join(entry, "**", "*") if recursive else os.path.join(entry, "*")
+            candidates = glob.glob(pattern, recursive=recursive)
+        elif glob.has_magic(entry):
+            candidates = glob.glob(entry, recursive=True)
+        else:
+            candidates = [entry]
+        files.update(os.path.normpath(path) for path in candidates if _is_input_file(path))
+
+    sources = {os.path.splitext(path)[0] for path in files if get_file_extension(path) != ".graphml"}
+    return sorted(
+        path for path in files
+        if get_file_extension(path) != ".graphml" or os.path.splitext(path)[0] not in sources
+    )
+
+##############################################################################
+# Ausgabe
+##############################################################################
+def result_record(file_path, result, seconds):
+    """
+    Zeile der Ausgabe für eine Datei (Felder aus OUTPUT_FIELDS).
+    """
+    record = {field: None for field in OUTPUT_FIELDS}
+    record.update(file=file_path, seconds=seconds)
+    if result is None:
+        record["status"] = "error"
+    elif "error" in result:
+        record.update(status="error", error=result["error"], project_name=result.get("project_name"))
+    else:
+        record["status"] = "ok"
+        for field in OUTPUT_FIELDS[3:]:
+            if field in result:
+                record[field] = result[field]
+    return record
+
+class ResultWriter:
+    """
+    Schreibt die Zeilen je Datei im gewählten Format, sobald sie vorliegen.
+    """
+
+    def __init__(self, stream, output_format):
+        self.stream = stream
+        self.output_format = output_format
+        self.csv_writer = None
+        if output_format == "csv":
+            self.csv_writer = csv.DictWriter(stream, fieldnames=OUTPUT_FIELDS)
+            self.csv_writer.writeheader()
+        elif output_format == "text":
+            stream.write(f"{'Status':<6} {'Sekunden':>9} {'Knoten':>8} {'Kanten':>9}  Datei\n")
+
+    def write(self, record):
+        if self.output_format == "json":
+            self.stream.write(json.dumps(record, default=str) + "\n")
+        elif self.output_format == "csv":
+            self.csv_writer.writerow(record)
+        else:
+            seconds = "-" if record["seconds"] is None else f"{record['seconds']:.2f}"
+            nodes = "-" if record["number_of_nodes"] is None else record["number_of_nodes"]
+            edges = "-" if record["number_of_edges"] is None else record["number_of_edges"]
+            line = f"{record['status']:<6} {seconds:>9} {nodes:>8} {edges:>9}  {record['file']}"
+            if record["error"]:
+                line += f"  ({record['error']})"
+            self.stream.write(line + "\n")
+        self.stream.flush()
+
+##############################################################################
+# Hauptprogramm
+##############################################################################
+def apply_metric_selection(metrics=None, skip_metrics=None):
+    """
+    Setzt settings.SKIPPED_METRICS aus --metrics (nur diese berechnen) bzw. --skip-metrics.
+    Die Auswahl fließt in den Schlüssel des Ergebnis-Caches ein.
+    """
+    if metrics:
+        skipped = [metric for metric in SELECTABLE_METRICS if metric not in metrics]
+    else:
+        skipped = skip_metrics or []
+    settings.SKIPPED_METRICS = tuple(sorted(set(skipped)))
+
+def _log(message):
+    print(message, file=sys.stderr, flush=True)
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    file_paths = collect_input_files(args.inputs, args.recursive)
+    if not file_paths:
+        _log("Keine Eingabedateien gefunden.")
+        return 2
+
+    apply_metric_selection(args.metrics, args.skip_metrics)
+    if args.no_cache:
+        settings.RESULT_CACHE_ENABLED = False
+
+    # Ausgaben der Analyse gehen nicht in die Ergebnisausgabe
+    analysis_output = sys.stderr if args.verbose else open(os.devnull, "w")
+    output = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    writer = ResultWriter(output, args.format)
+
+    total = len(file_paths)
+    failed = 0
+    start = time.perf_counter()
+    if settings.SKIPPED_METRICS:
+        _log(f"Übersprungene Metriken: {', '.join(settings.SKIPPED_METRICS)}")
+    _log(f"Analysiere {total} Dateien mit {max(1, args.workers)} Prozess(en), Datenbank: {args.database}")
+    try:
+        with contextlib.redirect_stdout(analysis_output):
+            initialize_database(args.database)
+            results = pipeline.iter_process_files(
+                file_paths,
+                parallel=args.workers > 1,
+                max_workers=args.workers,
+                database_path=args.database,
+                with_timings=True,
+            )
+            for done, (file_path, result, seconds) in enumerate(results, 1):
+                record = result_record(file_path, result, seconds)
+                failed += record["status"] != "ok"
+                seconds = "-" if seconds is None else f"{seconds:.2f} s"
+                _log(f"[{done}/{total}] {record['status']:<5} {seconds:>10}  {file_path}")
+                writer.write(record)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        if analysis_output is not sys.stderr:
+            analysis_output.close()
+
+    _log(f"Fertig: {total - failed} erfolgreich, {failed} fehlgeschlagen in {time.perf_counter() - start:.2f} s")
+
+    if args.export:
+        from backend.export import export_results
+        info = export_results(args.database, args.export)
+        rows = ", ".join(f"{table}: {count}" for table, count in info["rows"].items())
+        _log(f"Exportiert ({info['format']}, {rows} Zeilen): {', '.join(info['files'])}")
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,17 @@
-from .sndlib_converter import convert_xml_to_graphml
-from .rocketfuel_converter import convert_cch_to_graphml
-from .caida_converter import convert_to_graphml
+from .sndlib_converter import convert_xml_to_graphml, load_sndlib_graph, parse_sndlib, SNDlibNetwork
+from .rocketfuel_converter import convert_cch_to_graphml, load_rocketfuel_graph
+from .caida_converter import convert_to_graphml, load_caida_graph, write_caida_graphml
+from .graphml_writer import GraphMLStreamWriter
 
 __all__ = [
     "convert_xml_to_graphml",
     "convert_cch_to_graphml",
     "convert_to_graphml",
+    "load_sndlib_graph",
+    "parse_sndlib",
+    "SNDlibNetwork",
+    "load_rocketfuel_graph",
+    "load_caida_graph",
+    "write_caida_graphml",
+    "GraphMLStreamWriter",
 ]
@@ -1,35 +1,148 @@
-import os
+import bz2
+import gzip
+from collections import Counter
 import networkx as nx
+from backend.converters.graphml_writer import GraphMLStreamWriter
+from backend.utils import graphml_output_path
 
-def convert_to_graphml(input_file):
+# Größe des Lesepuffers für die (ggf. komprimierte) Eingabedatei
+READ_BUFFER_SIZE = 1 << 20
+
+def open_caida_file(input_file):
     """
-    Konvertiert eine CAIDA .txt-Datei in das GraphML-Format.
-    Liest die Datei zeilenweise ein, überspringt Kommentare,
-    extrahiert 'from_node', 'to_node' und 'relationship' und erstellt einen gerichteten Graphen.
-    Speichert den Graphen als .graphml-Datei im gleichen Verzeichnis.
+    Öffnet eine CAIDA-Datei zum zeilenweisen Lesen. gzip- und bz2-komprimierte Dateien
+    werden anhand ihrer Signatur erkannt und beim Lesen fortlaufend entpackt.
     """
-    # Erstelle einen gerichteten Graphen
-    G = nx.DiGraph()
+    with open(input_file, 'rb') as file:
+        magic = file.read(3)
+    if magic[:2] == b'\x1f\x8b':
+        return gzip.open(input_file, 'rt', encoding='utf-8', errors='replace')
+    if magic == b'BZh':
+        return bz2.open(input_file, 'rt', encoding='utf-8', errors='replace')
+    return open(input_file, 'r', encoding='utf-8', errors='replace', buffering=READ_BUFFER_SIZE)
+
+def parse_caida_line(line):
+    """
+    Zerlegt eine Datenzeile in (from_node, to_node, relationship).
+
+    Unterstützte Formate:
+      - serial-1:  <AS1>|<AS2>|<Beziehung>
+      - serial-2:  <AS1>|<AS2>|<Beziehung>|<Quelle>
+      - durch Leerzeichen getrennt: <AS1> <AS2> <Beziehung>
+
+    Löst ValueError aus, wenn die Zeile keinem Format entspricht.
+    """
+    if '|' in line:
+        fields = line.rstrip('\r\n').split('|')
+        if len(fields) not in (3, 4):
+            raise ValueError("falsche Anzahl an Feldern")
+    else:
+        fields = line.split()
+        if len(fields) != 3:
+            raise ValueError("falsche Anzahl an Feldern")
+    try:
+        return int(fields[0]), int(fields[1]), int(fields[2])
+    except ValueError:
+        raise ValueError("kein ganzzahliger Wert")
 
-    # Lese die Datei Zeile für Zeile
-    with open(input_file, 'r') as file:
+def iter_caida_relationships(input_file, errors):
+    """
+    Liest eine CAIDA-Datei zeilenweise (konstanter Speicherbedarf) und liefert
+    (from_node, to_node, relationship) je gültiger Zeile. Kommentare und Leerzeilen
+    werden übersprungen, fehlerhafte Zeilen nur im Counter errors gezählt.
+    """
+    with open_caida_file(input_file) as file:
         for line in file:
-            # Überspringe Kommentare
-            if line.startswith('#'):
+            # Überspringe Kommentare und Leerzeilen
+            if line.startswith('#') or not line.strip():
                 continue
-            # Versuche, die Zeile zu parsen (erwartet drei Integer-Werte)
             try:
-                from_node, to_node, relationship = map(int, line.split())
-            except Exception as e:
-                print(f"Fehler beim Parsen der Zeile: {line.strip()} - {e}")
-                continue
-            # Füge die Kante zum Graphen hinzu
-            G.add_edge(from_node, to_node, relationship=relationship)
+                yield parse_caida_line(line)
+            except ValueError as e:
+                errors[str(e)] += 1
+
+def _edge_key(from_node, to_node):
+    # AS-Nummern sind 32-Bit-Werte: ein einzelner int braucht weniger Speicher als ein Tupel
+    if 0 <= from_node < (1 << 32) and 0 <= to_node < (1 << 32):
+        return (from_node << 32) | to_node
+    return (from_node, to_node)
+
+def _edge_nodes(edge_key):
+    if isinstance(edge_key, tuple):
+        return edge_key
+    return edge_key >> 32, edge_key & 0xFFFFFFFF
+
+def _report_errors(input_file, errors):
+    """
+    Gibt eine Zusammenfassung der übersprungenen Zeilen aus (statt einer Meldung je Zeile).
+    """
+    if errors:
+        details = ", ".join(f"{reason}: {count}" for reason, count in errors.most_common())
+        print(f"{sum(errors.values())} Zeilen in {input_file} übersprungen ({details})")
 
+def load_caida_graph(input_file):
+    """
+    Liest eine CAIDA-Datei (.txt, auch gzip/bz2-komprimiert) ein und gibt den gerichteten
+    Graphen direkt zurück, ohne eine GraphML-Datei zu schreiben.
+    Die Knoten-IDs werden als Strings angelegt, so wie sie auch nx.read_graphml liefern würde.
+    Mehrfach vorkommende Kanten behalten (wie in convert_to_graphml) die letzte Beziehung.
+    """
+    # Erstelle einen gerichteten Graphen
+    G = nx.DiGraph()
+    errors = Counter()
+
+    for from_node, to_node, relationship in iter_caida_relationships(input_file, errors):
+        # Füge die Kante zum Graphen hinzu
+        G.add_edge(str(from_node), str(to_node), relationship=relationship)
+
+    _report_errors(input_file, errors)
+    return G
+
+def write_caida_graphml(G, output_file):
+    """
+    Schreibt einen mit load_caida_graph eingelesenen Graphen über GraphMLStreamWriter als
+    GraphML-Datei (wie convert_to_graphml, aber ohne die Eingabedatei erneut zu lesen).
+    Der Graph wird nur gelesen und kann währenddessen analysiert werden.
+    """
+    with GraphMLStreamWriter(output_file, directed=True, edge_attributes={"relationship": int}) as writer:
+        for node in G:
+            writer.add_node(node)
+        for from_node, to_node, relationship in G.edges(data="relationship"):
+            writer.add_edge(from_node, to_node, relationship=relationship)
+
+def convert_to_graphml(input_file):
+    """
+    Konvertiert eine CAIDA-Datei (.txt, auch gzip/bz2-komprimiert) in das GraphML-Format.
+    Speichert den Graphen als .graphml-Datei im gleichen Verzeichnis.
+
+    Die Eingabe wird als Datenstrom gelesen, ohne einen NetworkX-Graphen oder XML-Baum
+    aufzubauen: Neue Knoten werden sofort als <node> geschrieben, die Kanten am Ende.
+    Der Speicherbedarf ist nicht konstant, sondern O(V + E): Gemerkt werden die
+    geschriebenen Knoten und je Kante ihre Beziehung (als int-Schlüssel und kleiner int),
+    damit jede Kante wie in einem nx.DiGraph nur einmal vorkommt und mehrfach vorkommende
+    Kanten die letzte Beziehung behalten.
+
+    Rückgabe:
+      str: Pfad der erzeugten GraphML-Datei.
+    """
     # Erstelle den Namen für die GraphML-Datei
-    output_file = os.path.splitext(input_file)[0] + '.graphml'
-    # Speichere den Graphen als GraphML-Datei
-    nx.write_graphml(G, output_file)
+    output_file = graphml_output_path(input_file)
+    errors = Counter()
+    seen_nodes = set()
+    # Kante -> Beziehung; die Reihenfolge entspricht dem ersten Vorkommen der Kante
+    relationships = {}
+
+    with GraphMLStreamWriter(output_file, directed=True, edge_attributes={"relationship": int}) as writer:
+        for from_node, to_node, relationship in iter_caida_relationships(input_file, errors):
+            relationships[_edge_key(from_node, to_node)] = relationship
+            for node in (from_node, to_node):
+                if node not in seen_nodes:
+                    seen_nodes.add(node)
+                    writer.add_node(node)
+        for edge_key, relationship in relationships.items():
+            writer.add_edge(*_edge_nodes(edge_key), relationship=relationship)
+
+    _report_errors(input_file, errors)
     print(f"Die Konvertierung von {input_file} ist abgeschlossen. GraphML-Datei: {output_file}")
     return output_file
 if __name__ == "__main__":
@@ -0,0 +1,80 @@
+from xml.sax.saxutils import escape, quoteattr
+
+# GraphML-Typen wie in nx.write_graphml
+_GRAPHML_TYPES = {int: "long", float: "double", bool: "boolean", str: "string"}
+
+class GraphMLStreamWriter:
+    """
+    Schreibt eine GraphML-Datei inkrementell: Knoten und Kanten werden direkt in die
+    Ausgabedatei geschrieben, ohne dass ein NetworkX-Graph oder ein XML-Baum im Speicher
+    aufgebaut wird. Die Ausgabe kann mit nx.read_graphml gelesen werden.
+
+    Die Attribute müssen vorab deklariert werden (GraphML verlangt die <key>-Elemente
+    vor dem <graph>-Element). Knoten dürfen zwischen den Kanten stehen; beim Einlesen
+    ergibt sich die Knotenreihenfolge aus der Reihenfolge der <node>-Elemente.
+
+    Verwendung:
+      with GraphMLStreamWriter(path, directed=True, edge_attributes={"relationship": int}) as writer:
+          writer.add_node("1")
+          writer.add_edge("1", "2", relationship=-1)
+    """
+
+    def __init__(self, output_file, directed=False, node_attributes=None, edge_attributes=None, buffer_size=1 << 20):
+        self.output_file = output_file
+        self.directed = directed
+        self.buffer_size = buffer_size
+        self._keys = {}
+        key_lines = []
+        for domain, attributes in (("node", node_attributes or {}), ("edge", edge_attributes or {})):
+            for name, value_type in attributes.items():
+                key_id = f"d{len(key_lines)}"
+                self._keys[(domain, name)] = key_id
+                key_lines.append(
+                    f'  <key id="{key_id}" for="{domain}" attr.name={quoteattr(name)} '
+                    f'attr.type="{_GRAPHML_TYPES[value_type]}" />\n'
+                )
+        self._header = "".join(key_lines)
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.output_file, "w", encoding="utf-8", buffering=self.buffer_size)
+        self._file.write(
+            "<?xml version='1.0' encoding='utf-8'?>\n"
+            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns" '
+            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+            'xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns '
+            'http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n'
+        )
+        self._file.write(self._header)
+        self._file.write(f'  <graph edgedefault="{"directed" if self.directed else "undirected"}">\n')
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self._file.write("  </graph>\n</graphml>\n")
+        finally:
+            self._file.close()
+        return False
+
+    def _data(self, domain, attributes):
+        lines = []
+        for name, value in attributes.items():
+            if isinstance(value, bool):
+                value = str(value).lower()
+            lines.append(f'      <data key="{self._keys[(domain, name)]}">{escape(str(value))}</data>\n')
+        return "".join(lines)
+
+    def add_node(self, node, **attributes):
+        node_id = quoteattr(str(node))
+        if attributes:
+            self._file.write(f"    <node id={node_id}>\n{self._data('node', attributes)}    </node>\n")
+        else:
+            self._file.write(f"    <node id={node_id} />\n")
+
+    def add_edge(self, source, target, **attributes):
+        endpoints = f"source={quoteattr(str(source))} target={quoteattr(str(target))}"
+        if attributes:
+            self._file.write(f"    <edge {endpoints}>\n{self._data('edge', attributes)}    </edge>\n")
+        else:
+            self._file.write(f"    <edge {endpoints} />\n")
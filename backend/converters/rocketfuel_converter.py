@@ -2,11 +2,41 @@ import re
 import networkx as nx
 import os
 
+# Patterns for the fields of a .cch router line, compiled once at import time:
+#   uid @loc [+] [bb] (num_neigh) [&ext_conns] -> <uid>... {-euid}... =name[!] rN
+NUM_NEIGH = re.compile(r'\((\d+)\)')
+EXT_CONNS = re.compile(r'&(\d+)')
+NEIGHBOR = re.compile(r'<(\d+)>')
+EXT_NEIGHBOR = re.compile(r'{(\d+)}')
+NAME = re.compile(r'=(\S+)')
+RN = re.compile(r'r(\d+)')
+
+def parse_cch_line(line):
+    """
+    Parses one router line of a .cch file and returns (uid, node data).
+    """
+    parts = line.split()
+
+    num_neigh_match = NUM_NEIGH.search(line)
+    ext_conns_match = EXT_CONNS.search(line)
+    name_match = NAME.search(line)
+    rn_match = RN.search(line)
+
+    return parts[0], {
+        'loc': parts[1],
+        'derived_from_dns': '+' in parts,
+        'is_backbone': 'bb' in parts,
+        'num_neigh': int(num_neigh_match.group(1)) if num_neigh_match else 0,
+        'ext_conns': int(ext_conns_match.group(1)) if ext_conns_match else 0,
+        'name': name_match.group(1) if name_match else "",
+        'not_responded': '!' in line,
+        'rn': int(rn_match.group(1)) if rn_match else 0,
+        'neighbors': NEIGHBOR.findall(line),
+        'ext_neighbors': EXT_NEIGHBOR.findall(line),
+    }
+
 def parse_cch(file_path):
     nodes = {}
-    total_links = 0
-    ambiguous_nodes = 0
-    disconnected_nodes = 0
 
     with open(file_path, 'r') as file:
         for line in file:
@@ -14,48 +44,8 @@ def parse_cch(file_path):
                 # Skip lines that start with '-euid =externaladdress rn'
                 continue
 
-            parts = line.strip().split()
-            uid = parts[0]
-            loc = parts[1]
-            derived_from_dns = '+' in parts
-            is_backbone = 'bb' in parts
-
-            num_neigh_match = re.search(r'\((\d+)\)', line)
-            num_neigh = int(num_neigh_match.group(1)) if num_neigh_match else 0
-
-            ext_conns_match = re.search(r'&(\d+)', line)
-            ext_conns = int(ext_conns_match.group(1)) if ext_conns_match else 0
-
-            neighbors = re.findall(r'<(\d+)>', line)
-            ext_neighbors = re.findall(r'{(\d+)}', line)
-
-            name_match = re.search(r'=(\S+)', line)
-            name = name_match.group(1) if name_match else ""
-
-            not_responded = '!' in line
-
-            rn_match = re.search(r'r(\d+)', line)
-            rn = int(rn_match.group(1)) if rn_match else 0
-
-            nodes[uid] = {
-                'loc': loc,
-                'derived_from_dns': derived_from_dns,
-                'is_backbone': is_backbone,
-                'num_neigh': num_neigh,
-                'ext_conns': ext_conns,
-                'name': name,
-                'not_responded': not_responded,
-                'rn': rn,
-                'neighbors': neighbors,
-                'ext_neighbors': ext_neighbors,
-            }
-
-            if loc == 'T':
-                ambiguous_nodes += 1
-            if num_neigh == 0:
-                disconnected_nodes += 1
-
-            total_links += num_neigh
+            uid, data = parse_cch_line(line)
+            nodes[uid] = data
 
     return nodes
 
@@ -79,10 +69,16 @@ def build_graph_from_cch(nodes):
 def export_graph_to_graphml(G, output_path):
     nx.write_graphml(G, output_path)
 
-def convert_cch_to_graphml(file_path):
+def load_rocketfuel_graph(file_path):
+    """
+    Parses a Rocketfuel .cch file and returns the graph without writing GraphML.
+    """
     nodes = parse_cch(file_path)
-    G = build_graph_from_cch(nodes)
-    
+    return build_graph_from_cch(nodes)
+
+def convert_cch_to_graphml(file_path):
+    G = load_rocketfuel_graph(file_path)
+
     # Determine the filename for the GraphML file in the same directory
     output_path = os.path.splitext(file_path)[0] + '.graphml'
     export_graph_to_graphml(G, output_path)
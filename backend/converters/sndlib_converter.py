@@ -1,30 +1,175 @@
 import os
 import xml.etree.ElementTree as ET
+from collections import namedtuple
 import networkx as nx
 
-def convert_xml_to_graphml(xml_file):
-    # Read the XML file
-    tree = ET.parse(xml_file)
-    root = tree.getroot()
+SNDLIB_NAMESPACE = "http://sndlib.zib.de/network"
+
+# Ergebnis von parse_sndlib():
+#   graph         Netzstruktur als nx.MultiGraph (Knoten mit x/y, Links mit id/capacity/cost)
+#   demands       Liste von Dictionaries mit id, source, target und demand_value (oder None)
+#   link_modules  {link_id: {"pre_installed": (capacity, cost) oder None,
+#                            "additional": [(capacity, cost), ...],
+#                            "setup_cost": float oder None, "routing_cost": float oder None}}
+#                 (oder None)
+#   meta          Inhalt des <meta>-Abschnitts als {tag: text}
+SNDlibNetwork = namedtuple("SNDlibNetwork", ["graph", "demands", "link_modules", "meta"])
+
+class _Tags:
+    """
+    Qualifizierte Tag-Namen für den Namespace des gelesenen Dokuments. Sie werden einmal je
+    Datei gebildet, damit jedes Element per einfachem String-Vergleich erkannt wird.
+    """
+
+    def __init__(self, namespace):
+        q = lambda name: namespace + name
+        self.meta = q("meta")
+        self.node = q("node")
+        self.link = q("link")
+        self.demand = q("demand")
+        self.source = q("source")
+        self.target = q("target")
+        self.capacity = q("capacity")
+        self.cost = q("cost")
+        self.setup_cost = q("setupCost")
+        self.routing_cost = q("routingCost")
+        self.demand_value = q("demandValue")
+        self.x = q("x")
+        self.y = q("y")
+        # Direkte Kindpfade im regulären SNDlib-Aufbau
+        self.coordinates_x = f"{q('coordinates')}/{self.x}"
+        self.coordinates_y = f"{q('coordinates')}/{self.y}"
+        self.pre_installed = q("preInstalledModule")
+        self.add_modules = f"{q('additionalModules')}/{q('addModule')}"
+
+def _namespace(tag):
+    return tag[:tag.index("}") + 1] if tag.startswith("{") else ""
+
+def _local(tag):
+    return tag[tag.index("}") + 1:] if tag.startswith("{") else tag
+
+def _float(elem):
+    return float(elem.text) if elem is not None else None
+
+def _find(elem, path, tag):
+    """
+    Sucht ein Kindelement zuerst über seinen regulären Pfad, sonst unter allen Nachfahren.
+    """
+    found = elem.find(path)
+    return found if found is not None else elem.find(".//" + tag)
+
+def _module(elem, tags):
+    return float(elem.find(tags.capacity).text), float(elem.find(tags.cost).text)
+
+def _parse_link(link, tags, with_modules):
+    """
+    Liest capacity und cost eines Links und, bei with_modules=True, alle seine Module.
+
+    Rückgabe:
+      (capacity, cost, modules), modules ist None bei with_modules=False.
+    """
+    pre_installed = link.find(tags.pre_installed)
+    if with_modules:
+        modules = {
+            "pre_installed": _module(pre_installed, tags) if pre_installed is not None else None,
+            "additional": [_module(module, tags) for module in link.iterfind(tags.add_modules)],
+            "setup_cost": _float(link.find(tags.setup_cost)),
+            "routing_cost": _float(link.find(tags.routing_cost)),
+        }
+        first_modules = ([modules["pre_installed"]] if modules["pre_installed"] else []) + modules["additional"]
+        first_module = first_modules[0] if first_modules else None
+    else:
+        modules = None
+        if pre_installed is None:
+            pre_installed = link.find(tags.add_modules)
+        first_module = _module(pre_installed, tags) if pre_installed is not None else None
+    # capacity und cost des Links stammen aus seinem ersten Modul in Dokumentreihenfolge
+    if first_module is not None:
+        capacity, cost = first_module
+    else:
+        capacity = _float(link.find(".//" + tags.capacity))
+        cost = _float(link.find(".//" + tags.cost))
+    if capacity is None or cost is None:
+        raise ValueError(f"Link {link.get('id')} hat kein Modul mit capacity/cost")
+    return capacity, cost, modules
 
-    # Create an empty directed multigraph
+def parse_sndlib(xml_file, with_demands=True, with_modules=True):
+    """
+    Liest eine SNDlib-XML-Datei in einem einzigen Durchlauf mit ET.iterparse.
+
+    Knoten, Links und Demands werden verarbeitet, sobald ihr schließendes Tag gelesen ist,
+    und danach aus dem Baum entfernt. Der Speicherbedarf wächst daher nicht mit der
+    Dateigröße (abgesehen vom zurückgegebenen Graphen, den Demands und Link-Modulen).
+
+    Parameter:
+      xml_file (str): Pfad zur SNDlib-XML-Datei.
+      with_demands (bool): Demands sammeln. Bei False werden sie übersprungen (demands ist None).
+      with_modules (bool): Die Module jedes Links sammeln. Bei False wird nur das erste Modul
+                           für capacity/cost gelesen (link_modules ist None).
+
+    Rückgabe:
+      SNDlibNetwork: (graph, demands, link_modules, meta)
+    """
+    # Create an empty multigraph
     G = nx.MultiGraph()
+    demands = [] if with_demands else None
+    link_modules = {} if with_modules else None
+    meta = {}
+
+    tags = None
+    stack = []
+    for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+        if event == "start":
+            if tags is None:
+                # Namespace des Wurzelelements (in der Regel SNDLIB_NAMESPACE)
+                tags = _Tags(_namespace(elem.tag))
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        tag = elem.tag
+        if tag == tags.node:
+            x = float(_find(elem, tags.coordinates_x, tags.x).text)
+            y = float(_find(elem, tags.coordinates_y, tags.y).text)
+            G.add_node(elem.get("id"), x=x, y=y)
+        elif tag == tags.link:
+            link_id = elem.get("id")
+            capacity, cost, modules = _parse_link(elem, tags, with_modules)
+            source = _find(elem, tags.source, tags.source).text
+            target = _find(elem, tags.target, tags.target).text
+            G.add_edge(source, target, id=link_id, capacity=capacity, cost=cost)
+            if link_modules is not None:
+                link_modules[link_id] = modules
+        elif tag == tags.demand:
+            if demands is not None:
+                demands.append({
+                    "id": elem.get("id"),
+                    "source": elem.find(tags.source).text,
+                    "target": elem.find(tags.target).text,
+                    "demand_value": _float(elem.find(tags.demand_value)),
+                })
+        elif tag == tags.meta:
+            meta = {_local(child.tag): child.text for child in elem}
+        else:
+            # Kindelemente werden noch vom Elternelement gebraucht (z.B. <x> in <node>)
+            continue
 
-    # Iterate over nodes in the XML and add them to the graph
-    for node in root.findall('.//{http://sndlib.zib.de/network}node'):
-        node_id = node.get('id')
-        x = float(node.find('.//{http://sndlib.zib.de/network}x').text)
-        y = float(node.find('.//{http://sndlib.zib.de/network}y').text)
-        G.add_node(node_id, x=x, y=y)
-
-    # Iterate over links in the XML and add them to the graph
-    for link in root.findall('.//{http://sndlib.zib.de/network}link'):
-        link_id = link.get('id')
-        source = link.find('.//{http://sndlib.zib.de/network}source').text
-        target = link.find('.//{http://sndlib.zib.de/network}target').text
-        capacity = float(link.find('.//{http://sndlib.zib.de/network}capacity').text)
-        cost = float(link.find('.//{http://sndlib.zib.de/network}cost').text)
-        G.add_edge(source, target, id=link_id, capacity=capacity, cost=cost)
+        # Verarbeitetes Element aus dem teilweise aufgebauten Baum entfernen
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+
+    return SNDlibNetwork(G, demands, link_modules, meta)
+
+def load_sndlib_graph(xml_file):
+    """
+    Liest eine SNDlib-XML-Datei und gibt das Netz als Graph im Speicher zurück, ohne eine
+    GraphML-Datei zu schreiben. Demands und Link-Module werden dabei nicht ausgewertet.
+    """
+    return parse_sndlib(xml_file, with_demands=False, with_modules=False).graph
+
+def convert_xml_to_graphml(xml_file):
+    G = load_sndlib_graph(xml_file)
 
     # Determine the filename for the GraphML file
     graphml_filename = os.path.splitext(xml_file)[0] + '.graphml'
@@ -33,4 +178,3 @@ def convert_xml_to_graphml(xml_file):
     nx.write_graphml(G, graphml_filename)
 
     return graphml_filename
-
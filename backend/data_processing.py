@@ -1,6 +1,6 @@
 import os
 
-def analyze_file(file_path, data_source, database_path):
+def analyze_file(file_path, data_source, database_path, G=None, save=True):
     """
     Analysiert eine einzelne konvertierte GraphML-Datei und speichert die Ergebnisse in der Datenbank.
     
@@ -9,6 +9,9 @@ def analyze_file(file_path, data_source, database_path):
       data_source (str): Kennzeichnung der Datenquelle 
                          (z.B. "TopologyZoo", "SNDlib", "Rocketfuel", "CAIDA_AS").
       database_path (str): Pfad zur SQLite-Datenbank.
+      G (networkx.Graph): Optional bereits vom Konverter erzeugter Graph. Dann wird die
+                          GraphML-Datei nicht erneut eingelesen (file_path dient nur als Name).
+      save (bool): Ergebnisse direkt speichern (False: der Aufrufer speichert gesammelt).
     
     Die Funktion wählt basierend auf data_source den passenden Analyzer aus und gibt
     das Ergebnis-Dictionary zurück.
@@ -16,15 +19,15 @@ def analyze_file(file_path, data_source, database_path):
     
     if data_source == "TopologyZoo":
         from backend.analyzers import topology_zoo_analysis
-        return topology_zoo_analysis.analyze_graph(file_path, project_name="TopologyZoo", database_path=database_path)
+        return topology_zoo_analysis.analyze_graph(file_path, project_name="TopologyZoo", database_path=database_path, G=G, save=save)
     elif data_source == "SNDlib":
         from backend.analyzers import sndlib_analysis
-        return sndlib_analysis.analyze_graph(file_path, project_name="SNDlibrary", database_path=database_path)
+        return sndlib_analysis.analyze_graph(file_path, project_name="SNDlibrary", database_path=database_path, G=G, save=save)
     elif data_source == "Rocketfuel":
         from backend.analyzers import rocketfuel_analysis
-        return rocketfuel_analysis.analyze_graph(file_path, project_name="Rocketfuel", database_path=database_path)
+        return rocketfuel_analysis.analyze_graph(file_path, project_name="Rocketfuel", database_path=database_path, G=G, save=save)
     elif data_source == "CAIDA_AS":
         from backend.analyzers import caida_analysis
-        return caida_analysis.analyze_graph(file_path, project_name="CAIDA", database_path=database_path)
+        return caida_analysis.analyze_graph(file_path, project_name="CAIDA", database_path=database_path, G=G, save=save)
     else:
         raise ValueError(f"Unbekannte Datenquelle: {data_source}")
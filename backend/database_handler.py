@@ -1,129 +1,218 @@
+import os
+import json
 import sqlite3
+import threading
+from backend.node_metrics import SUMMARY_COLUMNS, node_metric_rows
+from backend.schema import NUMERIC_COLUMNS, migrate, to_number
+from backend.search_index import SEARCH_TABLE, has_search_index, search_rows
 
 def connect_database(database_path):
     """
-    Erstellt eine Verbindung zur SQLite-Datenbank und gibt die Verbindung zurück.
+    Erstellt eine neue Verbindung zur SQLite-Datenbank und gibt die Verbindung zurück.
+    Der Timeout erlaubt parallelen Analyseprozessen, kurz auf eine Schreibsperre zu warten.
+
+    Im WAL-Modus können Leser (GUI) und ein Schreiber gleichzeitig arbeiten; mit
+    synchronous=NORMAL wird nicht mehr bei jedem Commit, sondern nur an Checkpoints
+    auf die Platte synchronisiert.
+    """
+    connection = sqlite3.connect(database_path, timeout=30)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA foreign_keys=ON")
+    return connection
+
+# Wiederverwendete Verbindungen: je Thread und Datenbankpfad eine Verbindung
+# (sqlite3-Verbindungen dürfen nicht zwischen Threads geteilt werden)
+_local = threading.local()
+
+def get_connection(database_path):
     """
-    connection = sqlite3.connect(database_path)
+    Liefert die wiederverwendbare Verbindung des aktuellen Threads zur Datenbank und
+    öffnet sie beim ersten Aufruf. Nach einem fork() (Worker-Prozesse der parallelen
+    Analyse) wird eine neue Verbindung geöffnet, statt die des Elternprozesses zu verwenden.
+    """
+    pid = os.getpid()
+    if getattr(_local, "pid", None) != pid:
+        _local.pid = pid
+        _local.connections = {}
+    connection = _local.connections.get(database_path)
+    if connection is None:
+        connection = connect_database(database_path)
+        _local.connections[database_path] = connection
     return connection
 
+def close_connections():
+    """
+    Schließt alle wiederverwendeten Verbindungen des aktuellen Threads.
+    """
+    if getattr(_local, "pid", None) == os.getpid():
+        for connection in _local.connections.values():
+            connection.close()
+    _local.connections = {}
+
+# Spalten der Tabelle "analysis_results" (ohne id) in der Reihenfolge des INSERT.
+# Jede Spalte entspricht dem gleichnamigen Schlüssel (in Kleinbuchstaben) im Ergebnis-Dictionary.
+# Die JSON-Spalten degree_centrality, betweenness_centrality, closeness_centrality und pagerank
+# werden nicht mehr geschrieben (NULL); die Knotenwerte stehen in der Tabelle "node_metrics".
+RESULT_COLUMNS = [
+    "Project_name", "File_name", "is_directed", "number_of_nodes", "number_of_edges", "is_connected",
+    "is_strongly_connected", "is_weakly_connected", "node_connectivity", "edge_connectivity",
+    "global_efficiency", "local_efficiency", "graph_center", "diameter", "radius",
+    "periphery", "density", "is_tree", "is_forest", "is_bipartite", "is_planar", "is_multigraph",
+    "centrality_mode", "centrality_sample_size", "centrality_error",
+    "metric_timings", "timed_out_metrics",
+] + SUMMARY_COLUMNS
+
 def initialize_database(database_path):
     """
-    Initialisiert die Datenbankstruktur und erstellt erforderliche Tabellen.
-    """
-    connection = connect_database(database_path)
-    cursor = connection.cursor()
-
-    # Tabelle "analysis_results" erstellen oder aktualisieren
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS analysis_results (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            Project_name TEXT,
-            File_name TEXT,
-            is_directed BOOLEAN,
-            number_of_nodes INTEGER,
-            number_of_edges INTEGER,
-            is_connected BOOLEAN,
-            is_strongly_connected BOOLEAN,
-            is_weakly_connected BOOLEAN,
-            node_connectivity TEXT,
-            edge_connectivity TEXT,
-            global_efficiency TEXT,
-            local_efficiency TEXT,
-            graph_center TEXT,
-            degree_centrality TEXT,
-            betweenness_centrality TEXT,
-            closeness_centrality TEXT,
-            pagerank TEXT,
-            diameter TEXT,
-            radius TEXT,
-            periphery TEXT,
-            density REAL,
-            is_tree BOOLEAN,
-            is_forest BOOLEAN,
-            is_bipartite BOOLEAN,
-            is_planar BOOLEAN,
-            is_multigraph BOOLEAN
-        )
-    """)
-
-    # Änderungen speichern und Verbindung schließen
-    connection.commit()
-    connection.close()
+    Initialisiert die Datenbankstruktur bzw. aktualisiert bestehende Datenbanken
+    über die versionierten Migrationen in backend/schema.py.
+    """
+    migrate(get_connection(database_path))
+
+def _result_row(results):
+    # Zahlenspalten erhalten NULL statt "N/A"/"Timeout"
+    return tuple(
+        to_number(results.get(column.lower())) if column in NUMERIC_COLUMNS else results.get(column.lower())
+        for column in RESULT_COLUMNS
+    )
 
 def save_analysis_results(database_path, results):
     """
     Speichert die Analyseergebnisse in der SQLite-Datenbank.
     """
-    connection = connect_database(database_path)
-    cursor = connection.cursor()
-
-    # Daten einfügen
-    cursor.execute("""
-        INSERT INTO analysis_results (
-            Project_name, File_name, is_directed, number_of_nodes, number_of_edges, is_connected,
-            is_strongly_connected, is_weakly_connected, node_connectivity, edge_connectivity,
-            global_efficiency, local_efficiency, graph_center, degree_centrality,
-            betweenness_centrality, closeness_centrality, pagerank, diameter, radius,
-            periphery, density, is_tree, is_forest, is_bipartite, is_planar, is_multigraph
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        results.get("project_name"),
-        results.get("file_name"),
-        results.get("is_directed"),
-        results.get("number_of_nodes"),
-        results.get("number_of_edges"),
-        results.get("is_connected"),
-        results.get("is_strongly_connected"),
-        results.get("is_weakly_connected"),
-        results.get("node_connectivity"),
-        results.get("edge_connectivity"),
-        results.get("global_efficiency"),
-        results.get("local_efficiency"),
-        results.get("graph_center"),
-        results.get("degree_centrality"),
-        results.get("betweenness_centrality"),
-        results.get("closeness_centrality"),
-        results.get("pagerank"),
-        results.get("diameter"),
-        results.get("radius"),
-        results.get("periphery"),
-        results.get("density"),
-        results.get("is_tree"),
-        results.get("is_forest"),
-        results.get("is_bipartite"),
-        results.get("is_planar"),
-        results.get("is_multigraph")
-    ))
-
-    # Änderungen speichern und Verbindung schließen
-    connection.commit()
-    connection.close()
+    save_many(database_path, [results])
 
-def query_results(database_path, query):
+def save_many(database_path, results_list, cache_entries=()):
     """
-    Führt eine benutzerdefinierte Abfrage in der Datenbank aus und gibt die Ergebnisse zurück.
+    Speichert mehrere Analyseergebnisse (und optional Einträge für den Ergebnis-Cache)
+    in einer einzigen Transaktion. Die Knotenwerte jedes Ergebnisses werden mit
+    executemany in die Tabelle "node_metrics" geschrieben, Projekt, Dateiname und
+    Knotenbezeichnungen in den Suchindex.
+
+    Einträge für den Ergebnis-Cache enthalten keine Knotenwerte, sondern unter "graph_id"
+    die id der Zeile in "analysis_results", deren Knotenwerte sie verwenden: die Zeile, die
+    für ihr Ergebnis (row) in diesem Aufruf eingefügt wurde. Der Dateiname ist dafür nicht
+    eindeutig (gleichnamige Dateien aus verschiedenen Verzeichnissen).
+
+    Parameter:
+      database_path (str): Pfad zur SQLite-Datenbank.
+      results_list (list): Ergebnis-Dictionaries für die Tabelle "analysis_results".
+      cache_entries (list): Tupel (cache_key, content_hash, analyzer_version, data_source, results, row)
+                            für die Tabelle "result_cache"; row ist das Ergebnis-Dictionary aus
+                            results_list, zu dem der Eintrag gehört (siehe result_cache.cache_entry).
     """
-    connection = connect_database(database_path)
-    cursor = connection.cursor()
+    connection = get_connection(database_path)
+    placeholders = ", ".join("?" for _ in RESULT_COLUMNS)
 
-    cursor.execute(query)
-    results = cursor.fetchall()
+    # Daten einfügen; bei einem Fehler wird die gesamte Transaktion zurückgerollt
+    with connection:
+        node_rows = []
+        inserted = []
+        # id der eingefügten Zeile je Ergebnis-Dictionary (über die Objektidentität)
+        graph_ids = {}
+        for results in results_list:
+            cursor = connection.execute(
+                f"INSERT INTO analysis_results ({', '.join(RESULT_COLUMNS)}) VALUES ({placeholders})",
+                _result_row(results),
+            )
+            node_rows.extend(node_metric_rows(cursor.lastrowid, results))
+            inserted.append((cursor.lastrowid, results))
+            graph_ids[id(results)] = cursor.lastrowid
+        if node_rows:
+            connection.executemany("INSERT INTO node_metrics VALUES (?, ?, ?, ?)", node_rows)
+        if inserted and has_search_index(connection):
+            connection.executemany(
+                f"INSERT INTO {SEARCH_TABLE} (rowid, project, file, nodes) VALUES (?, ?, ?, ?)",
+                search_rows(inserted),
+            )
+        if cache_entries:
+            connection.executemany(
+                "INSERT OR REPLACE INTO result_cache (cache_key, content_hash, analyzer_version, data_source, results) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (cache_key, content_hash, analyzer_version, data_source,
+                     json.dumps({**results, "graph_id": graph_ids.get(id(row))}))
+                    for cache_key, content_hash, analyzer_version, data_source, results, row in cache_entries
+                ],
+            )
 
-    connection.close()
-    return results
+def has_analysis_results(database_path, project_name, file_name):
+    """
+    Prüft, ob für Projekt und Datei bereits ein Eintrag in "analysis_results" existiert.
+    """
+    cursor = get_connection(database_path).execute(
+        "SELECT 1 FROM analysis_results WHERE Project_name = ? AND File_name = ? LIMIT 1",
+        (project_name, file_name),
+    )
+    return cursor.fetchone() is not None
 
-def clear_analysis_results(database_path):
+def load_cached_results(database_path, cache_key):
     """
-    Löscht alle Einträge in der Tabelle "analysis_results".
+    Liest das zwischengespeicherte Ergebnis-Dictionary zu einem Cache-Schlüssel.
+    Rückgabe: (data_source, results) oder None, falls kein Eintrag existiert.
+    """
+    cursor = get_connection(database_path).execute(
+        "SELECT data_source, results FROM result_cache WHERE cache_key = ?", (cache_key,)
+    )
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return row[0], json.loads(row[1])
+
+def has_graph(database_path, graph_id):
+    """
+    Prüft, ob die Zeile graph_id in "analysis_results" (noch) existiert.
+    """
+    cursor = get_connection(database_path).execute("SELECT 1 FROM analysis_results WHERE id = ?", (graph_id,))
+    return cursor.fetchone() is not None
+
+def load_graph_node_metrics(database_path, graph_id):
+    """
+    Liest die Knotenwerte einer Zeile in "analysis_results" als {metric: {node_id: value}}.
+    """
+    node_metrics = {}
+    for node_id, metric, value in get_connection(database_path).execute(
+        "SELECT node_id, metric, value FROM node_metrics WHERE graph_id = ?", (graph_id,)
+    ):
+        node_metrics.setdefault(metric, {})[node_id] = value
+    return node_metrics
+
+def load_node_metrics(database_path, file_name):
     """
-    connection = connect_database(database_path)
-    cursor = connection.cursor()
+    Liest die Knotenwerte der neuesten Analyse einer Datei aus der Tabelle "node_metrics".
+    Rückgabe: dict {node_id: {metric: value}} (leer, falls die Datei nicht analysiert wurde).
+    """
+    connection = get_connection(database_path)
+    row = connection.execute("SELECT MAX(id) FROM analysis_results WHERE File_name = ?", (file_name,)).fetchone()
+    node_metrics = {}
+    if row is None or row[0] is None:
+        return node_metrics
+    for node_id, metric, value in connection.execute(
+        "SELECT node_id, metric, value FROM node_metrics WHERE graph_id = ?", (row[0],)
+    ):
+        node_metrics.setdefault(node_id, {})[metric] = value
+    return node_metrics
 
-    cursor.execute("DELETE FROM analysis_results")
+def query_results(database_path, query):
+    """
+    Führt eine benutzerdefinierte Abfrage in der Datenbank aus und gibt die Ergebnisse zurück.
+    """
+    cursor = get_connection(database_path).execute(query)
+    return cursor.fetchall()
 
-    connection.commit()
-    connection.close()
+def clear_analysis_results(database_path):
+    """
+    Löscht alle Einträge in der Tabelle "analysis_results".
+    """
+    connection = get_connection(database_path)
+    with connection:
+        connection.execute("DELETE FROM node_metrics")
+        # Zuerst leeren, damit die Trigger beim Löschen keine Kennzahlen mehr nachführen
+        connection.execute("DELETE FROM dataset_aggregates")
+        if has_search_index(connection):
+            connection.execute(f"DELETE FROM {SEARCH_TABLE}")
+        connection.execute("DELETE FROM analysis_results")
 
 #  Initialisierung der Datenbank
 if __name__ == "__main__":
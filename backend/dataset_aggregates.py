@@ -0,0 +1,173 @@
+# Materialisierte Kennzahlen je Datensatz (Project_name) in der Tabelle "dataset_aggregates".
+#
+# Je Datensatz und Metrik wird eine Zeile mit Anzahl, Summe, Mittelwert, M2 (Summe der
+# quadrierten Abweichungen nach Welford), Minimum und Maximum geführt. Trigger auf
+# "analysis_results" aktualisieren diese Werte bei jedem Einfügen, Löschen und Ändern
+# inkrementell, so dass die Datensatzanalyse nur O(Datensätze x Metriken) Zeilen liest,
+# statt alle Analyseergebnisse neu zu aggregieren.
+#
+# Die Trigger gehören zur Tabelle "analysis_results": Eine Migration, die diese Tabelle
+# neu anlegt, muss anschließend create_trigger_statements() erneut ausführen.
+
+# Pseudometrik mit dem Wert 1 je Zeile; ihre Anzahl entspricht COUNT(*) eines Datensatzes
+GRAPH_COUNT = "graph_count"
+
+# Aggregierte Spalten von "analysis_results" (Wahrheitswerte als 0/1)
+AGGREGATED_METRICS = (
+    GRAPH_COUNT,
+    "number_of_nodes", "number_of_edges", "density",
+    "is_connected", "is_tree", "is_forest", "is_bipartite", "is_planar", "is_multigraph",
+    "node_connectivity", "edge_connectivity", "diameter", "radius",
+    "global_efficiency", "local_efficiency",
+    "degree_centrality_mean", "betweenness_centrality_mean",
+    "closeness_centrality_mean", "pagerank_mean",
+)
+
+# Abfragbare Kennzahlen und ihr SQL-Ausdruck über eine Zeile von "dataset_aggregates"
+STATISTICS = {
+    "count": "value_count",
+    "sum": "value_sum",
+    "mean": "value_mean",
+    "min": "value_min",
+    "max": "value_max",
+    # Stichprobenvarianz
+    "variance": "CASE WHEN value_count > 1 THEN value_m2 / (value_count - 1) END",
+}
+
+CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS dataset_aggregates (
+        project_name TEXT NOT NULL,
+        metric TEXT NOT NULL,
+        value_count INTEGER NOT NULL,
+        value_sum REAL,
+        value_mean REAL,
+        value_m2 REAL,
+        value_min REAL,
+        value_max REAL,
+        PRIMARY KEY (project_name, metric)
+    )
+"""
+
+def _value(metric, row):
+    return "1" if metric == GRAPH_COUNT else f"{row}.{metric}"
+
+def _add_statement(metric, row="NEW"):
+    """
+    Welford-Schritt für einen neuen Wert x: n' = n + 1, mean' = mean + (x - mean) / n',
+    M2' = M2 + (x - mean) * (x - mean'). Im UPDATE beziehen sich alle Ausdrücke auf die
+    alten Werte der Zeile.
+    """
+    x = _value(metric, row)
+    return f"""
+        INSERT INTO dataset_aggregates
+            (project_name, metric, value_count, value_sum, value_mean, value_m2, value_min, value_max)
+        SELECT IFNULL({row}.Project_name, ''), '{metric}', 1, {x}, {x}, 0.0, {x}, {x}
+        WHERE {x} IS NOT NULL
+        ON CONFLICT (project_name, metric) DO UPDATE SET
+            value_count = value_count + 1,
+            value_sum = value_sum + excluded.value_sum,
+            value_mean = value_mean + (excluded.value_sum - value_mean) / (value_count + 1.0),
+            value_m2 = value_m2 + (excluded.value_sum - value_mean)
+                * (excluded.value_sum - value_mean - (excluded.value_sum - value_mean) / (value_count + 1.0)),
+            value_min = MIN(value_min, excluded.value_min),
+            value_max = MAX(value_max, excluded.value_max);
+    """
+
+def _remove_statement(metric, row="OLD"):
+    """
+    Umgekehrter Welford-Schritt für einen entfernten Wert x: n' = n - 1,
+    mean' = (n * mean - x) / n', M2' = M2 - (x - mean) * (x - mean').
+    Minimum und Maximum werden nur neu bestimmt (über den Index auf Project_name),
+    wenn der entfernte Wert das Minimum bzw. Maximum war und kein anderer Graph des
+    Datensatzes denselben Wert hat (häufig bei Wahrheitswerten).
+    """
+    x = _value(metric, row)
+    stored = _value(metric, "analysis_results")
+    remaining = f"FROM analysis_results WHERE Project_name IS {row}.Project_name"
+    return f"""
+        UPDATE dataset_aggregates SET
+            value_count = value_count - 1,
+            value_sum = value_sum - {x},
+            value_mean = CASE WHEN value_count > 1
+                THEN (value_mean * value_count - {x}) / (value_count - 1.0) END,
+            value_m2 = CASE WHEN value_count > 1
+                THEN MAX(value_m2 - ({x} - value_mean)
+                    * ({x} - (value_mean * value_count - {x}) / (value_count - 1.0)), 0.0)
+                ELSE 0.0 END,
+            value_min = CASE WHEN {x} <= value_min AND NOT EXISTS (SELECT 1 {remaining} AND {stored} = {x})
+                THEN (SELECT MIN({stored}) {remaining}) ELSE value_min END,
+            value_max = CASE WHEN {x} >= value_max AND NOT EXISTS (SELECT 1 {remaining} AND {stored} = {x})
+                THEN (SELECT MAX({stored}) {remaining}) ELSE value_max END
+        WHERE project_name = IFNULL({row}.Project_name, '') AND metric = '{metric}' AND {x} IS NOT NULL;
+    """
+
+def create_trigger_statements():
+    """
+    SQL-Anweisungen für die Trigger, die "dataset_aggregates" aktuell halten.
+    """
+    add = "".join(_add_statement(metric) for metric in AGGREGATED_METRICS)
+    remove = "".join(_remove_statement(metric) for metric in AGGREGATED_METRICS)
+    cleanup = "DELETE FROM dataset_aggregates WHERE project_name = IFNULL(OLD.Project_name, '') AND value_count <= 0;"
+    return [
+        "DROP TRIGGER IF EXISTS dataset_aggregates_insert",
+        "DROP TRIGGER IF EXISTS dataset_aggregates_delete",
+        "DROP TRIGGER IF EXISTS dataset_aggregates_update",
+        f"CREATE TRIGGER dataset_aggregates_insert AFTER INSERT ON analysis_results BEGIN {add} END",
+        f"CREATE TRIGGER dataset_aggregates_delete AFTER DELETE ON analysis_results BEGIN {remove} {cleanup} END",
+        f"CREATE TRIGGER dataset_aggregates_update AFTER UPDATE ON analysis_results BEGIN {remove} {cleanup} {add} END",
+    ]
+
+def rebuild_statements():
+    """
+    SQL-Anweisungen, die "dataset_aggregates" vollständig aus "analysis_results" neu berechnen
+    (M2 in zwei Durchläufen über den Mittelwert je Datensatz).
+    """
+    statements = ["DELETE FROM dataset_aggregates"]
+    for metric in AGGREGATED_METRICS:
+        x = _value(metric, "r")
+        statements.append(f"""
+            INSERT INTO dataset_aggregates
+                (project_name, metric, value_count, value_sum, value_mean, value_m2, value_min, value_max)
+            SELECT IFNULL(r.Project_name, ''), '{metric}', COUNT({x}), SUM({x}), m.mean,
+                   SUM(({x} - m.mean) * ({x} - m.mean)), MIN({x}), MAX({x})
+            FROM analysis_results r
+            JOIN (
+                SELECT Project_name, AVG({_value(metric, "analysis_results")}) AS mean
+                FROM analysis_results GROUP BY Project_name
+            ) m ON m.Project_name IS r.Project_name
+            WHERE {x} IS NOT NULL
+            GROUP BY r.Project_name
+        """)
+    return statements
+
+def aggregate_query(columns, by_project=True):
+    """
+    Baut eine Abfrage über "dataset_aggregates", die je Datensatz eine Zeile liefert
+    (bzw. eine Zeile für den Datensatz im Parameter "?", falls by_project=False).
+
+    Parameter:
+      columns (list): Tupel (metric, statistic, alias), z.B. ("density", "mean", "density_avg");
+                      statistic ist ein Schlüssel von STATISTICS.
+
+    Beispiel:
+      aggregate_query([(GRAPH_COUNT, "count", "total_graphs")], by_project=False)
+    """
+    select_list = ",\n          ".join(
+        f"MAX(CASE WHEN metric = '{metric}' THEN {STATISTICS[statistic]} END) AS {alias}"
+        for metric, statistic, alias in columns
+    )
+    if by_project:
+        return f"""
+        SELECT
+          project_name,
+          {select_list}
+        FROM dataset_aggregates
+        GROUP BY project_name
+        ORDER BY project_name
+        """
+    return f"""
+        SELECT
+          {select_list}
+        FROM dataset_aggregates
+        WHERE project_name = ?
+        """
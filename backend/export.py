@@ -0,0 +1,321 @@
+# Spaltenorientierter Export von "analysis_results" und "node_metrics" für die Auswertung
+# großer Datenbestände (z.B. in Notebooks).
+#
+# Die Tabellen werden in Blöcken zu EXPORT_CHUNK_ROWS Zeilen gelesen und blockweise
+# geschrieben, so dass der Speicherbedarf unabhängig von der Anzahl der Graphen bleibt:
+#   - Parquet (mit pyarrow): eine Datei je Tabelle, eine Row Group je Block.
+#   - .npz (ohne pyarrow): ein NumPy-Archiv mit einem Array je Spalte. Die Blöcke werden
+#     zunächst in temporäre Dateien geschrieben und dann ohne erneutes Einlesen in das Archiv
+#     übernommen. Textspalten werden wie in Arrow als UTF-8-Daten mit Offsets gespeichert,
+#     Textspalten mit wenigen verschiedenen Werten als Codes mit Kategorien.
+#
+# Die JSON-Spalten mit Werten je Knoten werden nicht übernommen; dieselben Werte stehen
+# in der Tabelle "node_metrics" (eine Zeile je Graph, Knoten und Metrik).
+
+import os
+import shutil
+import tempfile
+import zipfile
+
+import numpy as np
+
+from backend.database_handler import connect_database
+from backend.node_metrics import NODE_METRICS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:  # pyarrow ist optional, ohne es wird als .npz exportiert
+    PYARROW_AVAILABLE = False
+
+EXPORT_FORMATS = ("parquet", "npz")
+
+EXPORT_CHUNK_ROWS = 50000
+
+EXPORTED_TABLES = ("analysis_results", "node_metrics")
+
+# Textspalten mit wenigen verschiedenen Werten (Kategorien)
+DICTIONARY_COLUMNS = {"Project_name", "centrality_mode", "metric"}
+
+def default_format():
+    return "parquet" if PYARROW_AVAILABLE else "npz"
+
+def export_paths(target, export_format):
+    """
+    Zieldateien je Tabelle: Bei .npz enthält eine Datei beide Tabellen, bei Parquet
+    werden die Knotenmetriken neben die Zieldatei geschrieben ("<name>_node_metrics.parquet").
+    """
+    stem, _ = os.path.splitext(target)
+    if export_format == "npz":
+        path = f"{stem}.npz"
+        return {table: path for table in EXPORTED_TABLES}
+    return {
+        "analysis_results": f"{stem}.parquet",
+        "node_metrics": f"{stem}_node_metrics.parquet",
+    }
+
+def _export_columns(connection, table):
+    """
+    Exportierte Spalten einer Tabelle als Liste von (Spalte, Art) mit der Art
+    "int", "real", "text" oder "dictionary" (nach dem deklarierten Spaltentyp).
+    """
+    columns = []
+    for _, column, declared_type, *_ in connection.execute(f"PRAGMA table_info({table})"):
+        if table == "analysis_results" and column in NODE_METRICS:
+            continue
+        declared_type = (declared_type or "").upper()
+        if "INT" in declared_type:
+            kind = "int"
+        elif "REAL" in declared_type:
+            kind = "real"
+        elif column in DICTIONARY_COLUMNS:
+            kind = "dictionary"
+        else:
+            kind = "text"
+        columns.append((column, kind))
+    return columns
+
+def _read_chunks(connection, table, columns, chunk_rows):
+    """
+    Liest die Tabelle blockweise in rowid-Reihenfolge (Keyset statt OFFSET) und liefert
+    je Block eine Liste der Spaltenwerte (ein Tupel je Spalte).
+    """
+    select_list = ", ".join(["rowid"] + [column for column, _ in columns])
+    last_rowid = None
+    while True:
+        if last_rowid is None:
+            rows = connection.execute(
+                f"SELECT {select_list} FROM {table} ORDER BY rowid LIMIT ?", (chunk_rows,)
+            ).fetchall()
+        else:
+            rows = connection.execute(
+                f"SELECT {select_list} FROM {table} WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                (last_rowid, chunk_rows),
+            ).fetchall()
+        if not rows:
+            return
+        last_rowid = rows[-1][0]
+        yield list(zip(*rows))[1:]
+        if len(rows) < chunk_rows:
+            return
+
+##############################################################################
+# .npz (NumPy)
+##############################################################################
+class _NpzColumn:
+    """
+    Schreibt die Blöcke einer Spalte in temporäre Dateien und fügt sie am Ende als
+    .npy-Einträge in das Archiv ein:
+      "<table>.<column>"               int64 bzw. float64 (NULL als NaN)
+      "<table>.<column>.offsets/.data" Text: UTF-8-Bytes und n + 1 Offsets
+      "<table>.<column>.codes/.categories" Kategorien: int32-Codes (NULL als -1)
+      "<table>.<column>.valid"         nur bei NULL-Werten in int- und Textspalten
+    """
+
+    def __init__(self, directory, name, kind):
+        self.name = name
+        self.kind = kind
+        self.length = 0
+        self.null_count = 0
+        self.categories = {}
+        self._paths = {}
+        self._files = {}
+        parts = {
+            "int": ["", ".valid"],
+            "real": [""],
+            "text": [".offsets", ".data", ".valid"],
+            "dictionary": [".codes"],
+        }[kind]
+        for part in parts:
+            path = os.path.join(directory, f"{name}{part}.bin")
+            self._paths[part] = path
+            self._files[part] = open(path, "wb")
+        if kind == "text":
+            self._text_offset = 0
+            self._files[".offsets"].write(np.zeros(1, dtype=np.int64).tobytes())
+
+    def write(self, values):
+        self.length += len(values)
+        if self.kind == "real":
+            self._files[""].write(np.array(values, dtype=np.float64).tobytes())
+            return
+        if self.kind == "dictionary":
+            codes = [-1 if value is None else self.categories.setdefault(str(value), len(self.categories))
+                     for value in values]
+            self._files[".codes"].write(np.array(codes, dtype=np.int32).tobytes())
+            return
+
+        valid = np.array([value is not None for value in values], dtype=np.bool_)
+        self.null_count += len(values) - int(valid.sum())
+        self._files[".valid"].write(valid.tobytes())
+        if self.kind == "int":
+            self._files[""].write(np.array([0 if value is None else value for value in values], dtype=np.int64).tobytes())
+            return
+
+        encoded = [b"" if value is None else str(value).encode("utf-8") for value in values]
+        offsets = self._text_offset + np.cumsum([len(data) for data in encoded], dtype=np.int64)
+        if len(offsets):
+            self._text_offset = int(offsets[-1])
+        self._files[".offsets"].write(offsets.tobytes())
+        self._files[".data"].write(b"".join(encoded))
+
+    def add_to(self, archive, table):
+        for file in self._files.values():
+            file.close()
+        dtypes = {"": np.int64 if self.kind == "int" else np.float64, ".valid": np.bool_,
+                  ".offsets": np.int64, ".data": np.uint8, ".codes": np.int32}
+        for part, path in self._paths.items():
+            if part == ".valid" and self.null_count == 0:
+                continue
+            dtype = np.dtype(dtypes[part])
+            _add_array_file(archive, f"{table}.{self.name}{part}", dtype, os.path.getsize(path) // dtype.itemsize, path)
+        if self.kind == "dictionary":
+            categories = np.array(list(self.categories), dtype=str) if self.categories else np.array([], dtype="<U1")
+            with archive.open(f"{table}.{self.name}.categories.npy", "w", force_zip64=True) as member:
+                np.lib.format.write_array(member, categories, allow_pickle=False)
+
+def _add_array_file(archive, name, dtype, length, path):
+    """
+    Fügt eine Datei mit Rohdaten als eindimensionales .npy-Array in das Archiv ein,
+    ohne sie vollständig in den Speicher zu laden.
+    """
+    header = {"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": (length,)}
+    with archive.open(f"{name}.npy", "w", force_zip64=True) as member:
+        np.lib.format.write_array_header_1_0(member, header)
+        with open(path, "rb") as source:
+            shutil.copyfileobj(source, member, 1 << 20)
+
+def _export_npz(connection, path, chunk_rows, compress):
+    row_counts = {}
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(path))) as directory, \
+            zipfile.ZipFile(path, "w", compression=compression, allowZip64=True) as archive:
+        for table in EXPORTED_TABLES:
+            columns = _export_columns(connection, table)
+            table_directory = os.path.join(directory, table)
+            os.mkdir(table_directory)
+            writers = [_NpzColumn(table_directory, column, kind) for column, kind in columns]
+            for chunk in _read_chunks(connection, table, columns, chunk_rows):
+                for writer, values in zip(writers, chunk):
+                    writer.write(values)
+            for writer in writers:
+                writer.add_to(archive, table)
+            row_counts[table] = writers[0].length if writers else 0
+    return row_counts
+
+def load_npz_export(path):
+    """
+    Liest einen .npz-Export wieder ein.
+
+    Rückgabe:
+      dict: {Tabelle: {Spalte: numpy.ndarray}}. Textspalten und Kategorien werden als
+            Objekt-Arrays mit str bzw. None geliefert, int-Spalten mit NULL-Werten als
+            numpy.ma.MaskedArray, real-Spalten enthalten NaN für NULL.
+
+    Beispiel:
+      tables = load_npz_export("results.npz")
+      tables["analysis_results"]["density"].mean()
+    """
+    tables = {}
+    with np.load(path, allow_pickle=False) as archive:
+        names = set(archive.files)
+        for name in sorted(names):
+            table, column, *part = name.split(".")
+            part = part[0] if part else ""
+            if part not in ("", "offsets", "codes"):
+                continue
+            if part == "offsets":
+                offsets = archive[name]
+                data = archive[f"{table}.{column}.data"].tobytes()
+                values = np.array([data[start:end].decode("utf-8") for start, end in zip(offsets[:-1], offsets[1:])],
+                                  dtype=object)
+            elif part == "codes":
+                codes = archive[name]
+                categories = np.append(archive[f"{table}.{column}.categories"].astype(object), None)
+                values = categories[codes]
+            else:
+                values = archive[name]
+            valid_name = f"{table}.{column}.valid"
+            if valid_name in names:
+                valid = archive[valid_name]
+                if values.dtype == object:
+                    values[~valid] = None
+                else:
+                    values = np.ma.MaskedArray(values, mask=~valid)
+            tables.setdefault(table, {})[column] = values
+    return tables
+
+##############################################################################
+# Parquet (pyarrow)
+##############################################################################
+def _arrow_type(kind):
+    return {
+        "int": pa.int64(),
+        "real": pa.float64(),
+        "text": pa.string(),
+        "dictionary": pa.dictionary(pa.int32(), pa.string()),
+    }[kind]
+
+def _arrow_array(values, kind):
+    if kind in ("text", "dictionary"):
+        values = [None if value is None else str(value) for value in values]
+    if kind == "dictionary":
+        return pa.array(values, type=pa.string()).dictionary_encode()
+    return pa.array(values, type=_arrow_type(kind))
+
+def _export_parquet(connection, paths, chunk_rows):
+    row_counts = {}
+    for table in EXPORTED_TABLES:
+        columns = _export_columns(connection, table)
+        schema = pa.schema([(column, _arrow_type(kind)) for column, kind in columns])
+        row_counts[table] = 0
+        with pq.ParquetWriter(paths[table], schema, compression="zstd") as writer:
+            for chunk in _read_chunks(connection, table, columns, chunk_rows):
+                arrays = [_arrow_array(values, kind) for values, (_, kind) in zip(chunk, columns)]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                row_counts[table] += len(chunk[0])
+    return row_counts
+
+##############################################################################
+# Export
+##############################################################################
+def export_results(database_path, target, export_format=None, chunk_rows=EXPORT_CHUNK_ROWS, compress=False):
+    """
+    Exportiert "analysis_results" und "node_metrics" spaltenorientiert.
+
+    Parameter:
+      database_path (str): Pfad zur SQLite-Datenbank.
+      target (str): Zieldatei; die Endung wird an das Format angepasst (siehe export_paths()).
+      export_format (str): "parquet" oder "npz" (Standard: nach der Endung von target,
+                           sonst Parquet, falls pyarrow installiert ist).
+                           Ohne pyarrow wird immer als .npz exportiert.
+      chunk_rows (int): Zeilen je gelesenem Block.
+      compress (bool): .npz-Einträge komprimieren (kleiner, aber langsamer).
+
+    Rückgabe:
+      dict: {"format": ..., "files": [...], "rows": {Tabelle: Anzahl Zeilen}}
+    """
+    if export_format is None:
+        extension = os.path.splitext(target)[1].lstrip(".").lower()
+        export_format = extension if extension in EXPORT_FORMATS else default_format()
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unbekanntes Exportformat: {export_format}")
+    if export_format == "parquet" and not PYARROW_AVAILABLE:
+        print("pyarrow nicht verfügbar, exportiere als .npz.")
+        export_format = "npz"
+
+    paths = export_paths(target, export_format)
+    connection = connect_database(database_path)
+    try:
+        # Eine Lesetransaktion, damit alle Blöcke denselben Datenstand sehen
+        connection.execute("BEGIN")
+        if export_format == "parquet":
+            row_counts = _export_parquet(connection, paths, chunk_rows)
+        else:
+            row_counts = _export_npz(connection, paths["analysis_results"], chunk_rows, compress)
+    finally:
+        connection.rollback()
+        connection.close()
+
+    return {"format": export_format, "files": sorted(set(paths.values())), "rows": row_counts}
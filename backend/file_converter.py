@@ -1,9 +1,16 @@
 import os
+import threading
+import networkx as nx
 from backend.converters import (
     convert_xml_to_graphml,
     convert_cch_to_graphml,
     convert_to_graphml,
+    load_sndlib_graph,
+    load_rocketfuel_graph,
+    load_caida_graph,
+    write_caida_graphml,
 )
+from backend.utils import normalize_graph, get_file_extension, graphml_output_path
 
 def convert_file(file_path):
     """
@@ -15,9 +22,10 @@ def convert_file(file_path):
       - .graphml: Bereits im gewünschten Format. (Datenquelle: "TopologyZoo")
       - .xml: Konvertierung mittels convert_xml_to_graphml() (Datenquelle: "SNDlib")
       - .cch: Konvertierung mittels convert_cch_to_graphml() (Datenquelle: "Rocketfuel")
-      - .txt: Konvertierung mittels convert_to_graphml() (Datenquelle: "CAIDA_AS")
+      - .txt: Konvertierung mittels convert_to_graphml() (Datenquelle: "CAIDA_AS"),
+              auch gzip/bz2-komprimiert (.txt.gz, .txt.bz2)
     """
-    ext = os.path.splitext(file_path)[1].lower()  # Ermittelt die Dateiendung in Kleinbuchstaben
+    ext = get_file_extension(file_path)  # Ermittelt die Dateiendung in Kleinbuchstaben (ohne .gz/.bz2)
 
     if ext == ".graphml":
         # Keine Konvertierung erforderlich
@@ -33,3 +41,66 @@ def convert_file(file_path):
         return converted_file, "CAIDA_AS"
     else:
         raise ValueError(f"Nicht unterstütztes Dateiformat: {ext}")
+
+def write_graphml_in_background(G, output_path, write_func=None):
+    """
+    Schreibt den Graphen in einem Hintergrund-Thread als GraphML-Datei.
+    Der Graph darf währenddessen nur gelesen (analysiert), aber nicht verändert werden.
+
+    Parameter:
+      write_func (callable): Optionale Schreibfunktion ohne Argumente, die statt
+                             nx.write_graphml(G, output_path) aufgerufen wird
+                             (z.B. ein streamender Konverter).
+
+    Rückgabe:
+      threading.Thread: Der gestartete Thread (mit join() auf das Ende warten).
+    """
+    def _write():
+        try:
+            if write_func is not None:
+                write_func()
+            else:
+                nx.write_graphml(G, output_path)
+            print(f"GraphML-Datei geschrieben: {output_path}")
+        except Exception as e:
+            print(f"Fehler beim Schreiben von {output_path}: {e}")
+
+    thread = threading.Thread(target=_write, name=f"graphml-writer-{os.path.basename(output_path)}")
+    thread.start()
+    return thread
+
+def load_file(file_path, write_graphml=True):
+    """
+    Liest die übergebene Datei genau einmal ein und gibt den erzeugten Graphen direkt zurück,
+    sodass die Analyse die Datei nicht erneut aus GraphML einlesen muss.
+    Das Schreiben der GraphML-Datei (für die Visualisierung) ist optional und läuft
+    im Hintergrund, während der Graph bereits analysiert wird.
+
+    Parameter:
+      file_path (str): Pfad zur hochgeladenen Datei.
+      write_graphml (bool): GraphML-Datei für nicht-GraphML-Eingaben im Hintergrund schreiben.
+
+    Rückgabe:
+      tuple: (GraphML-Dateipfad, data_source, Graph, Schreib-Thread oder None)
+    """
+    ext = get_file_extension(file_path)
+    graphml_path = graphml_output_path(file_path)
+    write_func = None
+
+    if ext == ".graphml":
+        # Bereits GraphML: nur einlesen, nichts schreiben
+        return file_path, "TopologyZoo", nx.read_graphml(file_path), None
+    elif ext == ".xml":
+        G, data_source = load_sndlib_graph(file_path), "SNDlib"
+    elif ext == ".cch":
+        G, data_source = load_rocketfuel_graph(file_path), "Rocketfuel"
+    elif ext == ".txt":
+        G, data_source = load_caida_graph(file_path), "CAIDA_AS"
+        # Die GraphML-Datei wird aus dem bereits eingelesenen Graphen gestreamt, statt den
+        # (großen) Graphen über nx.write_graphml als XML-Baum aufzubauen
+        write_func = lambda: write_caida_graphml(G, graphml_path)
+    else:
+        raise ValueError(f"Nicht unterstütztes Dateiformat: {ext}")
+
+    writer = write_graphml_in_background(G, graphml_path, write_func) if write_graphml else None
+    return graphml_path, data_source, normalize_graph(G), writer
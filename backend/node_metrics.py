@@ -0,0 +1,77 @@
+import json
+import math
+
+# Knotenmetriken, die zusätzlich je Knoten in der Tabelle "node_metrics" gespeichert und
+# je Graph zu Kennzahlen (Maximum, Mittelwert, 95. Perzentil) zusammengefasst werden
+NODE_METRICS = ("degree_centrality", "betweenness_centrality", "closeness_centrality", "pagerank")
+SUMMARY_STATISTICS = ("max", "mean", "p95")
+
+# Spalten der Kennzahlen in "analysis_results", z.B. "pagerank_max"
+SUMMARY_COLUMNS = [f"{metric}_{statistic}" for metric in NODE_METRICS for statistic in SUMMARY_STATISTICS]
+
+def percentile(sorted_values, q):
+    """
+    Perzentil einer aufsteigend sortierten Liste mit linearer Interpolation
+    (entspricht numpy.percentile mit der Standardmethode).
+    """
+    position = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def summarize(values):
+    """
+    Kennzahlen einer Knotenmetrik: {"max": ..., "mean": ..., "p95": ...}
+    (alle None, falls keine Werte vorhanden sind).
+    """
+    if not values:
+        return {statistic: None for statistic in SUMMARY_STATISTICS}
+    sorted_values = sorted(values)
+    return {
+        "max": sorted_values[-1],
+        "mean": math.fsum(sorted_values) / len(sorted_values),
+        "p95": percentile(sorted_values, 95),
+    }
+
+def add_node_metrics(results, **metrics):
+    """
+    Ergänzt ein Ergebnis-Dictionary um die Knotenwerte (Schlüssel "node_metrics", wird in
+    der Tabelle "node_metrics" gespeichert) und die Kennzahlen je Metrik (z.B. "pagerank_max").
+    Metriken, die nicht berechnet wurden (z.B. "Timeout"), werden übersprungen.
+
+    Beispiel:
+      add_node_metrics(results, pagerank=pagerank, degree_centrality=degree_centrality)
+    """
+    node_metrics = {metric: values for metric, values in metrics.items() if isinstance(values, dict)}
+    results["node_metrics"] = node_metrics
+    for metric in NODE_METRICS:
+        values = node_metrics.get(metric)
+        summary = summarize(list(values.values()) if values else [])
+        for statistic, value in summary.items():
+            results[f"{metric}_{statistic}"] = value
+    return results
+
+def node_metrics_of(results):
+    """
+    Liefert die Knotenwerte eines Ergebnis-Dictionaries als {metric: {node: value}}.
+    Fehlt der Schlüssel "node_metrics" (bei älteren Datenbankeinträgen und Einträgen des
+    Ergebnis-Caches, die noch JSON-Spalten enthalten), werden die JSON-Spalten ausgewertet.
+    """
+    if "node_metrics" in results:
+        return results["node_metrics"]
+    node_metrics = {}
+    for metric in NODE_METRICS:
+        value = results.get(metric)
+        if isinstance(value, str) and value.startswith("{"):
+            node_metrics[metric] = json.loads(value)
+    return node_metrics
+
+def node_metric_rows(graph_id, results):
+    """
+    Zeilen (graph_id, node_id, metric, value) für die Tabelle "node_metrics".
+    """
+    return [
+        (graph_id, str(node), metric, value)
+        for metric, values in node_metrics_of(results).items()
+        for node, value in values.items()
+    ]
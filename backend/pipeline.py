@@ -1,42 +1,297 @@
 import os
-from backend.file_converter import convert_file
+import sys
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from backend.file_converter import load_file, convert_file
 from backend.data_processing import analyze_file  # angepasste Funktion, die eine einzelne Datei verarbeitet
-from backend.database_handler import initialize_database
+from backend.database_handler import initialize_database, save_many
+from backend.analyzers.time_budget import AnalysisCancelled, set_cancel_event, set_mp_context
+from backend.analyzers import settings
+from backend import result_cache
+from backend.utils import get_file_extension, graphml_output_path
 
 # Pfad zur SQLite-Datenbank
 database_path = "./network_analysis.db"
 
-def process_files(file_paths):
+# Anzahl der Ergebnisse, die process_files gesammelt in einer Transaktion speichert
+SAVE_BATCH_SIZE = 200
+
+def create_cancel_event(mp_context=None):
+    """
+    Erzeugt ein Abbruch-Event, das sowohl im eigenen Prozess als auch in den
+    Worker-Prozessen der parallelen Verarbeitung funktioniert. Mit event.set()
+    wird die laufende Analyse abgebrochen.
+    """
+    return (mp_context or multiprocessing).Event()
+
+def thread_safe_mp_context():
+    """
+    multiprocessing-Kontext für Aufrufer, in denen weitere Threads laufen (z.B. die GUI):
+    forkserver, wo verfügbar, sonst spawn. Mit fork würde der Kindprozess den Speicher
+    mitsamt der Sperren kopieren, die andere Threads (Qt) gerade halten, und könnte daran
+    hängen bleiben. Die Einstellungen übernimmt _init_worker.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+def process_single_file(file_path, database_path=database_path):
+    """
+    Konvertiert und analysiert eine einzelne Datei.
+    Die Datei wird nur einmal eingelesen: Der Konverter übergibt den erzeugten Graphen
+    direkt an die Analyse, die GraphML-Datei wird parallel dazu im Hintergrund geschrieben.
+    Fehler werden abgefangen und ausgegeben, damit eine fehlerhafte Datei
+    die übrigen Dateien eines Stapels nicht beeinflusst.
+
+    Vor der Konvertierung wird der Ergebnis-Cache befragt (settings.RESULT_CACHE_ENABLED):
+    Wurde eine Datei mit identischem Inhalt bereits mit derselben Analyzer-Version und
+    denselben Einstellungen analysiert, wird das gespeicherte Ergebnis zurückgegeben.
+
+    Parameter:
+      file_path (str): Pfad zur hochgeladenen Datei.
+      database_path (str): Pfad zur SQLite-Datenbank.
+
+    Rückgabe:
+      dict oder None: Ergebnis-Dictionary der Analyse oder None bei einem Fehler.
+    """
+    return _process_file(file_path, database_path, save=True)[0]
+
+def _process_file(file_path, database_path, save):
+    """
+    Wie process_single_file. Bei save=False wird nichts gespeichert; stattdessen werden
+    die zu speichernden Einträge zurückgegeben, damit der Aufrufer sie gesammelt
+    (database_handler.save_many) schreiben kann.
+
+    Rückgabe:
+      tuple: (Ergebnis oder None, Zeile für "analysis_results" oder None,
+              Eintrag für den Ergebnis-Cache oder None)
+    """
+    cache_key = None
+    if settings.RESULT_CACHE_ENABLED:
+        try:
+            cache_key, content_hash, cached = result_cache.lookup(file_path, database_path)
+            if cached is not None:
+                results, needs_row = _restore_cached(file_path, database_path, cached, save)
+                return results, (results if needs_row and not save else None), None
+        except Exception as e:
+            print(f"Ergebnis-Cache für {file_path} nicht verfügbar: {e}")
+            cache_key = None
+
+    try:
+        # Schritt 1: Einlesen/Konvertierung (GraphML wird im Hintergrund geschrieben)
+        converted_file, data_source, G, graphml_writer = load_file(file_path)
+        print(f"Datei eingelesen: {file_path} -> {converted_file} (Datenquelle: {data_source})")
+    except Exception as e:
+        print(f"Fehler bei der Konvertierung von {file_path}: {e}")
+        return None, None, None
+
+    try:
+        # Schritt 2: Analyse des bereits eingelesenen Graphen
+        analysis_results = analyze_file(converted_file, data_source, database_path, G=G, save=False)
+        print(f"Analyse abgeschlossen für {converted_file}.")
+        row = analysis_results if analysis_results and "error" not in analysis_results else None
+        entry = result_cache.cache_entry(cache_key, content_hash, data_source, analysis_results) if cache_key else None
+        if save:
+            # Ergebnis und Cache-Eintrag gemeinsam, damit der Eintrag auf diese Zeile verweist
+            if row is not None:
+                save_many(database_path, [row], [entry] if entry is not None else [])
+            return analysis_results, None, None
+        return analysis_results, row, entry
+    except AnalysisCancelled:
+        print(f"Analyse von {converted_file} abgebrochen.")
+        return None, None, None
+    except Exception as e:
+        print(f"Fehler bei der Analyse von {converted_file}: {e}")
+        return None, None, None
+    finally:
+        # Sicherstellen, dass die GraphML-Datei (für die Visualisierung) vollständig geschrieben ist
+        if graphml_writer is not None:
+            graphml_writer.join()
+
+def _restore_cached(file_path, database_path, cached, save=True):
+    """
+    Gibt ein zwischengespeichertes Ergebnis zurück. Die GraphML-Datei (für die Visualisierung)
+    wird nur dann neu erzeugt, wenn sie nicht mehr vorhanden ist.
+    """
+    data_source, results = cached
+    if get_file_extension(file_path) == ".graphml":
+        graphml_path = file_path
+    else:
+        graphml_path = graphml_output_path(file_path)
+        if not os.path.exists(graphml_path):
+            graphml_path, _ = convert_file(file_path)
+    print(f"Unveränderte Datei, Ergebnis aus dem Cache übernommen: {file_path} (Datenquelle: {data_source})")
+    return result_cache.restore(database_path, results, graphml_path, save)
+
+def _timed_process_file(file_path, database_path):
+    """
+    _process_file ohne Speichern, zusätzlich mit der Verarbeitungsdauer der Datei in Sekunden.
+    """
+    start = time.perf_counter()
+    outcome = _process_file(file_path, database_path, save=False)
+    return outcome, round(time.perf_counter() - start, 4)
+
+def iter_process_files(file_paths, parallel=False, max_workers=None, cancel_event=None,
+                       database_path=database_path, with_timings=False, mp_context=None):
+    """
+    Verarbeitet eine Liste von Dateien und liefert die Ergebnisse einzeln zurück,
+    sobald sie vorliegen (Generator).
+
+    Im parallelen Modus wird die Konvertierung und Analyse jeder Datei über einen
+    ProcessPoolExecutor verteilt. Die Ergebnisse erscheinen dann in der Reihenfolge
+    ihrer Fertigstellung, nicht in der Reihenfolge von file_paths.
+
+    Die Ergebnisse werden im aufrufenden Prozess gesammelt und jeweils SAVE_BATCH_SIZE
+    Stück (sowie der Rest am Ende) in einer einzigen Transaktion gespeichert.
+
+    Parameter:
+      file_paths (list): Liste der Pfade zu den hochgeladenen Dateien.
+      parallel (bool): Aktiviert die Verarbeitung in mehreren Prozessen.
+      max_workers (int): Anzahl der Prozesse (Standard: Anzahl der CPU-Kerne).
+      cancel_event: Optionales Event aus create_cancel_event(). Ist es gesetzt, werden
+                    keine weiteren Dateien gestartet und laufende Analysen abgebrochen.
+      database_path (str): Pfad zur SQLite-Datenbank.
+      with_timings (bool): Zusätzlich die Verarbeitungsdauer jeder Datei (Sekunden,
+                           gemessen im verarbeitenden Prozess) liefern.
+      mp_context: Optionaler multiprocessing-Kontext für die Worker-Prozesse und die
+                  Kindprozesse der Zeitbudgets im aufrufenden Prozess (siehe thread_safe_mp_context()).
+
+    Rückgabe:
+      Generator mit Tupeln (file_path, Ergebnis-Dictionary oder None), bei with_timings=True
+      (file_path, Ergebnis-Dictionary oder None, Sekunden).
+    """
+    rows, cache_entries = [], []
+    try:
+        for file_path, (result, row, entry), seconds in _iter_unsaved(
+            file_paths, parallel, max_workers, cancel_event, database_path, mp_context
+        ):
+            if row is not None:
+                rows.append(row)
+            if entry is not None:
+                cache_entries.append(entry)
+            if len(rows) + len(cache_entries) >= SAVE_BATCH_SIZE:
+                _save_batch(rows, cache_entries, database_path)
+            yield (file_path, result, seconds) if with_timings else (file_path, result)
+    finally:
+        _save_batch(rows, cache_entries, database_path)
+
+def _save_batch(rows, cache_entries, database_path):
+    """
+    Speichert die gesammelten Ergebnisse und Cache-Einträge und leert die Listen.
+    """
+    if not rows and not cache_entries:
+        return
+    try:
+        save_many(database_path, rows, cache_entries)
+        print(f"{len(rows)} Ergebnisse gespeichert.")
+    except Exception as e:
+        print(f"Fehler beim Speichern von {len(rows)} Ergebnissen: {e}")
+    rows.clear()
+    cache_entries.clear()
+
+def _settings_snapshot():
+    return {name: getattr(settings, name) for name in dir(settings) if name.isupper()}
+
+def _output_target():
+    # Umleitung der Standardausgabe im aufrufenden Prozess (z.B. contextlib.redirect_stdout im CLI)
+    if sys.stdout is sys.__stdout__:
+        return None
+    return "stderr" if sys.stdout is sys.__stderr__ else "devnull"
+
+def _init_worker(cancel_event, settings_values, output_target):
+    """
+    initializer der Worker-Prozesse: registriert das Abbruch-Event und übernimmt die
+    Analyzer-Einstellungen und die Umleitung der Standardausgabe des aufrufenden Prozesses.
+    Mit den Startmethoden spawn und forkserver wird settings im Worker neu importiert; ohne
+    Übernahme gälten dort die Standardwerte (z.B. ohne --skip-metrics oder --no-cache der
+    Kommandozeile), und der Cache-Schlüssel im Worker wiche von dem des aufrufenden Prozesses ab.
+    """
+    set_cancel_event(cancel_event)
+    for name, value in settings_values.items():
+        setattr(settings, name, value)
+    if output_target == "stderr":
+        sys.stdout = sys.stderr
+    elif output_target == "devnull":
+        sys.stdout = open(os.devnull, "w")
+
+def _iter_unsaved(file_paths, parallel, max_workers, cancel_event, database_path, mp_context):
+    """
+    Verarbeitet die Dateien ohne zu speichern und liefert (file_path, _process_file-Ergebnis, Sekunden).
+    """
+    set_cancel_event(cancel_event)
+    set_mp_context(mp_context)
+
+    if not parallel or len(file_paths) < 2:
+        for file_path in file_paths:
+            if cancel_event is not None and cancel_event.is_set():
+                print("Verarbeitung abgebrochen.")
+                return
+            yield (file_path, *_timed_process_file(file_path, database_path))
+        return
+
+    workers = max_workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(file_paths)))
+    print(f"Parallele Verarbeitung von {len(file_paths)} Dateien mit {workers} Prozessen.")
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(cancel_event, _settings_snapshot(), _output_target()),
+    ) as executor:
+        futures = {
+            executor.submit(_timed_process_file, file_path, database_path): file_path
+            for file_path in file_paths
+        }
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            if cancel_event is not None and cancel_event.is_set():
+                # Noch nicht gestartete Dateien verwerfen; laufende brechen selbst ab
+                for future in pending:
+                    future.cancel()
+            for future in done:
+                if future.cancelled():
+                    continue
+                file_path = futures[future]
+                try:
+                    outcome, seconds = future.result()
+                except Exception as e:
+                    # z.B. abgestürzter Worker-Prozess (BrokenProcessPool)
+                    print(f"Fehler im Worker-Prozess für {file_path}: {e}")
+                    outcome, seconds = (None, None, None), None
+                yield file_path, outcome, seconds
+
+def process_files(file_paths, parallel=False, max_workers=None, on_result=None, cancel_event=None,
+                  database_path=database_path, mp_context=None):
     """
     Verarbeitet eine Liste von Dateien:
       1. Konvertiert die Datei ins GraphML-Format (falls erforderlich) und erhält die Datenquelle.
       2. Analysiert die konvertierte Datei, wobei der richtige Analyzer basierend auf der Datenquelle gewählt wird.
       3. Die Analyseergebnisse werden in der SQLite-Datenbank gespeichert.
-      
+
     Parameter:
       file_paths (list): Liste der Pfade zu den hochgeladenen Dateien (aus temp_uploads/).
-      
+      parallel (bool): Verteilt die Dateien auf mehrere Prozesse (ProcessPoolExecutor).
+      max_workers (int): Anzahl der Prozesse im parallelen Modus (Standard: Anzahl der CPU-Kerne).
+      on_result (callable): Optionaler Callback on_result(file_path, result), der für jede
+                            Datei aufgerufen wird, sobald sie fertig ist (result ist None bei Fehlern).
+      cancel_event: Optionales Abbruch-Event (siehe create_cancel_event()).
+      database_path (str): Pfad zur SQLite-Datenbank.
+      mp_context: Optionaler multiprocessing-Kontext (siehe iter_process_files).
+
     Rückgabe:
       list: Eine Liste mit den Ergebnis-Dictionaries aller verarbeiteten Dateien.
     """
     results = []
-    for file_path in file_paths:
-        try:
-            # Schritt 1: Konvertierung
-            converted_file, data_source = convert_file(file_path)
-            print(f"Datei konvertiert: {file_path} -> {converted_file} (Datenquelle: {data_source})")
-        except Exception as e:
-            print(f"Fehler bei der Konvertierung von {file_path}: {e}")
-            continue
-
-        try:
-            # Schritt 2: Analyse
-            analysis_results = analyze_file(converted_file, data_source, database_path)
+    for file_path, analysis_results in iter_process_files(
+        file_paths, parallel, max_workers, cancel_event, database_path, mp_context=mp_context
+    ):
+        if on_result is not None:
+            on_result(file_path, analysis_results)
+        if analysis_results is not None:
             results.append(analysis_results)
-            print(f"Analyse abgeschlossen für {converted_file}.")
-        except Exception as e:
-            print(f"Fehler bei der Analyse von {converted_file}: {e}")
-            continue
 
     return results
 
@@ -49,7 +304,7 @@ if __name__ == "__main__":
     if os.path.exists(temp_dir):
         # Sammle alle Dateien im temp_uploads-Verzeichnis
         file_paths = [os.path.join(temp_dir, f) for f in os.listdir(temp_dir) if os.path.isfile(os.path.join(temp_dir, f))]
-        results = process_files(file_paths)
+        results = process_files(file_paths, parallel=True)
         print("Verarbeitung abgeschlossen.")
         print("Ergebnisse:", results)
     else:
@@ -0,0 +1,110 @@
+import os
+import json
+import hashlib
+from backend.analyzers import settings
+from backend.database_handler import (
+    load_cached_results,
+    has_analysis_results,
+    has_graph,
+    load_graph_node_metrics,
+    save_analysis_results,
+)
+from backend.node_metrics import NODE_METRICS
+
+# Einstellungen, die nur die Rechenzeit, nicht aber die gespeicherten Werte beeinflussen
+_IGNORED_SETTINGS = {"RESULT_CACHE_ENABLED", "SPARSE_BATCH_SIZE"}
+
+def file_content_hash(file_path, chunk_size=1 << 20):
+    """
+    Berechnet den SHA-256-Hash des Dateiinhalts (blockweise, auch für große Dateien).
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def settings_fingerprint():
+    """
+    Fasst alle ergebnisrelevanten Analyzer-Einstellungen (Approximation, Backend,
+    Zeitbudgets, ...) zu einem Dictionary zusammen.
+    """
+    return {
+        name: getattr(settings, name)
+        for name in sorted(dir(settings))
+        if name.isupper() and name not in _IGNORED_SETTINGS
+    }
+
+def compute_cache_key(file_path, content_hash=None):
+    """
+    Cache-Schlüssel einer Datei: Hash aus Dateiinhalt, Dateiendung (bestimmt den Analyzer),
+    Analyzer-Version und Einstellungen. Ändert sich einer dieser Werte, wird neu analysiert.
+
+    Rückgabe:
+      tuple: (cache_key, content_hash)
+    """
+    content_hash = content_hash or file_content_hash(file_path)
+    key_data = {
+        "content_hash": content_hash,
+        "extension": os.path.splitext(file_path)[1].lower(),
+        "analyzer_version": settings.ANALYZER_VERSION,
+        "settings": settings_fingerprint(),
+    }
+    key = hashlib.sha256(json.dumps(key_data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return key, content_hash
+
+def lookup(file_path, database_path):
+    """
+    Sucht das Analyseergebnis einer Datei im Ergebnis-Cache.
+
+    Einträge, deren Knotenwerte nicht mehr in der Datenbank stehen (die Zeile "graph_id"
+    in "analysis_results" wurde gelöscht), gelten als nicht vorhanden.
+
+    Rückgabe:
+      tuple: (cache_key, content_hash, (data_source, results) oder None)
+    """
+    cache_key, content_hash = compute_cache_key(file_path)
+    cached = load_cached_results(database_path, cache_key)
+    # Ältere Einträge ohne "graph_id" enthalten die Knotenwerte noch als JSON-Spalten
+    if cached is not None and "graph_id" in cached[1]:
+        graph_id = cached[1]["graph_id"]
+        if graph_id is None or not has_graph(database_path, graph_id):
+            cached = None
+    return cache_key, content_hash, cached
+
+def cache_entry(cache_key, content_hash, data_source, results):
+    """
+    Eintrag für den Ergebnis-Cache im Format von database_handler.save_many, oder None
+    für Fehlerergebnisse und Ergebnisse mit Metriken im Timeout. Diese werden nicht
+    zwischengespeichert: Ein Timeout kann an der Auslastung liegen (z.B. viele parallele
+    Analysen) und soll beim nächsten Mal erneut versucht werden.
+
+    Der Eintrag muss zusammen mit results im selben save_many-Aufruf gespeichert werden;
+    er verweist auf die dabei eingefügte Zeile (und deren Knotenwerte).
+    """
+    if not results or "error" in results or results.get("timed_out_metrics"):
+        return None
+    # Die Knotenwerte stehen nur in der Tabelle "node_metrics" (siehe database_handler.save_many)
+    cached = {key: value for key, value in results.items() if key != "node_metrics" and key not in NODE_METRICS}
+    return (cache_key, content_hash, settings.ANALYZER_VERSION, data_source, cached, results)
+
+def restore(database_path, results, graphml_path, save=True):
+    """
+    Übernimmt ein zwischengespeichertes Ergebnis für die aktuelle Datei: Der Dateiname wird
+    angepasst (gleicher Inhalt kann unter anderem Namen hochgeladen werden), und ein Eintrag
+    in "analysis_results" wird nur angelegt, falls dort noch keiner für Projekt und Datei existiert.
+    Die Knotenwerte des neuen Eintrags werden von der Zeile "graph_id" des Cache-Eintrags übernommen.
+
+    Rückgabe:
+      tuple: (results, needs_row) – needs_row ist True, wenn der Eintrag in "analysis_results"
+             noch fehlt und (bei save=False) vom Aufrufer gespeichert werden muss.
+    """
+    results = dict(results)
+    graph_id = results.pop("graph_id", None)
+    results["file_name"] = os.path.basename(graphml_path)
+    needs_row = not has_analysis_results(database_path, results["project_name"], results["file_name"])
+    if needs_row and graph_id is not None:
+        results["node_metrics"] = load_graph_node_metrics(database_path, graph_id)
+    if needs_row and save:
+        save_analysis_results(database_path, results)
+    return results, needs_row
@@ -0,0 +1,296 @@
+import sqlite3
+from backend import dataset_aggregates, search_index
+from backend.node_metrics import NODE_METRICS, SUMMARY_COLUMNS, add_node_metrics, node_metrics_of, node_metric_rows
+
+# Versionierte Schema-Migrationen der Analyse-Datenbank.
+#
+# Die Schemaversion einer Datenbank steht in "PRAGMA user_version" (0 = neue oder vor
+# Einführung der Migrationen angelegte Datenbank). migrate() führt alle noch fehlenden
+# Migrationen der Reihe nach aus, jede in einer eigenen Transaktion zusammen mit dem
+# Hochsetzen der Version. Bestehende Migrationen werden nie geändert; Schemaänderungen
+# kommen als neue Funktion ans Ende von MIGRATIONS.
+
+# Zahlen- und Wahrheitswertspalten von "analysis_results" mit ihrem SQL-Typ.
+# Nicht anwendbare oder nicht berechnete Werte ("N/A", "Timeout") werden als NULL gespeichert.
+NUMERIC_COLUMNS = {
+    "is_directed": "INTEGER",
+    "number_of_nodes": "INTEGER",
+    "number_of_edges": "INTEGER",
+    "is_connected": "INTEGER",
+    "is_strongly_connected": "INTEGER",
+    "is_weakly_connected": "INTEGER",
+    "node_connectivity": "INTEGER",
+    "edge_connectivity": "INTEGER",
+    "global_efficiency": "REAL",
+    "local_efficiency": "REAL",
+    "diameter": "INTEGER",
+    "radius": "INTEGER",
+    "density": "REAL",
+    "is_tree": "INTEGER",
+    "is_forest": "INTEGER",
+    "is_bipartite": "INTEGER",
+    "is_planar": "INTEGER",
+    "is_multigraph": "INTEGER",
+    "centrality_sample_size": "INTEGER",
+    "centrality_error": "REAL",
+    **{column: "REAL" for column in SUMMARY_COLUMNS},
+}
+
+def to_number(value):
+    """
+    Wandelt einen Metrikwert für eine Zahlenspalte um: Zahlen (auch als Text gespeicherte)
+    bleiben erhalten, Wahrheitswerte werden zu 0/1, alles andere ("N/A", "Timeout", None) zu None.
+    """
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+def _create_base_schema(connection):
+    """
+    Version 1: Schema vor Einführung der Migrationen (Metriken zum Teil als TEXT).
+    Ältere Datenbanken werden um fehlende Spalten und die Tabelle "node_metrics" ergänzt.
+    """
+    connection.execute(f"""
+        CREATE TABLE IF NOT EXISTS analysis_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            Project_name TEXT,
+            File_name TEXT,
+            is_directed BOOLEAN,
+            number_of_nodes INTEGER,
+            number_of_edges INTEGER,
+            is_connected BOOLEAN,
+            is_strongly_connected BOOLEAN,
+            is_weakly_connected BOOLEAN,
+            node_connectivity TEXT,
+            edge_connectivity TEXT,
+            global_efficiency TEXT,
+            local_efficiency TEXT,
+            graph_center TEXT,
+            degree_centrality TEXT,
+            betweenness_centrality TEXT,
+            closeness_centrality TEXT,
+            pagerank TEXT,
+            diameter TEXT,
+            radius TEXT,
+            periphery TEXT,
+            density REAL,
+            is_tree BOOLEAN,
+            is_forest BOOLEAN,
+            is_bipartite BOOLEAN,
+            is_planar BOOLEAN,
+            is_multigraph BOOLEAN,
+            centrality_mode TEXT,
+            centrality_sample_size INTEGER,
+            centrality_error REAL,
+            metric_timings TEXT,
+            timed_out_metrics TEXT,
+            {", ".join(f"{column} REAL" for column in SUMMARY_COLUMNS)}
+        )
+    """)
+
+    # Tabelle "result_cache": Ergebnisse je Inhalts-Hash (siehe backend/result_cache.py)
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS result_cache (
+            cache_key TEXT PRIMARY KEY,
+            content_hash TEXT,
+            analyzer_version INTEGER,
+            data_source TEXT,
+            results TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Nachträglich hinzugekommene Spalten in älteren Datenbanken ergänzen
+    added_columns = {
+        "centrality_mode": "TEXT",
+        "centrality_sample_size": "INTEGER",
+        "centrality_error": "REAL",
+        "metric_timings": "TEXT",
+        "timed_out_metrics": "TEXT",
+        **{column: "REAL" for column in SUMMARY_COLUMNS},
+    }
+    existing_columns = {row[1] for row in connection.execute("PRAGMA table_info(analysis_results)")}
+    for column, column_type in added_columns.items():
+        if column not in existing_columns:
+            connection.execute(f"ALTER TABLE analysis_results ADD COLUMN {column} {column_type}")
+
+    # Tabelle "node_metrics": ein Wert je Graph, Knoten und Knotenmetrik
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS node_metrics (
+            graph_id INTEGER NOT NULL REFERENCES analysis_results(id) ON DELETE CASCADE,
+            node_id TEXT NOT NULL,
+            metric TEXT NOT NULL,
+            value REAL
+        )
+    """)
+    # "Graphen mit einem Knoten, dessen Metrik >= X ist" als Index-Suche
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_node_metrics_metric_value ON node_metrics (metric, value, graph_id)")
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_node_metrics_graph ON node_metrics (graph_id, metric)")
+
+    _backfill_node_metrics(connection)
+
+def _backfill_node_metrics(connection):
+    """
+    Überträgt die JSON-Spalten älterer Einträge in die Tabelle "node_metrics" und
+    berechnet ihre Kennzahlen (max/mean/p95).
+    """
+    rows = connection.execute(f"""
+        SELECT id, {", ".join(NODE_METRICS)} FROM analysis_results
+        WHERE {" AND ".join(f"{column} IS NULL" for column in SUMMARY_COLUMNS)}
+          AND ({" OR ".join(f"{metric} LIKE '{{%'" for metric in NODE_METRICS)})
+    """).fetchall()
+    for row in rows:
+        graph_id = row[0]
+        results = add_node_metrics({}, **node_metrics_of(dict(zip(NODE_METRICS, row[1:]))))
+        connection.execute(
+            f"UPDATE analysis_results SET {', '.join(f'{column} = ?' for column in SUMMARY_COLUMNS)} WHERE id = ?",
+            [results[column] for column in SUMMARY_COLUMNS] + [graph_id],
+        )
+        connection.execute("DELETE FROM node_metrics WHERE graph_id = ?", (graph_id,))
+        connection.executemany("INSERT INTO node_metrics VALUES (?, ?, ?, ?)", node_metric_rows(graph_id, results))
+
+def _convert_numeric_columns(connection):
+    """
+    Version 2: Zahlen- und Wahrheitswertspalten als INTEGER/REAL mit NULL statt "N/A"/"Timeout".
+
+    SQLite kann den Typ einer Spalte nicht ändern; die Tabelle wird daher neu angelegt und
+    umkopiert. Die ids bleiben erhalten, damit die Verweise aus "node_metrics" gültig bleiben.
+    Auch der AUTOINCREMENT-Zähler wird übernommen: Sonst würden ids früher gelöschter Zeilen
+    erneut vergeben, und Einträge im Ergebnis-Cache mit einer solchen graph_id verwiesen auf
+    einen anderen Graphen.
+    """
+    old_columns = [row[1] for row in connection.execute("PRAGMA table_info(analysis_results)")]
+    sequence = connection.execute("SELECT seq FROM sqlite_sequence WHERE name = 'analysis_results'").fetchone()
+    column_definitions = ",\n            ".join(
+        f"{column} {NUMERIC_COLUMNS.get(column, 'TEXT')}" for column in old_columns if column != "id"
+    )
+    connection.execute(f"""
+        CREATE TABLE analysis_results_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            {column_definitions}
+        )
+    """)
+    connection.create_function("to_number", 1, to_number, deterministic=True)
+    select_list = ", ".join(
+        f"to_number({column})" if column in NUMERIC_COLUMNS else column for column in old_columns
+    )
+    connection.execute(
+        f"INSERT INTO analysis_results_new ({', '.join(old_columns)}) SELECT {select_list} FROM analysis_results"
+    )
+    connection.execute("DROP TABLE analysis_results")
+    connection.execute("ALTER TABLE analysis_results_new RENAME TO analysis_results")
+    if sequence is not None:
+        connection.execute(
+            "UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'analysis_results'", (sequence[0],)
+        )
+        connection.execute(
+            "INSERT INTO sqlite_sequence (name, seq) SELECT 'analysis_results', ? "
+            "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'analysis_results')",
+            (sequence[0],),
+        )
+
+def _create_result_indexes(connection):
+    """
+    Version 3: Indizes für die Filter und Sortierungen der Analyseansicht und die
+    Gruppierung nach Projekt in der Datensatzanalyse.
+    """
+    # (Project_name, File_name) dient auch für Abfragen nur nach Project_name
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_analysis_results_project_file ON analysis_results (Project_name, File_name)")
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_analysis_results_file ON analysis_results (File_name)")
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_analysis_results_nodes ON analysis_results (number_of_nodes)")
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_analysis_results_edges ON analysis_results (number_of_edges)")
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_analysis_results_density ON analysis_results (density)")
+
+def _create_dataset_aggregates(connection):
+    """
+    Version 4: Materialisierte Kennzahlen je Datensatz (siehe backend/dataset_aggregates.py),
+    die per Trigger aktuell gehalten und hier einmalig aus dem Bestand berechnet werden.
+    """
+    connection.execute(dataset_aggregates.CREATE_TABLE)
+    for statement in dataset_aggregates.create_trigger_statements():
+        connection.execute(statement)
+    for statement in dataset_aggregates.rebuild_statements():
+        connection.execute(statement)
+
+def _create_sort_index(connection):
+    """
+    Version 5: Index für die Sortierung "Zentralität" der seitenweise geladenen Ergebnistabelle.
+    """
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_analysis_results_pagerank_max ON analysis_results (pagerank_max)")
+
+def _create_search_index(connection):
+    """
+    Version 6: Volltextindex über Projekt, Dateiname und Knotenbezeichnungen
+    (siehe backend/search_index.py). Bestehende Einträge werden mit Projekt und
+    Dateiname aufgenommen; ihre Knotenbezeichnungen erst bei einer erneuten Analyse.
+    Ohne FTS5-Unterstützung in SQLite wird der Index übersprungen (die Suche nutzt dann LIKE).
+    """
+    try:
+        connection.execute(search_index.CREATE_TABLE)
+    except sqlite3.OperationalError as e:
+        print(f"Volltextindex nicht verfügbar ({e}), die Schnellsuche verwendet LIKE.")
+        return
+    for statement in search_index.CREATE_TRIGGERS:
+        connection.execute(statement)
+    connection.execute(f"""
+        INSERT INTO {search_index.SEARCH_TABLE} (rowid, project, file, nodes)
+        SELECT id, Project_name, File_name, '' FROM analysis_results
+    """)
+
+# Migrationen in Reihenfolge; die Schemaversion nach Migration i ist i + 1
+MIGRATIONS = [
+    _create_base_schema,
+    _convert_numeric_columns,
+    _create_result_indexes,
+    _create_dataset_aggregates,
+    _create_sort_index,
+    _create_search_index,
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+def schema_version(connection):
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+def migrate(connection):
+    """
+    Bringt die Datenbank auf den Stand SCHEMA_VERSION.
+
+    Jede Migration läuft mit "BEGIN IMMEDIATE", damit gleichzeitig startende Prozesse sie
+    nicht doppelt ausführen; die Version wird innerhalb der Sperre erneut gelesen.
+    Fremdschlüssel sind währenddessen abgeschaltet, da beim Neuanlegen von
+    "analysis_results" sonst die Einträge in "node_metrics" mitgelöscht würden.
+
+    Rückgabe:
+      int: Schemaversion vor der Migration.
+    """
+    initial_version = schema_version(connection)
+    if initial_version >= SCHEMA_VERSION:
+        return initial_version
+
+    connection.commit()
+    connection.execute("PRAGMA foreign_keys=OFF")
+    try:
+        for version, migration in enumerate(MIGRATIONS, start=1):
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                if schema_version(connection) < version:
+                    migration(connection)
+                    connection.execute(f"PRAGMA user_version = {version}")
+                    print(f"Datenbankschema auf Version {version} aktualisiert ({migration.__name__}).")
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+    finally:
+        connection.execute("PRAGMA foreign_keys=ON")
+    return initial_version
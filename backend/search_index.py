@@ -0,0 +1,80 @@
+import re
+
+# Volltextindex (SQLite FTS5) über Projekt, Dateiname und Knotenbezeichnungen je Graph.
+# Die rowid eines Eintrags ist die id der zugehörigen Zeile in "analysis_results".
+SEARCH_TABLE = "graph_search"
+
+# Knotenattribute mit Bezeichnungen: Topology Zoo "label"/"Country",
+# Rocketfuel "name" (DNS-Name bzw. IP) und "loc" (z.B. "@Stockholm,+Sweden")
+LABEL_ATTRIBUTES = ("label", "name", "loc", "Country")
+
+# Präfixindizes für die Suche nach Wortanfängen (z.B. "Frank*")
+CREATE_TABLE = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE}
+    USING fts5(project, file, nodes, prefix = '2 3 4')
+"""
+
+# Einträge gelöschter bzw. umbenannter Graphen nachführen
+CREATE_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_delete AFTER DELETE ON analysis_results BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = OLD.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_update AFTER UPDATE OF Project_name, File_name ON analysis_results BEGIN
+        UPDATE {SEARCH_TABLE} SET project = NEW.Project_name, file = NEW.File_name WHERE rowid = NEW.id;
+    END
+    """,
+]
+
+def node_label_text(G):
+    """
+    Text der Knotenbezeichnungen eines Graphen für den Suchindex (jede Bezeichnung einmal).
+    Knoten-IDs werden übernommen, sofern sie nicht rein numerisch sind (z.B. die
+    Städtenamen in SNDlib), nicht aber laufende Nummern oder AS-Nummern.
+    """
+    labels = set()
+    for node, data in G.nodes(data=True):
+        node = str(node)
+        if not node.isdigit():
+            labels.add(node)
+        for attribute in LABEL_ATTRIBUTES:
+            value = data.get(attribute)
+            if isinstance(value, str) and value:
+                labels.add(value)
+    return " ".join(sorted(labels))
+
+def search_rows(rows):
+    """
+    Einträge (rowid, project, file, nodes) für den Suchindex aus Paaren (id, results).
+    """
+    return [
+        (graph_id, results.get("project_name"), results.get("file_name"), results.get("node_labels") or "")
+        for graph_id, results in rows
+    ]
+
+def has_search_index(connection):
+    """
+    Prüft, ob der Suchindex existiert (er fehlt, wenn SQLite ohne FTS5 übersetzt wurde).
+    """
+    row = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (SEARCH_TABLE,)
+    ).fetchone()
+    return row is not None
+
+def fts_query(text):
+    """
+    Wandelt eine Sucheingabe in eine FTS5-Abfrage um: Jedes Wort wird als Präfix gesucht,
+    alle Wörter müssen vorkommen. Sonderzeichen der FTS5-Syntax werden nicht ausgewertet.
+
+    Beispiel:
+      fts_query("frank zoo") -> '"frank"* AND "zoo"*'
+
+    Rückgabe:
+      str oder None, falls die Eingabe kein Wort enthält.
+    """
+    words = re.findall(r"\w+", text)
+    if not words:
+        return None
+    return " AND ".join(f'"{word}"*' for word in words)
@@ -0,0 +1,54 @@
+import os
+
+def has_parallel_edges(G):
+    """
+    Prüft, ob ein Multigraph tatsächlich parallele Kanten enthält.
+    """
+    if not G.is_multigraph():
+        return False
+    return any(len(keydict) > 1 for nbrs in G.adj.values() for keydict in nbrs.values())
+
+def normalize_graph(G):
+    """
+    Bringt einen im Speicher erzeugten Graphen in dieselbe Form, die nx.read_graphml
+    für die daraus geschriebene GraphML-Datei liefern würde.
+
+    nx.read_graphml gibt nur dann einen Multigraphen zurück, wenn die Datei parallele
+    Kanten enthält. Damit die Analyse eines direkt übergebenen Graphen dieselben
+    Ergebnisse liefert wie die Analyse der GraphML-Datei, wird ein Multigraph ohne
+    parallele Kanten in einen einfachen Graphen umgewandelt.
+
+    Parameter:
+      G (networkx.Graph): Vom Konverter erzeugter Graph.
+
+    Rückgabe:
+      networkx.Graph: Der (ggf. umgewandelte) Graph.
+    """
+    import networkx as nx
+
+    if G.is_multigraph() and not has_parallel_edges(G):
+        return nx.DiGraph(G) if G.is_directed() else nx.Graph(G)
+    return G
+
+# Kompressionsendungen, die beim Einlesen direkt entpackt werden (z.B. "20240101.as-rel.txt.bz2")
+COMPRESSION_SUFFIXES = (".gz", ".bz2")
+
+def strip_compression_suffix(file_path):
+    """
+    Entfernt eine Kompressionsendung (.gz/.bz2) vom Dateipfad.
+    """
+    root, ext = os.path.splitext(file_path)
+    return root if ext.lower() in COMPRESSION_SUFFIXES else file_path
+
+def get_file_extension(file_path):
+    """
+    Liefert die Dateiendung in Kleinbuchstaben, bei komprimierten Dateien die
+    Endung vor der Kompressionsendung ("as-rel.txt.gz" -> ".txt").
+    """
+    return os.path.splitext(strip_compression_suffix(file_path))[1].lower()
+
+def graphml_output_path(file_path):
+    """
+    Pfad der GraphML-Datei, die für eine Eingabedatei erzeugt wird (gleiches Verzeichnis).
+    """
+    return os.path.splitext(strip_compression_suffix(file_path))[0] + '.graphml'
@@ -0,0 +1,54 @@
+"""
+Benchmark: Layout-Berechnung der Visualisierung (frontend/components/layout_engine.py,
+Barnes-Hut mit Mehrebenen-Verfahren) gegen das bisherige nx.spring_layout(k=0.1, iterations=50).
+
+Aufruf (aus dem Projektverzeichnis):
+    python benchmarks/bench_layout.py [Dateien ...] [--nodes N ...] [--reference-limit N]
+
+Dateien werden wie beim Hochladen eingelesen (.graphml, .xml, .cch, .txt). Zusätzlich werden
+Barabási-Albert-Graphen (m=2, ähnlich AS-Graphen) mit den unter --nodes angegebenen Knotenzahlen
+erzeugt. nx.spring_layout wird nur bis --reference-limit Knoten gemessen (O(n²) je Iteration).
+"""
+import os
+import sys
+import time
+import argparse
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+import networkx as nx
+
+from backend.file_converter import load_file
+from frontend.components.layout_engine import compute_layout
+
+DEFAULT_FILES = [
+    os.path.join(ROOT, "datasets-testen", "1755.cch"),
+    os.path.join(ROOT, "datasets-testen", "4755.cch"),
+]
+
+def _seconds(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", default=DEFAULT_FILES)
+    parser.add_argument("--nodes", type=int, nargs="*", default=[10000, 50000])
+    parser.add_argument("--reference-limit", type=int, default=5000)
+    args = parser.parse_args()
+
+    graphs = [(os.path.basename(path), load_file(path, write_graphml=False)[2]) for path in args.files]
+    graphs += [(f"barabasi_albert({n}, 2)", nx.barabasi_albert_graph(n, 2, seed=1)) for n in args.nodes]
+
+    for name, G in graphs:
+        current = _seconds(lambda: compute_layout(G))
+        line = f"{name} ({G.number_of_nodes()} Knoten, {G.number_of_edges()} Kanten): neu {current:.2f} s"
+        if G.number_of_nodes() <= args.reference_limit:
+            legacy = _seconds(lambda: nx.spring_layout(G, k=0.1, iterations=50))
+            line += f", bisher {legacy:.2f} s, Faktor {legacy / current:.1f}x"
+        print(line, flush=True)
+
+if __name__ == "__main__":
+    main()
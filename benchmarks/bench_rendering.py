@@ -0,0 +1,108 @@
+"""
+Benchmark: Zeichnen der Detailansicht (frontend/components/graph_canvas.py, MatplotlibCanvas
+mit LineCollection, Detailstufen und Blitting) gegen das bisherige nx.draw_networkx_edges /
+nx.draw_networkx_nodes.
+
+Aufruf (aus dem Projektverzeichnis):
+    python benchmarks/bench_rendering.py [Dateien ...] [--nodes N ...] [--repeat N]
+
+Dateien werden wie beim Hochladen eingelesen (.graphml, .xml, .cch, .txt). Zusätzlich werden
+Barabási-Albert-Graphen (m=2) mit den unter --nodes angegebenen Knotenzahlen erzeugt. Die
+Positionen berechnet layout_engine.compute_layout (nicht mitgemessen). Gemessen werden je
+Graph: vollständiges Neuzeichnen bisher und neu, ein Zoomschritt und ein Bild beim Verschieben.
+Ohne Display wird die Qt-Plattform "offscreen" verwendet.
+"""
+import os
+import sys
+import time
+import argparse
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+if not os.environ.get("DISPLAY") and not os.environ.get("WAYLAND_DISPLAY") and sys.platform.startswith("linux"):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import networkx as nx
+from matplotlib.backend_bases import MouseEvent
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PyQt5.QtWidgets import QApplication
+
+from backend.file_converter import load_file
+from frontend.components.graph_canvas import MatplotlibCanvas
+from frontend.components.layout_engine import compute_layout
+
+DEFAULT_FILES = [
+    os.path.join(ROOT, "datasets-testen", "1755.cch"),
+    os.path.join(ROOT, "datasets-testen", "4755.cch"),
+]
+
+# Größe der Zeichenfläche in Pixeln
+WIDTH, HEIGHT = 900, 700
+
+def _seconds(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def legacy_draw(G, pos):
+    """
+    Bisheriges Zeichnen: Aufbau mit networkx und vollständiges Rendern.
+    """
+    figure = Figure(figsize=(WIDTH / 100, HEIGHT / 100), dpi=100)
+    canvas = FigureCanvasAgg(figure)
+    ax = figure.add_subplot(111)
+    arrows = G.is_directed() and G.number_of_edges() <= MatplotlibCanvas.ARROW_EDGE_LIMIT
+    nx.draw_networkx_edges(G, pos=pos, ax=ax, edge_color='gray', arrows=arrows)
+    nx.draw_networkx_nodes(G, pos=pos, ax=ax, node_color='blue', node_size=50)
+    ax.set_axis_off()
+    canvas.draw()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", default=DEFAULT_FILES)
+    parser.add_argument("--nodes", type=int, nargs="*", default=[25000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    graphs = [(os.path.basename(path), load_file(path, write_graphml=False)[2]) for path in args.files]
+    graphs += [(f"barabasi_albert({n}, 2)", nx.barabasi_albert_graph(n, 2, seed=1)) for n in args.nodes]
+
+    for name, G in graphs:
+        pos = compute_layout(G)
+        legacy = _seconds(lambda: legacy_draw(G, pos), args.repeat)
+
+        canvas = MatplotlibCanvas(G, pos)
+        canvas.resize(WIDTH, HEIGHT)
+        app.processEvents()
+        current = _seconds(lambda: (canvas._show_all(), canvas.draw()), args.repeat)
+
+        ax = canvas.axes
+        x, y = ax.bbox.x0 + ax.bbox.width / 2, ax.bbox.y0 + ax.bbox.height / 2
+
+        def zoom():
+            canvas._on_scroll(MouseEvent("scroll_event", canvas, x, y, step=1))
+            canvas.draw()
+        zoom_step = _seconds(zoom, args.repeat)
+
+        canvas._on_press(MouseEvent("button_press_event", canvas, x, y, button=1))
+        pan_frame = _seconds(
+            lambda: canvas._on_motion(MouseEvent("motion_notify_event", canvas, x + 40, y + 25, button=1)),
+            args.repeat,
+        )
+        canvas._on_release(MouseEvent("button_release_event", canvas, x + 40, y + 25, button=1))
+
+        print(
+            f"{name} ({G.number_of_nodes()} Knoten, {G.number_of_edges()} Kanten): "
+            f"bisher {legacy:.2f} s, neu {current:.3f} s (Faktor {legacy / current:.1f}x), "
+            f"Zoomschritt {zoom_step * 1000:.0f} ms, Verschieben {pan_frame * 1000:.1f} ms je Bild",
+            flush=True,
+        )
+
+if __name__ == "__main__":
+    main()
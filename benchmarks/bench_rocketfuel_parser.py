@@ -0,0 +1,94 @@
+"""
+Benchmark: Rocketfuel-.cch-Parser (vorkompilierte Muster, ein split() je Zeile) gegen den
+bisherigen Parser mit unkompilierten re.search/re.findall-Aufrufen pro Zeile.
+
+Aufruf (aus dem Projektverzeichnis):
+    python benchmarks/bench_rocketfuel_parser.py [Dateien ...] [--repeat N]
+
+Ohne Dateiangabe werden datasets-testen/1755.cch und datasets-testen/4755.cch verwendet.
+Vor der Zeitmessung wird geprüft, dass beide Parser identische Ergebnisse liefern.
+"""
+import os
+import re
+import sys
+import argparse
+import timeit
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from backend.converters.rocketfuel_converter import parse_cch
+
+DEFAULT_FILES = [
+    os.path.join(ROOT, "datasets-testen", "1755.cch"),
+    os.path.join(ROOT, "datasets-testen", "4755.cch"),
+]
+
+def legacy_parse_cch(file_path):
+    """
+    Bisheriger Parser als Referenz (ohne die ungenutzten Zähler).
+    """
+    nodes = {}
+
+    with open(file_path, 'r') as file:
+        for line in file:
+            if line.startswith('-'):
+                continue
+
+            parts = line.strip().split()
+            uid = parts[0]
+            loc = parts[1]
+            derived_from_dns = '+' in parts
+            is_backbone = 'bb' in parts
+
+            num_neigh_match = re.search(r'\((\d+)\)', line)
+            num_neigh = int(num_neigh_match.group(1)) if num_neigh_match else 0
+
+            ext_conns_match = re.search(r'&(\d+)', line)
+            ext_conns = int(ext_conns_match.group(1)) if ext_conns_match else 0
+
+            neighbors = re.findall(r'<(\d+)>', line)
+            ext_neighbors = re.findall(r'{(\d+)}', line)
+
+            name_match = re.search(r'=(\S+)', line)
+            name = name_match.group(1) if name_match else ""
+
+            not_responded = '!' in line
+
+            rn_match = re.search(r'r(\d+)', line)
+            rn = int(rn_match.group(1)) if rn_match else 0
+
+            nodes[uid] = {
+                'loc': loc,
+                'derived_from_dns': derived_from_dns,
+                'is_backbone': is_backbone,
+                'num_neigh': num_neigh,
+                'ext_conns': ext_conns,
+                'name': name,
+                'not_responded': not_responded,
+                'rn': rn,
+                'neighbors': neighbors,
+                'ext_neighbors': ext_neighbors,
+            }
+
+    return nodes
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", default=DEFAULT_FILES)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    for file_path in args.files:
+        if legacy_parse_cch(file_path) != parse_cch(file_path):
+            sys.exit(f"Ergebnisse unterscheiden sich für {file_path}")
+
+        legacy = min(timeit.repeat(lambda: legacy_parse_cch(file_path), number=1, repeat=args.repeat))
+        current = min(timeit.repeat(lambda: parse_cch(file_path), number=1, repeat=args.repeat))
+        print(
+            f"{os.path.basename(file_path)}: bisher {legacy * 1000:.2f} ms, "
+            f"neu {current * 1000:.2f} ms, Faktor {legacy / current:.2f}x"
+        )
+
+if __name__ == "__main__":
+    main()
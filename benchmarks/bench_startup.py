@@ -0,0 +1,126 @@
+"""
+Benchmark: Programmstart der GUI (start.py).
+
+Misst in jeweils neuen Python-Prozessen
+  1. die Importzeit je Modul (python -X importtime) für "import start" und
+  2. die Zeit vom Prozessstart, bis das Hauptfenster angezeigt ist.
+
+Mit --eager werden zum Vergleich networkx, matplotlib (Qt-Backend), numpy und die
+Analyse-Pipeline vorab importiert, wie es vor dem verzögerten Laden beim Start geschah.
+
+Aufruf (aus dem Projektverzeichnis):
+    python benchmarks/bench_startup.py [--repeat N] [--top N] [--eager]
+
+Ohne Display wird die Qt-Plattform "offscreen" verwendet. Die Datenbank wird in einem
+temporären Verzeichnis angelegt.
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Module, die beim Start nicht geladen werden sollen
+HEAVY_MODULES = ("networkx", "matplotlib", "numpy", "scipy", "backend.pipeline", "backend.analyzers")
+
+EAGER_IMPORTS = (
+    "import networkx, numpy, matplotlib.pyplot; "
+    "import matplotlib.backends.backend_qt5agg; "
+    "import backend.pipeline; "
+)
+
+# Entspricht dem Hauptprogramm von start.py; beendet sich, sobald das Fenster angezeigt ist
+WINDOW_SCRIPT = """
+import sys
+{eager}
+from PyQt5.QtWidgets import QApplication
+from backend.database_handler import initialize_database
+from frontend.gui_main import NetworkAnalysisGUI
+
+app = QApplication(sys.argv)
+initialize_database("./network_analysis.db")
+gui = NetworkAnalysisGUI()
+gui.show()
+app.processEvents()
+print("READY", flush=True)
+"""
+
+def _environment():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    if not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY") and sys.platform.startswith("linux"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return env
+
+def import_times(eager, workdir):
+    """
+    Importzeiten aus "python -X importtime" als Liste (Modul, eigene µs, kumulierte µs).
+    """
+    code = (EAGER_IMPORTS if eager else "") + "import start"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=workdir, env=_environment(), capture_output=True, text=True, check=True,
+    )
+    times = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        times.append((module.strip(), int(self_us), int(cumulative_us)))
+    return times
+
+def time_to_window(eager, workdir):
+    """
+    Sekunden vom Start des Prozesses, bis das Hauptfenster angezeigt ist.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", WINDOW_SCRIPT.format(eager=EAGER_IMPORTS if eager else "")],
+        cwd=workdir, env=_environment(), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    for line in process.stdout:
+        if line.startswith("READY"):
+            elapsed = time.perf_counter() - start
+            break
+    else:
+        process.wait()
+        sys.exit("Hauptfenster wurde nicht angezeigt.")
+    process.stdout.close()
+    process.wait()
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Anzahl der angezeigten Module")
+    parser.add_argument("--eager", action="store_true", help="Schwere Module vorab importieren (Vergleich)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        times = import_times(args.eager, workdir)
+        total = sum(self_us for _, self_us, _ in times)
+        print(f"Importe für 'import start': {len(times)} Module, {total / 1000:.1f} ms")
+        print(f"{'eigene ms':>10} {'kumuliert ms':>13}  Modul")
+        for module, self_us, cumulative_us in sorted(times, key=lambda t: t[2], reverse=True)[:args.top]:
+            print(f"{self_us / 1000:>10.1f} {cumulative_us / 1000:>13.1f}  {module}")
+
+        modules = {module for module, _, _ in times}
+        heavy = [
+            prefix for prefix in HEAVY_MODULES
+            if any(module == prefix or module.startswith(prefix + ".") for module in modules)
+        ]
+        print("Beim Start geladene schwere Module:", ", ".join(heavy) if heavy else "keine")
+
+        # Der erste Lauf legt die Datenbank an und füllt Dateisystem-Caches
+        time_to_window(args.eager, workdir)
+        runs = [time_to_window(args.eager, workdir) for _ in range(args.repeat)]
+        print(
+            f"Zeit bis zum Hauptfenster: min {min(runs) * 1000:.0f} ms, "
+            f"Median {sorted(runs)[len(runs) // 2] * 1000:.0f} ms ({args.repeat} Läufe)"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -1,47 +1,35 @@
 # analysis_section.py
 
 import os
-import sqlite3
 
 from PyQt5.QtWidgets import (
-    QWidget, QTableWidget, QTableWidgetItem, QVBoxLayout, QPushButton,
+    QWidget, QTableView, QVBoxLayout, QPushButton,
     QLineEdit, QGroupBox, QFormLayout, QLabel, QComboBox, QSpinBox, QSlider,
     QCheckBox, QHBoxLayout, QToolButton, QMenu, QAction, QAbstractItemView
 )
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
+from PyQt5.QtCore import Qt
+
+from backend.database_handler import get_connection
+from backend.node_metrics import SUMMARY_COLUMNS
+from backend.search_index import SEARCH_TABLE, fts_query, has_search_index
+from frontend.components.query_scheduler import QueryScheduler
+from frontend.components.results_table_model import ResultsTableModel
 
 ##############################################################################
 # Datenbankpfad
 ##############################################################################
 DATABASE_PATH = "./network_analysis.db"
 
-##############################################################################
-# Worker-Klasse für asynchrone DB-Abfragen
-##############################################################################
-class DatabaseWorker(QThread):
-    results_ready = pyqtSignal(list)
-    error_occurred = pyqtSignal(str)
-    
-    def __init__(self, query, params=None, parent=None):
-        super().__init__(parent)
-        self.query = query
-        self.params = params if params is not None else []
-        
-    def run(self):
-        try:
-            print("DatabaseWorker startet...")
-            conn = sqlite3.connect(DATABASE_PATH)
-            cursor = conn.cursor()
-            print("Executing query:", self.query)
-            print("With parameters:", self.params)
-            cursor.execute(self.query, self.params)
-            results = cursor.fetchall()
-            print("Query returned:", results)
-            conn.close()
-            self.results_ready.emit(results)
-        except Exception as e:
-            print("Fehler in DatabaseWorker:", e)
-            self.error_occurred.emit(str(e))
+# Sortierspalte je Eintrag in "Sortieren nach" (immer absteigend).
+# "Relevanz" sortiert Treffer der Schnellsuche nach ihrem Rang im Volltextindex,
+# ohne Suchbegriff wie "Größe".
+SORT_COLUMNS = {
+    "Relevanz": "number_of_nodes",
+    "Größe": "number_of_nodes",
+    "Kanten": "number_of_edges",
+    "Dichte": "density",
+    "Zentralität": "pagerank_max",
+}
 
 ##############################################################################
 # AnalysisSection-Klasse
@@ -69,10 +57,11 @@ class AnalysisSection(QWidget):
             "is_connected", "is_strongly_connected", "is_weakly_connected",
             "node_connectivity", "edge_connectivity",
             "global_efficiency", "local_efficiency",
-            "graph_center", "degree_centrality", "betweenness_centrality",
-            "closeness_centrality", "pagerank",
+            "graph_center", *SUMMARY_COLUMNS,
             "diameter", "radius", "periphery", "density",
-            "is_tree", "is_forest", "is_bipartite", "is_planar", "is_multigraph"
+            "is_tree", "is_forest", "is_bipartite", "is_planar", "is_multigraph",
+            "centrality_mode", "centrality_sample_size", "centrality_error",
+            "metric_timings", "timed_out_metrics"
         ]
 
         # Spalten, die NICHT abwählbar sind
@@ -88,6 +77,15 @@ class AnalysisSection(QWidget):
         # Aktuell gewählte Spalten
         self.selected_columns = set(self.default_columns)
 
+        # Ein Worker-Thread für alle Abfragen dieser Ansicht
+        self.query_scheduler = QueryScheduler(DATABASE_PATH, parent=self)
+        self.query_scheduler.results_ready.connect(self.on_query_results)
+        self.query_scheduler.error_occurred.connect(lambda generation, message: self.handle_error(message))
+        self.pending_query = None
+
+        # Volltextindex gefunden? (siehe search_index_available())
+        self.search_index_found = False
+
         ######################################################################
         # 2) GUI-Aufbau
         ######################################################################
@@ -97,8 +95,9 @@ class AnalysisSection(QWidget):
         # A) Schnellsuche
         fast_search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("🔍 Schnellsuche: Projekt-/Dateiname...")
-        self.search_input.textChanged.connect(self.load_analysis_results)
+        self.search_input.setPlaceholderText("🔍 Schnellsuche: Projekt-/Dateiname, Knoten (z.B. Frankfurt)...")
+        # Tastendrücke erst nach einer kurzen Pause abfragen (siehe QueryScheduler)
+        self.search_input.textChanged.connect(lambda: self.query_scheduler.debounce(self.load_analysis_results))
         fast_search_layout.addWidget(self.search_input)
 
         self.fast_search_button = QPushButton("🔍")
@@ -222,7 +221,7 @@ class AnalysisSection(QWidget):
 
         # Sortieren nach
         self.sort_by_combo = QComboBox()
-        self.sort_by_combo.addItems(["Größe", "Kanten", "Dichte", "Zentralität"])
+        self.sort_by_combo.addItems(list(SORT_COLUMNS))
         self.sort_by_combo.currentIndexChanged.connect(self.load_analysis_results)
         adv_layout.addRow(QLabel("Sortieren nach:"), self.sort_by_combo)
 
@@ -242,15 +241,16 @@ class AnalysisSection(QWidget):
         self.status_label = QLabel("Bereit")
         main_layout.addWidget(self.status_label)
 
-        # Tabelle
-        self.data_table = QTableWidget()
+        # Tabelle (Zeilen werden beim Scrollen seitenweise nachgeladen)
+        self.table_model = ResultsTableModel(DATABASE_PATH, self)
+        self.table_model.error_occurred.connect(self.handle_error)
+        self.data_table = QTableView()
+        self.data_table.setModel(self.table_model)
         self.data_table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # Nicht editierbar
-        self.data_table.cellDoubleClicked.connect(self.on_cell_double_clicked)
+        self.data_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.data_table.doubleClicked.connect(self.on_cell_double_clicked)
         main_layout.addWidget(self.data_table)
 
-        # Worker
-        self.worker = None
-
         # Start
         self.load_analysis_results()
 
@@ -312,23 +312,105 @@ class AnalysisSection(QWidget):
     ##########################################################################
     def load_analysis_results(self):
         """
-        Baut die SQL-Abfrage dynamisch (Filter) und wählt IMMER alle Spalten.
-        Zeigt in der Tabelle nur self.selected_columns (inkl. forced_columns).
+        Setzt Filter, Spalten und Sortierung des Tabellenmodells neu. Abgefragt werden nur
+        self.selected_columns (inkl. forced_columns) in der Reihenfolge von self.all_columns;
+        weitere Zeilen lädt das Modell beim Scrollen nach.
+
+        Erste Seite und Trefferzahl werden im QueryScheduler gelesen; eine neue Suche
+        verwirft bzw. unterbricht die Abfragen der vorherigen.
         """
         self.status_label.setText("Lade Ergebnisse...")
-        params = []
+        conditions, params = self.build_filter_conditions()
+        search = self.build_search()
+        sort_by = self.sort_by_combo.currentText()
+        ranked = search is not None and search[0] == "fts" and sort_by == "Relevanz"
+
+        # forced_columns sind sowieso in selected_columns,
+        # da wir die Actions disabled haben
+        displayed_cols = [c for c in self.all_columns if c in self.selected_columns]
+        sort_column = SORT_COLUMNS.get(sort_by, "number_of_nodes")
+
+        # Treffer der Schnellsuche: nach Relevanz über den Join mit dem Volltextindex,
+        # sonst als zusätzliche Bedingung
+        count_conditions, count_params = list(conditions), list(params)
+        if search is not None:
+            count_conditions.append(search[1])
+            count_params.extend(search[2])
+            if not ranked:
+                conditions, params = count_conditions, count_params
+        fts_match = search[2][0] if ranked else None
+
+        print("Filter:", conditions)
+        print("Params:", params)
+
+        generation = self.query_scheduler.new_generation()
+        self.pending_query = (displayed_cols, conditions, params, sort_column, fts_match)
+
+        page_query, page_params = ResultsTableModel.first_page_query(
+            displayed_cols, conditions, params, sort_column, fts_match
+        )
+        self.query_scheduler.submit(generation, "page", page_query, page_params)
+
+        # Gesamtzahl der Treffer für die Statusanzeige
+        count_query = "SELECT COUNT(*) FROM analysis_results"
+        if count_conditions:
+            count_query += " WHERE " + " AND ".join(count_conditions)
+        self.query_scheduler.submit(generation, "count", count_query, count_params)
+
+    def on_query_results(self, generation, tag, rows):
+        """
+        Ergebnisse der aktuellen Generation (ältere verwirft der QueryScheduler).
+        """
+        if tag == "page":
+            columns, conditions, params, sort_column, fts_match = self.pending_query
+            self.table_model.set_query(columns, conditions, params, sort_column, first_page=rows, search=fts_match)
+        elif tag == "count":
+            self.update_status(rows)
+
+    def build_search(self):
+        """
+        Bedingung der Schnellsuche: Präfixsuche im Volltextindex über Projekt, Dateiname
+        und Knotenbezeichnungen, ohne Index (oder ohne Wort in der Eingabe) LIKE auf
+        Projekt- und Dateiname.
+
+        Rückgabe:
+          tuple: ("fts" oder "like", Bedingung, Parameterliste) oder None ohne Suchbegriff.
+        """
+        search_text = self.search_input.text().strip()
+        if not search_text:
+            return None
+        match = fts_query(search_text) if self.search_index_available() else None
+        if match is not None:
+            return ("fts", f"id IN (SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH ?)", [match])
+        like_param = f"%{search_text}%"
+        return ("like", "(Project_name LIKE ? OR File_name LIKE ?)", [like_param, like_param])
+
+    def search_index_available(self):
+        """
+        Prüft, ob der Volltextindex existiert. Er fehlt, wenn SQLite ohne FTS5 übersetzt
+        wurde, oder solange die Datenbank noch nicht (von der Pipeline oder der
+        Kommandozeile) auf die aktuelle Schemaversion migriert ist. Daher wird bei jeder
+        Suche erneut geprüft, bis der Index gefunden wurde; er wird nicht wieder entfernt.
+        """
+        if not self.search_index_found:
+            try:
+                self.search_index_found = has_search_index(get_connection(DATABASE_PATH))
+            except Exception:
+                return False
+        return self.search_index_found
+
+    def build_filter_conditions(self):
+        """
+        Liefert die SQL-Bedingungen und Parameter der erweiterten Filter
+        (die Schnellsuche liefert build_search()).
 
-        # SELECT-Liste = alle Spalten
-        select_clause = ", ".join(self.all_columns)
-        query = f"SELECT {select_clause} FROM analysis_results"
+        Rückgabe:
+          tuple: (conditions, params)
+        """
+        params = []
 
         # Bedingungen
         conditions = []
-        search_text = self.search_input.text().strip()
-        if search_text:
-            conditions.append("(Project_name LIKE ? OR File_name LIKE ?)")
-            like_param = f"%{search_text}%"
-            params.extend([like_param, like_param])
 
         # Knotenfilter
         node_min = self.node_min_spin.value()
@@ -377,7 +459,10 @@ class AnalysisSection(QWidget):
         # PageRank
         if self.pagerank_slider.value() > 0:
             pr_value = self.pagerank_slider.value() / 100.0
-            conditions.append("pagerank >= ?")
+            # Graphen mit mindestens einem Knoten über dem Schwellwert (Index auf node_metrics)
+            conditions.append(
+                "id IN (SELECT graph_id FROM node_metrics WHERE metric = 'pagerank' AND value >= ?)"
+            )
             params.append(pr_value)
 
         # Netzwerkstruktur
@@ -397,53 +482,11 @@ class AnalysisSection(QWidget):
             conditions.append("is_multigraph = ?")
             params.append(1)
 
-        # Zusammensetzen
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        # Sortierung
-        sort_by = self.sort_by_combo.currentText()
-        if sort_by == "Größe":
-            query += " ORDER BY number_of_nodes DESC"
-        elif sort_by == "Kanten":
-            query += " ORDER BY number_of_edges DESC"
-        elif sort_by == "Dichte":
-            query += " ORDER BY density DESC"
-        elif sort_by == "Zentralität":
-            query += " ORDER BY pagerank DESC"
-
-        print("Final query:", query)
-        print("Params:", params)
+        return conditions, params
 
-        self.worker = DatabaseWorker(query, params)
-        self.worker.results_ready.connect(self.update_table)
-        self.worker.error_occurred.connect(self.handle_error)
-        self.worker.start()
-
-    def update_table(self, results):
-        """
-        results: Liste von Tupeln, je Zeile hat len(self.all_columns) Elemente.
-        Wir zeigen nur self.selected_columns + forced_columns in der Reihenfolge self.all_columns.
-        """
-        print("update_table wird aufgerufen mit Ergebnissen:", results)
-
-        # forced_columns sind sowieso in selected_columns, 
-        # da wir die Actions disabled haben
-        displayed_cols = [c for c in self.all_columns if c in self.selected_columns]
-
-        self.data_table.clearContents()
-        self.data_table.setRowCount(len(results))
-        self.data_table.setColumnCount(len(displayed_cols))
-        self.data_table.setHorizontalHeaderLabels(displayed_cols)
-
-        for row_idx, row_data in enumerate(results):
-            for col_idx, col_name in enumerate(displayed_cols):
-                full_index = self.all_columns.index(col_name)
-                value = row_data[full_index]
-                item = QTableWidgetItem(str(value))
-                self.data_table.setItem(row_idx, col_idx, item)
-
-        self.status_label.setText(f"Ergebnisse geladen: {len(results)} Einträge gefunden.")
+    def update_status(self, results):
+        total = results[0][0] if results else 0
+        self.status_label.setText(f"Ergebnisse geladen: {total} Einträge gefunden.")
 
     ##########################################################################
     # Erweitertes Filterpanel ein-/ausblenden
@@ -487,24 +530,20 @@ class AnalysisSection(QWidget):
     ##########################################################################
     # Doppelklick
     ##########################################################################
-    def on_cell_double_clicked(self, row, column):
+    def on_cell_double_clicked(self, index):
         """
         Wird aufgerufen, wenn man in der Tabelle doppelklickt.
         Da 'File_name' erzwungen ist, sollte es immer in self.selected_columns sein.
         """
-        displayed_cols = [c for c in self.all_columns if c in self.selected_columns]
-        try:
-            file_col_index = displayed_cols.index("File_name")
-        except ValueError:
+        if "File_name" not in self.table_model.columns():
             self.status_label.setText("Spalte 'File_name' ist nicht sichtbar! (sollte unmöglich sein)")
             return
 
-        file_item = self.data_table.item(row, file_col_index)
-        if not file_item:
+        filename = self.table_model.value(index.row(), "File_name")
+        if not filename:
             self.status_label.setText("Kein Dateiname in der ausgewählten Zeile gefunden.")
             return
 
-        filename = file_item.text()
         base_dir = "temp_uploads"
         full_path = os.path.join(base_dir, filename)
 
@@ -523,23 +562,12 @@ class AnalysisSection(QWidget):
     # Beispiel, um Tabellendaten zu exportieren
     ##########################################################################
     def get_analysis_data(self):
-        data = []
-        row_count = self.data_table.rowCount()
-        col_count = self.data_table.columnCount()
-
-        headers = []
-        for c in range(col_count):
-            header_item = self.data_table.horizontalHeaderItem(c)
-            if header_item:
-                headers.append(header_item.text())
-            else:
-                headers.append(f"Spalte_{c}")
-
-        for r in range(row_count):
-            row_dict = {}
-            for c in range(col_count):
-                item = self.data_table.item(r, c)
-                row_dict[headers[c]] = item.text() if item else ""
-            data.append(row_dict)
-
-        return data
+        """
+        Liefert alle Zeilen zum aktuellen Filter als Liste von Dictionaries (auch die
+        noch nicht in die Tabelle geladenen Seiten).
+        """
+        try:
+            return self.table_model.all_rows()
+        except Exception as e:
+            self.handle_error(str(e))
+            return self.table_model.loaded_rows()
@@ -0,0 +1,186 @@
+# frontend/components/community_layout.py
+#
+# Aggregiertes Layout für große Graphen: Der Graph wird in Communities zerlegt, der
+# Quotientengraph (ein Super-Knoten je Community, Kantengewicht = Anzahl der Kanten
+# zwischen zwei Communities) wird mit spring_layout angeordnet, und die Knoten jeder
+# Community werden in einer Kreisscheibe um ihren Super-Knoten verteilt.
+#
+# Statt eines spring_layout über alle n Knoten (O(n²) je Iteration) wird nur der
+# Quotientengraph mit wenigen hundert Super-Knoten iterativ angeordnet.
+
+import math
+from collections import Counter
+
+import networkx as nx
+import numpy as np
+
+# Fester Seed, damit sich das Layout beim erneuten Öffnen nicht ändert
+LAYOUT_SEED = 42
+
+# Bis zu dieser Knotenzahl wird Louvain direkt auf dem Graphen ausgeführt. Darüber wird
+# der Graph zuerst per (asynchroner) Label Propagation vergröbert und Louvain auf dem
+# gewichteten Quotientengraphen der Label-Propagation-Communities ausgeführt.
+LOUVAIN_NODE_LIMIT = 5000
+
+# Höchstzahl angezeigter Communities und Mindestgröße (Anteil der Knoten, mindestens 2).
+# Kleinere Communities werden zu einer Restgruppe zusammengefasst, z.B. isolierte Knoten,
+# die sonst jeweils eine eigene Community bilden.
+MAX_COMMUNITIES = 300
+MIN_COMMUNITY_FRACTION = 0.001
+
+# Anteil der Layoutfläche, den die Kreisscheiben der Communities insgesamt einnehmen
+CLUSTER_AREA_FRACTION = 0.3
+
+# Goldener Winkel für die Sonnenblumen-Anordnung der Knoten in einer Community
+_GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+def detect_communities(G, seed=LAYOUT_SEED):
+    """
+    Zerlegt den Graphen in Communities (Richtungen und Mehrfachkanten werden ignoriert).
+
+    Rückgabe:
+      list: Knotenmengen, absteigend nach Größe sortiert.
+    """
+    U = G.to_undirected(as_view=True) if G.is_directed() else G
+    if U.is_multigraph():
+        U = nx.Graph(U)
+    if U.number_of_nodes() <= LOUVAIN_NODE_LIMIT:
+        communities = nx.community.louvain_communities(U, seed=seed)
+    else:
+        coarse = list(nx.community.asyn_lpa_communities(U, seed=seed))
+        Q = quotient_graph(U, coarse)
+        merged = nx.community.louvain_communities(Q, weight="weight", seed=seed)
+        communities = [set().union(*(coarse[i] for i in group)) for group in merged]
+    return sorted(communities, key=len, reverse=True)
+
+def limit_communities(communities, max_communities=MAX_COMMUNITIES, min_fraction=MIN_COMMUNITY_FRACTION):
+    """
+    Behält höchstens max_communities - 1 Communities mit mindestens min_fraction aller
+    Knoten (und mindestens 2 Knoten) und fasst alle übrigen zu einer Restgruppe
+    (letzter Eintrag) zusammen. Erwartet die Communities absteigend nach Größe sortiert.
+    """
+    total = sum(len(members) for members in communities)
+    min_size = max(2, math.ceil(total * min_fraction))
+    kept = [members for members in communities[:max_communities - 1] if len(members) >= min_size]
+    if len(kept) == len(communities):
+        return communities
+    rest = set().union(*communities[len(kept):])
+    return kept + [rest]
+
+def quotient_graph(G, communities):
+    """
+    Quotientengraph: Knoten i steht für communities[i] (Attribut "size"), das Kantengewicht
+    "weight" zählt die Kanten zwischen zwei Communities; Kanten innerhalb einer Community
+    ergeben eine Schleife (wird von Louvain als interne Kantenmasse verwendet).
+    """
+    community_of = {node: i for i, members in enumerate(communities) for node in members}
+    weights = Counter()
+    for u, v in G.edges():
+        a, b = community_of[u], community_of[v]
+        weights[(a, b) if a <= b else (b, a)] += 1
+    Q = nx.Graph()
+    Q.add_nodes_from((i, {"size": len(members)}) for i, members in enumerate(communities))
+    Q.add_weighted_edges_from((a, b, weight) for (a, b), weight in weights.items())
+    return Q
+
+class AggregatedLayout:
+    """
+    Ergebnis von compute_aggregated_layout.
+
+    Attribute:
+      communities (list): Knotenmengen je Super-Knoten (Index = Community-Nummer).
+      quotient (networkx.Graph): Quotientengraph ohne Schleifen.
+      centers (numpy.ndarray): Mittelpunkte der Super-Knoten, Form (k, 2).
+      radii (numpy.ndarray): Radien der Kreisscheiben, Form (k,).
+      pos (dict): Position jedes Knotens {node: (x, y)} innerhalb seiner Kreisscheibe.
+    """
+
+    def __init__(self, communities, quotient, centers, radii, pos):
+        self.communities = communities
+        self.quotient = quotient
+        self.centers = centers
+        self.radii = radii
+        self.pos = pos
+
+    def community_at(self, x, y):
+        """
+        Nummer der Community, deren Kreisscheibe den Punkt (x, y) enthält (bei
+        Überlappung die nächstgelegene), oder None.
+        """
+        if len(self.centers) == 0:
+            return None
+        distances = np.hypot(self.centers[:, 0] - x, self.centers[:, 1] - y)
+        inside = np.flatnonzero(distances <= self.radii)
+        if len(inside) == 0:
+            return None
+        return int(inside[np.argmin(distances[inside] / self.radii[inside])])
+
+def _quotient_positions(quotient, seed):
+    """
+    Ordnet die Super-Knoten an. Die Zusammenhangskomponenten des Quotientengraphen werden
+    einzeln mit spring_layout angeordnet: die größte (nach Knotenzahl) im Quadrat [-1, 1]²,
+    die übrigen (z.B. die Restgruppe isolierter Knoten) in Reihen darunter, jeweils in einer
+    Fläche proportional zu ihrer Knotenzahl. Ein gemeinsames spring_layout würde die
+    Komponenten auseinandertreiben und die größte auf einen Bruchteil der Fläche stauchen.
+    """
+    def size(component):
+        return sum(quotient.nodes[i]["size"] for i in component)
+
+    components = sorted(nx.connected_components(quotient), key=size, reverse=True)
+    total = max(sum(size(component) for component in components), 1)
+    positions = nx.spring_layout(quotient.subgraph(components[0]), weight="weight", seed=seed)
+
+    gap = 0.15
+    x, y, row_height = -1.0, -1.0 - gap, 0.0
+    for component in components[1:]:
+        width = max(2 * math.sqrt(size(component) / total), 0.05)
+        if x + width > 1.0 and x > -1.0:
+            x, y, row_height = -1.0, y - row_height - gap, 0.0
+        center = (x + width / 2, y - width / 2)
+        if len(component) == 1:
+            positions[next(iter(component))] = np.array(center)
+        else:
+            positions.update(nx.spring_layout(
+                quotient.subgraph(component), weight="weight", seed=seed, center=center, scale=width / 2
+            ))
+        x += width + gap
+        row_height = max(row_height, width)
+    return positions
+
+def _member_positions(G, members, center, radius):
+    """
+    Verteilt die Knoten einer Community gleichmäßig (Sonnenblumen-Muster) in ihrer
+    Kreisscheibe; Knoten mit hohem Grad liegen innen.
+    """
+    ordered = sorted(members, key=G.degree, reverse=True)
+    k = np.arange(len(ordered))
+    r = radius * np.sqrt((k + 0.5) / len(ordered))
+    theta = k * _GOLDEN_ANGLE
+    xs = center[0] + r * np.cos(theta)
+    ys = center[1] + r * np.sin(theta)
+    return {node: (x, y) for node, x, y in zip(ordered, xs, ys)}
+
+def compute_aggregated_layout(G, seed=LAYOUT_SEED):
+    """
+    Berechnet das aggregierte Layout eines Graphen.
+
+    Rückgabe:
+      AggregatedLayout
+    """
+    communities = limit_communities(detect_communities(G, seed=seed))
+    print(f"Aggregiertes Layout: {G.number_of_nodes()} Knoten in {len(communities)} Communities.")
+
+    quotient = quotient_graph(G, communities)
+    quotient.remove_edges_from(list(nx.selfloop_edges(quotient)))
+    positions = _quotient_positions(quotient, seed)
+    centers = np.array([positions[i] for i in range(len(communities))], dtype=float).reshape(-1, 2)
+
+    # Fläche der Kreisscheiben proportional zur Größe der Community; spring_layout skaliert auf [-1, 1]²
+    sizes = np.array([len(members) for members in communities], dtype=float)
+    scale = math.sqrt(CLUSTER_AREA_FRACTION * 4 / (math.pi * max(sizes.sum(), 1)))
+    radii = scale * np.sqrt(sizes)
+
+    pos = {}
+    for members, center, radius in zip(communities, centers, radii):
+        pos.update(_member_positions(G, members, center, radius))
+    return AggregatedLayout(communities, quotient, centers, radii, pos)
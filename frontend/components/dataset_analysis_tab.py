@@ -3,15 +3,13 @@
 import os
 import json
 import sqlite3
-import numpy as np
 
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox,
     QMessageBox, QFileDialog, QTabWidget, QToolButton, QMenu, QAction
 )
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from backend.dataset_aggregates import GRAPH_COUNT, aggregate_query
 
 ##############################################################################
 # 1) Globaler Datenbankpfad
@@ -112,19 +110,18 @@ class DatasetAnalysisTab(QWidget):
         # Tab 1: Diagramm 1 ([0..1])
         self.tab1 = QWidget()
         self.tab1_layout = QVBoxLayout(self.tab1)
-        self.fig1 = Figure(figsize=(5,3))
-        self.canvas1 = FigureCanvas(self.fig1)
-        self.tab1_layout.addWidget(self.canvas1)
         self.diag_tabwidget.addTab(self.tab1, "Diagramm [0..1]")
 
         # Tab 2: Diagramm 2 (Reelle Zahlen)
         self.tab2 = QWidget()
         self.tab2_layout = QVBoxLayout(self.tab2)
-        self.fig2 = Figure(figsize=(5,3))
-        self.canvas2 = FigureCanvas(self.fig2)
-        self.tab2_layout.addWidget(self.canvas2)
         self.diag_tabwidget.addTab(self.tab2, "Diagramm (Reelle Zahlen)")
 
+        # Die Matplotlib-Canvases werden erst angelegt, wenn der Tab zum ersten Mal
+        # angezeigt wird (siehe create_canvases), damit matplotlib den Programmstart nicht verzögert
+        self.fig1 = self.fig2 = None
+        self.canvas1 = self.canvas2 = None
+
         self.diag_tabwidget.currentChanged.connect(self.on_diagram_tab_changed)
 
         # -----------------------
@@ -172,6 +169,27 @@ class DatasetAnalysisTab(QWidget):
         # Beim Start
         self.on_diagram_tab_changed(0)
 
+    def showEvent(self, event):
+        self.create_canvases()
+        super().showEvent(event)
+
+    def create_canvases(self):
+        """
+        Legt die beiden Diagramm-Canvases beim ersten Aufruf an (importiert matplotlib).
+        """
+        if self.canvas1 is not None:
+            return
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
+        self.fig1 = Figure(figsize=(5,3))
+        self.canvas1 = FigureCanvas(self.fig1)
+        self.tab1_layout.addWidget(self.canvas1)
+
+        self.fig2 = Figure(figsize=(5,3))
+        self.canvas2 = FigureCanvas(self.fig2)
+        self.tab2_layout.addWidget(self.canvas2)
+
     # -----------------------------------------------------------------------
     # 1) DB-Abfrage (Single vs. Alle)
     # -----------------------------------------------------------------------
@@ -183,39 +201,36 @@ class DatasetAnalysisTab(QWidget):
             self.load_single_dataset(selected_source)
 
     def load_all_datasets_grouped(self):
-        query = """
-        SELECT
-          Project_name,
-          AVG(CAST(is_connected AS FLOAT)) as is_connected_avg,
-          AVG(density) as density_avg,
-          AVG(CAST(is_tree AS FLOAT)) as is_tree_avg,
-          AVG(CAST(is_forest AS FLOAT)) as is_forest_avg,
-          AVG(CAST(is_bipartite AS FLOAT)) as is_bipartite_avg,
-          AVG(CAST(is_planar AS FLOAT)) as is_planar_avg,
-          AVG(CAST(is_multigraph AS FLOAT)) as is_multigraph_avg,
-          AVG(global_efficiency) as global_efficiency,
-          AVG(local_efficiency) as local_efficiency,
-          AVG(degree_centrality) as degree_centrality,
-          AVG(betweenness_centrality) as betweenness_centrality,
-          AVG(closeness_centrality) as closeness_centrality,
-          AVG(pagerank) as pagerank,
-
-          AVG(node_connectivity) as node_connectivity,
-          AVG(edge_connectivity) as edge_connectivity,
-          AVG(diameter) as diameter,
-          AVG(radius) as radius,
-          AVG(number_of_nodes) as number_of_nodes,
-          AVG(number_of_edges) as number_of_edges,
-
-          COUNT(*) as graph_count,
-          SUM(CAST(is_tree AS INT)) as tree_count,
-          SUM(CAST(is_forest AS INT)) as forest_count,
-          SUM(CAST(is_bipartite AS INT)) as bipartite_count,
-          SUM(CAST(is_multigraph AS INT)) as multigraph_count,
-          SUM(CAST(is_planar AS INT)) as planar_count
-        FROM analysis_results
-        GROUP BY Project_name
-        """
+        # Liest die materialisierten Kennzahlen (eine Zeile je Datensatz und Metrik)
+        query = aggregate_query([
+            ("is_connected", "mean", "is_connected_avg"),
+            ("density", "mean", "density_avg"),
+            ("is_tree", "mean", "is_tree_avg"),
+            ("is_forest", "mean", "is_forest_avg"),
+            ("is_bipartite", "mean", "is_bipartite_avg"),
+            ("is_planar", "mean", "is_planar_avg"),
+            ("is_multigraph", "mean", "is_multigraph_avg"),
+            ("global_efficiency", "mean", "global_efficiency"),
+            ("local_efficiency", "mean", "local_efficiency"),
+            ("degree_centrality_mean", "mean", "degree_centrality"),
+            ("betweenness_centrality_mean", "mean", "betweenness_centrality"),
+            ("closeness_centrality_mean", "mean", "closeness_centrality"),
+            ("pagerank_mean", "mean", "pagerank"),
+
+            ("node_connectivity", "mean", "node_connectivity"),
+            ("edge_connectivity", "mean", "edge_connectivity"),
+            ("diameter", "mean", "diameter"),
+            ("radius", "mean", "radius"),
+            ("number_of_nodes", "mean", "number_of_nodes"),
+            ("number_of_edges", "mean", "number_of_edges"),
+
+            (GRAPH_COUNT, "count", "graph_count"),
+            ("is_tree", "sum", "tree_count"),
+            ("is_forest", "sum", "forest_count"),
+            ("is_bipartite", "sum", "bipartite_count"),
+            ("is_multigraph", "sum", "multigraph_count"),
+            ("is_planar", "sum", "planar_count"),
+        ])
         self.worker = DatabaseWorker(query)
         self.worker.results_ready.connect(self.on_results_ready_all)
         self.worker.error_occurred.connect(self.on_error)
@@ -231,41 +246,38 @@ class DatasetAnalysisTab(QWidget):
         # Interpretations-Methoden 
 
     def load_single_dataset(self, source):
-        query = f"""
-        SELECT
-            /* Anzahl / Counts */
-            COUNT(*) as total_graphs,
-            SUM(CAST(is_bipartite AS INT)) as bipartite_count,
-            SUM(CAST(is_multigraph AS INT)) as multigraph_count,
-            SUM(CAST(is_tree AS INT)) as tree_count,
-            SUM(CAST(is_forest AS INT)) as forest_count,
-            SUM(CAST(is_planar AS INT)) as planar_count,
-
-            /* [0..1] AVG-Werte */
-            AVG(CAST(is_connected AS FLOAT)) as is_connected_avg,
-            AVG(density) as density_avg,
-            AVG(CAST(is_tree AS FLOAT)) as is_tree_avg,
-            AVG(CAST(is_forest AS FLOAT)) as is_forest_avg,
-            AVG(CAST(is_bipartite AS FLOAT)) as is_bipartite_avg,
-            AVG(CAST(is_planar AS FLOAT)) as is_planar_avg,
-            AVG(CAST(is_multigraph AS FLOAT)) as is_multigraph_avg,
-            AVG(global_efficiency) as global_efficiency,
-            AVG(local_efficiency) as local_efficiency,
-            AVG(degree_centrality) as degree_centrality,
-            AVG(betweenness_centrality) as betweenness_centrality,
-            AVG(closeness_centrality) as closeness_centrality,
-            AVG(pagerank) as pagerank,
-
-            /* Reelle Zahlen */
-            AVG(node_connectivity) as node_connectivity,
-            AVG(edge_connectivity) as edge_connectivity,
-            AVG(diameter) as diameter,
-            AVG(radius) as radius,
-            AVG(number_of_nodes) as number_of_nodes,
-            AVG(number_of_edges) as number_of_edges
-        FROM analysis_results
-        WHERE Project_name = ?
-        """
+        query = aggregate_query([
+            # Anzahl / Counts
+            (GRAPH_COUNT, "count", "total_graphs"),
+            ("is_bipartite", "sum", "bipartite_count"),
+            ("is_multigraph", "sum", "multigraph_count"),
+            ("is_tree", "sum", "tree_count"),
+            ("is_forest", "sum", "forest_count"),
+            ("is_planar", "sum", "planar_count"),
+
+            # [0..1] AVG-Werte
+            ("is_connected", "mean", "is_connected_avg"),
+            ("density", "mean", "density_avg"),
+            ("is_tree", "mean", "is_tree_avg"),
+            ("is_forest", "mean", "is_forest_avg"),
+            ("is_bipartite", "mean", "is_bipartite_avg"),
+            ("is_planar", "mean", "is_planar_avg"),
+            ("is_multigraph", "mean", "is_multigraph_avg"),
+            ("global_efficiency", "mean", "global_efficiency"),
+            ("local_efficiency", "mean", "local_efficiency"),
+            ("degree_centrality_mean", "mean", "degree_centrality"),
+            ("betweenness_centrality_mean", "mean", "betweenness_centrality"),
+            ("closeness_centrality_mean", "mean", "closeness_centrality"),
+            ("pagerank_mean", "mean", "pagerank"),
+
+            # Reelle Zahlen
+            ("node_connectivity", "mean", "node_connectivity"),
+            ("edge_connectivity", "mean", "edge_connectivity"),
+            ("diameter", "mean", "diameter"),
+            ("radius", "mean", "radius"),
+            ("number_of_nodes", "mean", "number_of_nodes"),
+            ("number_of_edges", "mean", "number_of_edges"),
+        ], by_project=False)
         self.worker = DatabaseWorker(query, [source])
         self.worker.results_ready.connect(self.on_results_ready_single)
         self.worker.error_occurred.connect(self.on_error)
@@ -321,6 +333,7 @@ class DatasetAnalysisTab(QWidget):
     def update_charts_single(self):
         if not self.last_results:
             return
+        self.create_canvases()
         single_dict = self.last_results[0]
 
         current_tab = self.diag_tabwidget.currentIndex()
@@ -366,6 +379,8 @@ class DatasetAnalysisTab(QWidget):
     def update_charts_all(self):
         if not self.last_results:
             return
+        self.create_canvases()
+        import numpy as np
 
         current_tab = self.diag_tabwidget.currentIndex()
         if current_tab == 0:
@@ -0,0 +1,373 @@
+# frontend/components/graph_canvas.py
+#
+# Matplotlib-Canvas der Visualisierung. Eigenes Modul, damit matplotlib erst beim ersten
+# Zeichnen eines Graphen importiert wird und nicht schon beim Programmstart.
+
+import networkx as nx
+import numpy as np
+from matplotlib import colormaps
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle
+from PyQt5.QtCore import QTimer, pyqtSignal
+
+class MatplotlibCanvas(FigureCanvas):
+    """
+    Zeichnet einen Graphen mit festem Layout aus NumPy-Arrays der Positionen:
+      - alle Kanten als eine LineCollection, alle Knoten als eine PathCollection (scatter),
+      - nur Knoten und Kanten im aktuellen Ausschnitt: Knoten per Bereichsabfrage im k-d-Baum
+        über die Positionen, Kanten, deren Begrenzungsrechteck den Ausschnitt schneidet,
+      - Detailstufen: Kanten, die im aktuellen Ausschnitt kürzer als ein Knotenpunkt sind,
+        liegen vollständig unter ihren beiden Knoten und werden weggelassen; sind danach noch
+        mehr als MAX_DRAWN_EDGES Kanten übrig, wird eine feste Stichprobe gezeichnet.
+    Navigation: Mausrad zoomt um den Mauszeiger, Ziehen mit der linken Maustaste verschiebt
+    den Ausschnitt, Doppelklick zeigt wieder den ganzen Graphen. Beim Ziehen wird nur das
+    zuletzt gezeichnete Bild verschoben (Blitting), neu gezeichnet wird beim Loslassen.
+    Der Knoten unter dem Mauszeiger (nächster Nachbar im k-d-Baum) wird über node_hovered
+    gemeldet (None, sobald kein Knoten mehr getroffen wird), ein Klick über node_clicked.
+    """
+
+    node_hovered = pyqtSignal(object)
+    node_clicked = pyqtSignal(object)
+
+    # Pfeile (einzelne Patches) nur bis zu dieser Kantenzahl, darüber eine LineCollection
+    ARROW_EDGE_LIMIT = 2000
+
+    # Höchstzahl gezeichneter Kanten; beim Zoomen zunächst weniger, die volle Detailstufe
+    # folgt REFINE_DELAY_MS nach dem letzten Mausrad-Schritt
+    MAX_DRAWN_EDGES = 15000
+    INTERACTIVE_EDGES = 3000
+    REFINE_DELAY_MS = 250
+
+    # Kürzere Kanten (in Pixeln) werden nie gezeichnet
+    MIN_EDGE_PIXELS = 1.0
+
+    # Zoomfaktor je Mausrad-Schritt
+    ZOOM_STEP = 1.25
+
+    # Ein Knoten gilt als getroffen, wenn der Mauszeiger höchstens so viele Pixel außerhalb
+    # seines Punktes liegt; eine Mausbewegung bis DRAG_PIXELS zählt noch als Klick
+    HIT_PIXELS = 3.0
+    DRAG_PIXELS = 3.0
+
+    def __init__(self, G, pos, parent=None, equal_aspect=False):
+        self.figure = Figure()
+        super(MatplotlibCanvas, self).__init__(self.figure)
+        self.setParent(parent)
+        self.G = G
+        self.pos = pos
+        # Gleicher Maßstab auf beiden Achsen (z.B. für geografische Layouts)
+        self.equal_aspect = equal_aspect
+
+        self.nodes = list(G)
+        index = {node: i for i, node in enumerate(self.nodes)}
+        self._edge_index = np.array([(index[u], index[v]) for u, v in G.edges()], dtype=np.int64).reshape(-1, 2)
+        # Feste Zufallsreihenfolge der Kanten für die Stichprobe, damit sich das Bild beim
+        # Zoomen nicht von Bild zu Bild ändert
+        self._edge_order = np.random.default_rng(0).permutation(len(self._edge_index))
+        self.arrows = G.is_directed() and len(self._edge_index) <= self.ARROW_EDGE_LIMIT
+        # Knotengröße (Fläche in pt²) nimmt bei großen Graphen ab
+        self.node_size = min(50.0, max(2.0, 50.0 * np.sqrt(500 / max(len(self.nodes), 1))))
+        self._set_points(pos)
+
+        # Zustand beim Verschieben: Startpunkt, Achsengrenzen und gesicherte Bildbereiche
+        self._pan = None
+        self._hovered = None
+        self._refine_timer = QTimer(self)
+        self._refine_timer.setSingleShot(True)
+        self._refine_timer.timeout.connect(self._refine)
+
+        self._draw_graph()
+        self.mpl_connect("scroll_event", self._on_scroll)
+        self.mpl_connect("button_press_event", self._on_press)
+        self.mpl_connect("motion_notify_event", self._on_motion)
+        self.mpl_connect("button_release_event", self._on_release)
+        self.mpl_connect("figure_leave_event", lambda event: self._set_hovered(None))
+        self.mpl_connect("resize_event", lambda event: self._update_visible(self.MAX_DRAWN_EDGES))
+
+    def _set_points(self, pos):
+        self.points = np.array([pos[node] for node in self.nodes], dtype=float).reshape(-1, 2)
+        sources, targets = self.points[self._edge_index[:, 0]], self.points[self._edge_index[:, 1]]
+        # Kantenvektoren für die Längenprüfung der Detailstufen, Begrenzungsrechtecke für den Ausschnitt
+        self._edge_vectors = targets - sources
+        self._edge_low = np.minimum(sources, targets)
+        self._edge_high = np.maximum(sources, targets)
+        self._bounds = (self.points.min(axis=0), self.points.max(axis=0)) if len(self.points) else None
+        # k-d-Baum über die Positionen, beim ersten Gebrauch aufgebaut
+        self._tree = None
+
+    def _spatial_index(self):
+        if self._tree is None:
+            from scipy.spatial import cKDTree
+            self._tree = cKDTree(self.points)
+        return self._tree
+
+    def _draw_graph(self):
+        """
+        Zeichnet den Graphen:
+          - Knoten werden als Punkte dargestellt.
+          - Kanten werden als Linien gezeichnet (kleine gerichtete Graphen mit Pfeilen).
+        """
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        self.axes = ax
+        if self.arrows:
+            self.edge_collection = nx.draw_networkx_edges(
+                self.G, pos=self.pos, ax=ax, edge_color='gray', arrows=True, node_size=self.node_size
+            )
+        else:
+            width = 1.0 if len(self._edge_index) <= self.ARROW_EDGE_LIMIT else 0.5
+            self.edge_collection = LineCollection(np.empty((0, 2, 2)), colors='gray', linewidths=width, zorder=1)
+            ax.add_collection(self.edge_collection)
+        self.node_collection = ax.scatter(
+            self.points[:, 0], self.points[:, 1], s=self.node_size, c='blue', linewidths=0, zorder=2
+        )
+        if self.equal_aspect:
+            ax.set_aspect("equal")
+        ax.set_axis_off()
+        self._show_all()
+        self.draw()
+
+    def _show_all(self):
+        """
+        Setzt den Ausschnitt auf den ganzen Graphen (mit 5 % Rand).
+        """
+        if not len(self.points):
+            return
+        low, high = self._bounds
+        margin = 0.05 * max(float((high - low).max()), 1e-9)
+        self.axes.set_xlim(low[0] - margin, high[0] + margin)
+        self.axes.set_ylim(low[1] - margin, high[1] + margin)
+        self._update_visible(self.MAX_DRAWN_EDGES)
+
+    def _marker_pixels(self):
+        # Durchmesser eines Knotenpunktes in Pixeln (node_size ist eine Fläche in pt²)
+        return np.sqrt(self.node_size) * self.figure.dpi / 72
+
+    def _update_visible(self, edge_limit):
+        """
+        Wählt die Knoten und Kanten im aktuellen Ausschnitt aus, von den Kanten gemäß der
+        Detailstufe (siehe Klassenbeschreibung) höchstens edge_limit.
+        """
+        if not len(self.points):
+            return
+        ax = self.axes
+        ax.apply_aspect()
+        (x0, x1), (y0, y1) = sorted(ax.get_xlim()), sorted(ax.get_ylim())
+        # Pixel je Dateneinheit
+        sx = ax.bbox.width / max(x1 - x0, 1e-12)
+        sy = ax.bbox.height / max(y1 - y0, 1e-12)
+        # Knoten, deren Punkt noch in den Ausschnitt hineinragt
+        rx = self._marker_pixels() / 2 / sx
+        ry = self._marker_pixels() / 2 / sy
+        low, high = np.array([x0 - rx, y0 - ry]), np.array([x1 + rx, y1 + ry])
+
+        if (self._bounds[0] >= low).all() and (self._bounds[1] <= high).all():
+            visible = self.points
+        else:
+            # Bereichsabfrage: Quadrat (Maximumsnorm) um den Ausschnitt, dann exakt zuschneiden
+            candidates = np.array(
+                self._spatial_index().query_ball_point((low + high) / 2, float((high - low).max()) / 2, p=np.inf),
+                dtype=np.int64,
+            )
+            points = self.points[candidates].reshape(-1, 2)
+            visible = points[((points >= low) & (points <= high)).all(axis=1)]
+        self.node_collection.set_offsets(visible)
+
+        if self.arrows or not len(self._edge_index):
+            return
+        lengths = np.hypot(self._edge_vectors[:, 0] * sx, self._edge_vectors[:, 1] * sy)
+        shown = (
+            (lengths >= max(self.MIN_EDGE_PIXELS, self._marker_pixels()))
+            & (self._edge_high[:, 0] >= x0) & (self._edge_low[:, 0] <= x1)
+            & (self._edge_high[:, 1] >= y0) & (self._edge_low[:, 1] <= y1)
+        )
+        order = self._edge_order
+        selected = order[shown[order]][:edge_limit]
+        self.edge_collection.set_segments(self.points[self._edge_index[selected]])
+
+    def update_positions(self, pos):
+        """
+        Verschiebt Knoten und Kanten auf neue Positionen (z.B. Zwischenstände der
+        Layout-Berechnung), ohne die Darstellung neu aufzubauen.
+        """
+        self.pos = pos
+        self._set_points(pos)
+        self._set_hovered(None)
+        if self.arrows:
+            # Gerichtete Graphen: Pfeile sind einzelne Patches, daher neu zeichnen
+            self._draw_graph()
+            return
+        self._show_all()
+        self.draw()
+
+    ##############################################################################
+    # Knoten unter dem Mauszeiger
+    ##############################################################################
+    def node_at(self, x, y):
+        """
+        Knoten unter der Pixelposition (x, y) der Zeichenfläche oder None. Gesucht wird unter
+        den nächsten Nachbarn im k-d-Baum (O(log n)), verglichen wird der Abstand in Pixeln.
+        """
+        if not len(self.points):
+            return None
+        transform = self.axes.transData
+        point = transform.inverted().transform((x, y))
+        _, candidates = self._spatial_index().query(point, k=min(8, len(self.points)))
+        candidates = np.atleast_1d(candidates)
+        distances = np.hypot(*(transform.transform(self.points[candidates]) - (x, y)).T)
+        best = int(np.argmin(distances))
+        if distances[best] > self._marker_pixels() / 2 + self.HIT_PIXELS:
+            return None
+        return self.nodes[candidates[best]]
+
+    def _set_hovered(self, node):
+        if node != self._hovered:
+            self._hovered = node
+            self.node_hovered.emit(node)
+
+    ##############################################################################
+    # Zoomen und Verschieben
+    ##############################################################################
+    def _on_scroll(self, event):
+        if event.inaxes is not self.axes or self._pan is not None:
+            return
+        factor = self.ZOOM_STEP ** -event.step
+        ax = self.axes
+        (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+        ax.set_xlim(event.xdata + (x0 - event.xdata) * factor, event.xdata + (x1 - event.xdata) * factor)
+        ax.set_ylim(event.ydata + (y0 - event.ydata) * factor, event.ydata + (y1 - event.ydata) * factor)
+        self._update_visible(self.INTERACTIVE_EDGES)
+        self.draw_idle()
+        self._refine_timer.start(self.REFINE_DELAY_MS)
+
+    def _refine(self):
+        self._update_visible(self.MAX_DRAWN_EDGES)
+        self.draw_idle()
+
+    def _on_press(self, event):
+        if event.inaxes is not self.axes or event.button != 1:
+            return
+        if event.dblclick:
+            self._pan = None
+            self._show_all()
+            self.draw_idle()
+            return
+        self._refine_timer.stop()
+        ax = self.axes
+        image = self.copy_from_bbox(ax.bbox)
+        # Leerer Hintergrund für die beim Verschieben frei werdenden Bereiche
+        artists = [self.node_collection] + (self.edge_collection if self.arrows else [self.edge_collection])
+        for artist in artists:
+            artist.set_visible(False)
+        self.draw()
+        background = self.copy_from_bbox(ax.bbox)
+        for artist in artists:
+            artist.set_visible(True)
+        self.restore_region(image)
+        self.blit(ax.bbox)
+        self._pan = (event.x, event.y, ax.get_xlim(), ax.get_ylim(), image, background)
+
+    def _on_motion(self, event):
+        if self._pan is None:
+            self._set_hovered(self.node_at(event.x, event.y) if event.inaxes is self.axes else None)
+            return
+        self._set_hovered(None)
+        start_x, start_y, _, _, image, background = self._pan
+        x1, y1, _, _ = image.get_extents()
+        # Bildbereiche liegen in Pixelkoordinaten mit Ursprung oben links
+        self.restore_region(background)
+        self.restore_region(image, xy=(x1 + round(event.x - start_x), y1 - round(event.y - start_y)))
+        self.blit(self.axes.bbox)
+
+    def _on_release(self, event):
+        if self._pan is None or event.button != 1:
+            return
+        start_x, start_y, (x0, x1), (y0, y1), image, _ = self._pan
+        self._pan = None
+        if np.hypot(event.x - start_x, event.y - start_y) <= self.DRAG_PIXELS:
+            # Klick: Ausschnitt bleibt, nur den Knoten melden
+            self.restore_region(image)
+            self.blit(self.axes.bbox)
+            self.node_clicked.emit(self.node_at(start_x, start_y))
+            return
+        ax = self.axes
+        dx = (event.x - start_x) * (x1 - x0) / ax.bbox.width
+        dy = (event.y - start_y) * (y1 - y0) / ax.bbox.height
+        ax.set_xlim(x0 - dx, x1 - dx)
+        ax.set_ylim(y0 - dy, y1 - dy)
+        self._update_visible(self.MAX_DRAWN_EDGES)
+        self.draw_idle()
+
+class AggregatedCanvas(FigureCanvas):
+    """
+    Zeichnet ein aggregiertes Layout (community_layout.AggregatedLayout):
+      - jede Community als Kreisscheibe mit ihren Knoten als kleine Punkte,
+      - die Kanten des Quotientengraphen als Linien (Breite nach Anzahl der Kanten).
+    Ein Klick in eine Kreisscheibe meldet die Community über cluster_clicked (Drill-down).
+    """
+
+    cluster_clicked = pyqtSignal(int)
+
+    # Anzahl der größten Communities, die mit ihrer Knotenzahl beschriftet werden
+    LABELED_COMMUNITIES = 20
+
+    def __init__(self, G, layout, parent=None):
+        self.figure = Figure()
+        super(AggregatedCanvas, self).__init__(self.figure)
+        self.setParent(parent)
+        self.G = G
+        self.aggregated_layout = layout
+        self._draw_graph()
+        self.mpl_connect("button_press_event", self._on_click)
+
+    def _draw_graph(self):
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        layout = self.aggregated_layout
+        colors = colormaps["tab20"](np.arange(len(layout.communities)) % 20)
+
+        # Kanten zwischen Communities
+        edges = list(layout.quotient.edges(data="weight"))
+        if edges:
+            segments = [(layout.centers[a], layout.centers[b]) for a, b, _ in edges]
+            widths = [0.3 + np.log1p(weight) * 0.5 for _, _, weight in edges]
+            ax.add_collection(LineCollection(segments, linewidths=widths, colors="gray", alpha=0.4, zorder=1))
+
+        # Kreisscheiben der Communities
+        disks = [Circle(center, radius) for center, radius in zip(layout.centers, layout.radii)]
+        ax.add_collection(PatchCollection(
+            disks, facecolors=colors, edgecolors=colors, alpha=0.15, linewidths=1.0, zorder=2
+        ))
+
+        # Knoten innerhalb ihrer Community
+        node_colors = []
+        points = []
+        for i, members in enumerate(layout.communities):
+            points.extend(layout.pos[node] for node in members)
+            node_colors.extend([colors[i]] * len(members))
+        if points:
+            points = np.asarray(points)
+            ax.scatter(points[:, 0], points[:, 1], s=2, c=node_colors, linewidths=0, zorder=3)
+
+        for i in range(min(self.LABELED_COMMUNITIES, len(layout.communities))):
+            x, y = layout.centers[i]
+            ax.annotate(str(len(layout.communities[i])), (x, y), ha="center", va="center", fontsize=7, zorder=4)
+
+        ax.set_title(
+            f"{self.G.number_of_nodes()} Knoten in {len(layout.communities)} Communities "
+            "(Klick auf eine Community öffnet sie)",
+            fontsize=9,
+        )
+        ax.set_aspect("equal")
+        ax.autoscale_view()
+        ax.set_axis_off()
+        self.draw()
+
+    def _on_click(self, event):
+        if event.inaxes is None or event.xdata is None or event.button != 1:
+            return
+        community = self.aggregated_layout.community_at(event.xdata, event.ydata)
+        if community is not None:
+            self.cluster_clicked.emit(community)
@@ -0,0 +1,185 @@
+# frontend/components/layout_cache.py
+#
+# Festplatten-Cache für berechnete Layouts der Visualisierung. Jeder Eintrag ist eine
+# .npz-Datei mit den Positionen als float32-Array in fester Knotenreihenfolge (nach der
+# Textform sortiert; beim aggregierten Layout zusätzlich Community je Knoten, Mittelpunkte
+# und Radien).
+# Der Schlüssel besteht aus dem Hash des Dateiinhalts, dem Layoutmodus, den Parametern
+# des Layoutverfahrens und (bei einer Teilansicht nach Drill-down) den angezeigten Knoten.
+#
+# Verdrängung nach LRU: Ein Treffer setzt den Änderungszeitpunkt der Datei neu; nach dem
+# Speichern werden die am längsten nicht verwendeten Einträge gelöscht, bis Anzahl und
+# Gesamtgröße unter den Grenzen liegen.
+
+import os
+import json
+import hashlib
+import tempfile
+
+import numpy as np
+
+LAYOUT_CACHE_DIR = "./layout_cache"
+LAYOUT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+LAYOUT_CACHE_MAX_ENTRIES = 500
+
+# Erhöhen, wenn sich das Format der Einträge ändert
+LAYOUT_CACHE_VERSION = 2
+
+def _layout_parameters(mode):
+    """
+    Alle Konstanten (Großbuchstaben) des Moduls, das das Layout im gegebenen Modus berechnet.
+    """
+    if mode == "aggregated":
+        from frontend.components import community_layout as module
+    else:
+        from frontend.components import layout_engine as module
+    return {
+        name: getattr(module, name)
+        for name in sorted(dir(module))
+        if name.isupper() and isinstance(getattr(module, name), (int, float, str, bool))
+    }
+
+def _canonical_nodes(G):
+    """
+    Knoten von G in einer festen Reihenfolge (nach ihrer Textform sortiert). Die Reihenfolge
+    von list(G) hängt bei Teilgraphen einer Drill-down-Ansicht von der Iteration über eine
+    Knotenmenge ab und damit von PYTHONHASHSEED, ist also von Sitzung zu Sitzung verschieden.
+    """
+    return sorted(G, key=str)
+
+def _node_digest(nodes):
+    digest = hashlib.sha256()
+    for node in nodes:
+        digest.update(str(node).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def layout_cache_key(content_hash, mode, G=None):
+    """
+    Schlüssel eines Layouts.
+
+    Parameter:
+      content_hash (str): SHA-256 des Inhalts der GraphML-Datei.
+      mode (str): "detail" oder "aggregated".
+      G (networkx.Graph): Teilgraph einer Drill-down-Ansicht, None für den ganzen Graphen.
+    """
+    key_data = {
+        "version": LAYOUT_CACHE_VERSION,
+        "content_hash": content_hash,
+        "mode": mode,
+        "parameters": _layout_parameters(mode),
+        "nodes": None if G is None else _node_digest(_canonical_nodes(G)),
+    }
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+def _entry_path(key, directory):
+    return os.path.join(directory, key + ".npz")
+
+##############################################################################
+# Lesen
+##############################################################################
+def load_layout(key, G, directory=LAYOUT_CACHE_DIR):
+    """
+    Lädt ein Layout für den Graphen G aus dem Cache.
+
+    Rückgabe:
+      dict {node: (x, y)} bzw. AggregatedLayout, oder None, falls kein (passender) Eintrag existiert.
+    """
+    path = _entry_path(key, directory)
+    try:
+        with np.load(path) as entry:
+            arrays = {name: entry[name] for name in entry.files}
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Layout-Cache: Eintrag {path} ist beschädigt und wird verworfen ({e}).")
+        _remove(path)
+        return None
+
+    nodes = _canonical_nodes(G)
+    if str(arrays.get("node_digest")) != _node_digest(nodes) or len(arrays["positions"]) != len(nodes):
+        return None
+    # Zuletzt verwendet (LRU)
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+    positions = arrays["positions"].astype(float)
+    pos = dict(zip(nodes, positions))
+    if "community" not in arrays:
+        return pos
+
+    from frontend.components.community_layout import AggregatedLayout, quotient_graph
+    import networkx as nx
+    communities = [set() for _ in range(len(arrays["centers"]))]
+    for node, community in zip(nodes, arrays["community"]):
+        communities[community].add(node)
+    quotient = quotient_graph(G, communities)
+    quotient.remove_edges_from(list(nx.selfloop_edges(quotient)))
+    return AggregatedLayout(communities, quotient, arrays["centers"].astype(float), arrays["radii"].astype(float), pos)
+
+##############################################################################
+# Schreiben und Verdrängen
+##############################################################################
+def store_layout(key, G, layout, directory=LAYOUT_CACHE_DIR,
+                 max_bytes=LAYOUT_CACHE_MAX_BYTES, max_entries=LAYOUT_CACHE_MAX_ENTRIES):
+    """
+    Speichert ein Layout (dict oder AggregatedLayout) des Graphen G und verdrängt danach
+    alte Einträge. Fehler beim Schreiben werden nur gemeldet (der Cache ist optional, das
+    Layout wird trotzdem angezeigt); eine angefangene temporäre Datei wird entfernt.
+    """
+    temp_path = None
+    try:
+        nodes = _canonical_nodes(G)
+        arrays = {"node_digest": np.array(_node_digest(nodes))}
+        if isinstance(layout, dict):
+            arrays["positions"] = np.array([layout[node] for node in nodes], dtype=np.float32).reshape(-1, 2)
+        else:
+            community_of = {node: i for i, members in enumerate(layout.communities) for node in members}
+            arrays["positions"] = np.array([layout.pos[node] for node in nodes], dtype=np.float32).reshape(-1, 2)
+            arrays["community"] = np.array([community_of[node] for node in nodes], dtype=np.int32)
+            arrays["centers"] = np.asarray(layout.centers, dtype=np.float64)
+            arrays["radii"] = np.asarray(layout.radii, dtype=np.float64)
+
+        os.makedirs(directory, exist_ok=True)
+        # Erst in eine temporäre Datei schreiben, damit kein halber Eintrag gelesen wird
+        handle, temp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        with os.fdopen(handle, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(temp_path, _entry_path(key, directory))
+        temp_path = None
+        evict(directory, max_bytes, max_entries)
+    except Exception as e:
+        print(f"Layout-Cache: Eintrag konnte nicht gespeichert werden ({e}).")
+    finally:
+        if temp_path is not None:
+            _remove(temp_path)
+
+def evict(directory=LAYOUT_CACHE_DIR, max_bytes=LAYOUT_CACHE_MAX_BYTES, max_entries=LAYOUT_CACHE_MAX_ENTRIES):
+    """
+    Löscht die am längsten nicht verwendeten Einträge, bis höchstens max_entries Einträge
+    mit zusammen höchstens max_bytes übrig sind.
+    """
+    entries = []
+    for name in os.listdir(directory):
+        if not name.endswith(".npz"):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = 0
+    for count, (_, size, path) in enumerate(sorted(entries, reverse=True), 1):
+        total += size
+        if count > max_entries or total > max_bytes:
+            _remove(path)
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,429 @@
+# frontend/components/layout_engine.py
+#
+# Kraftbasiertes Layout (Fruchterman-Reingold) für große Graphen, vollständig mit NumPy:
+#   - Die Abstoßung aller Knotenpaare wird per Barnes-Hut über einen Quadtree genähert:
+#     Weit entfernte Zellen wirken mit ihrer Gesamtmasse im Schwerpunkt. Der Baum wird über
+#     Morton-Codes ebenenweise aufgebaut und für alle Knoten gleichzeitig durchlaufen.
+#   - Mehrebenen-Verfahren: Der Graph wird schrittweise vergröbert (Sonnensysteme: eine
+#     unabhängige Knotenmenge als "Sonnen", jeder übrige Knoten schließt sich einer
+#     benachbarten Sonne an). Das gröbste Layout wird berechnet und Ebene für Ebene
+#     verfeinert, sodass auf dem vollen Graphen nur noch wenige Iterationen nötig sind.
+#   - iter_layout liefert Zwischenstände, damit die Anzeige den Fortschritt zeigen kann.
+#
+# Haben die Knoten Koordinaten (Topology Zoo: Latitude/Longitude, SNDlib: x/y), liefert
+# geographic_layout ohne Berechnung ein geografisches Layout.
+#
+# Statt O(n²) je Iteration (nx.spring_layout) kostet eine Iteration O(n log n).
+
+import math
+import time
+
+import networkx as nx
+import numpy as np
+
+# Fester Seed, damit sich das Layout beim erneuten Öffnen nicht ändert
+LAYOUT_SEED = 42
+
+# Barnes-Hut-Genauigkeit: Eine Zelle der Kantenlänge s wird im Abstand d als ein Punkt
+# behandelt, wenn s / d < THETA (größer = schneller, ungenauer)
+THETA = 1.0
+
+# Bis zu dieser Knotenzahl wird die Abstoßung exakt (alle Paare) berechnet
+EXACT_REPULSION_NODES = 300
+
+# Höchste Tiefe des Quadtrees (Zellen je Achse = 2**Tiefe)
+MAX_TREE_DEPTH = 15
+
+# Vergröberung endet bei dieser Zahl nicht isolierter Knoten oder wenn eine Ebene kaum
+# noch kleiner wird
+COARSEST_NODES = 100
+MIN_COARSENING_RATIO = 0.8
+
+# Iterationen auf der gröbsten Ebene, auf den Zwischenebenen und auf dem vollen Graphen
+COARSEST_ITERATIONS = 150
+LEVEL_ITERATIONS = 20
+FINEST_ITERATIONS = 10
+
+# Schwache Anziehung zum Schwerpunkt, damit Zusammenhangskomponenten während der Berechnung
+# nicht auseinanderdriften; anschließend werden sie ohnehin nebeneinander angeordnet
+GRAVITY = 0.01
+
+# Mindestabstand (in Vielfachen von k) zwischen zwei Knoten für die Kraftberechnung
+MIN_DISTANCE = 0.01
+
+# Zwischenstände höchstens alle PROGRESS_INTERVAL Sekunden
+PROGRESS_INTERVAL = 0.5
+
+# Geografisches Layout nur, wenn mindestens dieser Anteil der Knoten Koordinaten hat
+GEO_MIN_FRACTION = 0.8
+
+##############################################################################
+# Graph als Arrays
+##############################################################################
+def graph_arrays(G):
+    """
+    Knotenliste, Kanten als Index-Arrays (ungerichtet, ohne Schleifen, Mehrfachkanten
+    zusammengefasst, Gewicht = Anzahl) und die Zusammenhangskomponente jedes Knotens.
+
+    Rückgabe:
+      (nodes, sources, targets, weights, components)
+    """
+    nodes = list(G)
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in G.edges()], dtype=np.int64).reshape(-1, 2)
+    sources, targets, weights = _merge_edges(len(nodes), edges[:, 0], edges[:, 1], np.ones(len(edges)))
+    components = np.zeros(len(nodes), dtype=np.int64)
+    U = G.to_undirected(as_view=True) if G.is_directed() else G
+    for label, members in enumerate(nx.connected_components(U)):
+        components[[index[node] for node in members]] = label
+    return nodes, sources, targets, weights, components
+
+def _merge_edges(n, sources, targets, weights):
+    """
+    Entfernt Schleifen und fasst Kanten zwischen denselben Knoten zusammen (Gewichte addiert).
+    """
+    keep = sources != targets
+    low = np.minimum(sources[keep], targets[keep])
+    high = np.maximum(sources[keep], targets[keep])
+    keys, inverse = np.unique(low * n + high, return_inverse=True)
+    merged = np.bincount(inverse, weights=weights[keep], minlength=len(keys))
+    return keys // n, keys % n, merged
+
+##############################################################################
+# Vergröberung
+##############################################################################
+def coarsen(n, sources, targets, weights, mass, rng):
+    """
+    Eine Vergröberungsstufe (Sonnensysteme): Eine maximale unabhängige Knotenmenge wird
+    ausgewählt (Knoten mit hohem Grad bevorzugt, damit z.B. Sterne um ihren Mittelpunkt
+    zusammenfallen); jeder andere Knoten wird einer benachbarten Sonne zugeordnet.
+
+    Rückgabe:
+      (assignment, coarse_n, coarse_sources, coarse_targets, coarse_weights, coarse_mass);
+      assignment[i] ist der grobe Knoten, zu dem Knoten i gehört.
+    """
+    a = np.concatenate([sources, targets])
+    b = np.concatenate([targets, sources])
+    degree = np.bincount(a, minlength=n)
+    priority = degree + rng.random(n)
+
+    # Parallele maximale unabhängige Menge (Luby): ein unentschiedener Knoten wird Sonne,
+    # wenn seine Priorität die aller unentschiedenen Nachbarn übersteigt
+    UNDECIDED, SUN, PLANET = 0, 1, 2
+    state = np.zeros(n, dtype=np.int8)
+    while True:
+        undecided = state == UNDECIDED
+        if not undecided.any():
+            break
+        both = undecided[a] & undecided[b]
+        best_neighbor = np.full(n, -1.0)
+        np.maximum.at(best_neighbor, a[both], priority[b[both]])
+        suns = undecided & (priority > best_neighbor)
+        state[suns] = SUN
+        neighbors = a[suns[b]]
+        state[neighbors[state[neighbors] == UNDECIDED]] = PLANET
+
+    coarse_index = np.cumsum(state == SUN) - 1
+    parent = np.arange(n)
+    orbit = (state[a] == PLANET) & (state[b] == SUN)
+    parent[a[orbit]] = b[orbit]
+    assignment = coarse_index[parent]
+    coarse_n = int(coarse_index[-1]) + 1 if n else 0
+
+    coarse_sources, coarse_targets, coarse_weights = _merge_edges(
+        coarse_n, assignment[sources], assignment[targets], weights
+    )
+    coarse_mass = np.bincount(assignment, weights=mass, minlength=coarse_n)
+    return assignment, coarse_n, coarse_sources, coarse_targets, coarse_weights, coarse_mass
+
+##############################################################################
+# Kräfte
+##############################################################################
+def _interleave_bits(values):
+    """
+    Verteilt die (bis zu 16) Bits jedes Wertes auf die geraden Bitpositionen (Morton-Code).
+    """
+    values = values.astype(np.int64)
+    values = (values | (values << 8)) & 0x00FF00FF
+    values = (values | (values << 4)) & 0x0F0F0F0F
+    values = (values | (values << 2)) & 0x33333333
+    values = (values | (values << 1)) & 0x55555555
+    return values
+
+def _exact_repulsion(X, mass, k2, min_d2):
+    delta = X[:, None, :] - X[None, :, :]
+    d2 = np.maximum((delta ** 2).sum(axis=2), min_d2)
+    np.fill_diagonal(d2, np.inf)
+    return (delta * (k2 * mass[None, :] / d2)[:, :, None]).sum(axis=1)
+
+def _barnes_hut_repulsion(X, mass, k2, min_d2, theta):
+    """
+    Abstoßung k² · m_j / d in Richtung von j weg für jeden Knoten, genähert über einen Quadtree.
+
+    Die Zellen jeder Ebene sind die verschiedenen Präfixe der Morton-Codes; da sie sortiert
+    sind, liegen die Kinder jeder Zelle in der nächsten Ebene zusammenhängend. Der Baum wird
+    für alle Knoten zugleich durchlaufen: Die "Front" enthält Paare (Knoten, Zelle); weit
+    genug entfernte Zellen wirken als Punktmasse, die übrigen werden durch ihre Kinder ersetzt.
+    """
+    n = len(X)
+    low = X.min(axis=0)
+    size = float((X.max(axis=0) - low).max()) or 1.0
+    depth = int(min(MAX_TREE_DEPTH, max(2, math.ceil(math.log(n, 4)))))
+    cells_per_axis = 1 << depth
+    grid = np.minimum(((X - low) / size * cells_per_axis).astype(np.int64), cells_per_axis - 1)
+    codes = _interleave_bits(grid[:, 0]) | (_interleave_bits(grid[:, 1]) << 1)
+
+    # Je Ebene 1..depth: Zellschlüssel, Zelle jedes Knotens, Masse und Schwerpunkt je Zelle
+    levels = []
+    for level in range(1, depth + 1):
+        keys, own = np.unique(codes >> (2 * (depth - level)), return_inverse=True)
+        cell_mass = np.bincount(own, weights=mass, minlength=len(keys))
+        center = np.column_stack([
+            np.bincount(own, weights=mass * X[:, 0], minlength=len(keys)),
+            np.bincount(own, weights=mass * X[:, 1], minlength=len(keys)),
+        ]) / cell_mass[:, None]
+        levels.append((keys, own, cell_mass, center))
+
+    # Kinder jeder Zelle: Bereich [first_child, first_child + child_count) der nächsten Ebene
+    children = []
+    for (keys, *_), (child_keys, *_) in zip(levels, levels[1:]):
+        first_child = np.searchsorted(child_keys, keys << 2)
+        children.append((first_child, np.diff(np.append(first_child, len(child_keys)))))
+
+    force = np.zeros_like(X)
+    points = np.repeat(np.arange(n), len(levels[0][0]))
+    cells = np.tile(np.arange(len(levels[0][0])), n)
+    for level, (keys, own, cell_mass, center) in enumerate(levels):
+        masses = cell_mass[cells]
+        centers = center[cells]
+        leaf = level == depth - 1
+        is_own = own[points] == cells
+        if leaf:
+            # In der eigenen Blattzelle wirkt nur der Rest der Zelle ohne den Knoten selbst
+            rest = masses[is_own] - mass[points[is_own]]
+            safe = np.where(rest > 0, rest, 1.0)
+            centers[is_own] = (
+                masses[is_own, None] * centers[is_own] - mass[points[is_own], None] * X[points[is_own]]
+            ) / safe[:, None]
+            masses[is_own] = rest
+        delta = X[points] - centers
+        d2 = np.maximum((delta ** 2).sum(axis=1), min_d2)
+        cell_size = size / (2 << level)
+        accept = np.ones(len(points), dtype=bool) if leaf else (~is_own & (cell_size * cell_size < theta * theta * d2))
+
+        strength = np.where(accept, k2 * masses / d2, 0.0)
+        force[:, 0] += np.bincount(points, weights=delta[:, 0] * strength, minlength=n)
+        force[:, 1] += np.bincount(points, weights=delta[:, 1] * strength, minlength=n)
+        if leaf:
+            break
+
+        # Nicht akzeptierte Zellen durch ihre Kinder ersetzen
+        opened_points, opened_cells = points[~accept], cells[~accept]
+        first_child, child_count = children[level]
+        counts = child_count[opened_cells]
+        points = np.repeat(opened_points, counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        cells = np.repeat(first_child[opened_cells], counts) + offsets
+    return force
+
+def _displacement(X, sources, targets, weights, mass, k, theta):
+    """
+    Verschiebung je Knoten (je Masseneinheit): Abstoßung aller Knoten, Anziehung d²/k entlang
+    der Kanten und eine schwache Anziehung zum Schwerpunkt.
+    """
+    k2 = k * k
+    min_d2 = (MIN_DISTANCE * k) ** 2
+    if len(X) <= EXACT_REPULSION_NODES:
+        displacement = _exact_repulsion(X, mass, k2, min_d2)
+    else:
+        displacement = _barnes_hut_repulsion(X, mass, k2, min_d2, theta)
+
+    delta = X[sources] - X[targets]
+    pull = delta * (weights * np.sqrt((delta ** 2).sum(axis=1)) / k)[:, None]
+    n = len(X)
+    for axis in (0, 1):
+        displacement[:, axis] += (
+            np.bincount(targets, weights=pull[:, axis], minlength=n)
+            - np.bincount(sources, weights=pull[:, axis], minlength=n)
+        ) / mass
+
+    offset = X - np.average(X, axis=0, weights=mass)
+    displacement -= GRAVITY * offset
+    return displacement
+
+def _force_directed(X, sources, targets, weights, mass, k, iterations, temperature, theta):
+    """
+    Fruchterman-Reingold-Iterationen mit linear sinkender Temperatur (maximale Schrittweite).
+    Verändert X und liefert nach jeder Iteration deren Nummer.
+    """
+    cooling = temperature / (iterations + 1)
+    for iteration in range(iterations):
+        displacement = _displacement(X, sources, targets, weights, mass, k, theta)
+        length = np.maximum(np.sqrt((displacement ** 2).sum(axis=1)), 1e-12)
+        X += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+        yield iteration
+
+##############################################################################
+# Layout
+##############################################################################
+def _pack_components(X, components, spacing):
+    """
+    Ordnet die Zusammenhangskomponenten (jede mit ihrem eigenen Layout) zeilenweise
+    nebeneinander an, die größte zuerst. Ohne das würden isolierte Knoten und kleine
+    Komponenten von der Abstoßung weit nach außen getrieben.
+    """
+    count = int(components.max()) + 1
+    if count == 1:
+        return X
+    low = np.full((count, 2), np.inf)
+    high = np.full((count, 2), -np.inf)
+    np.minimum.at(low, components, X)
+    np.maximum.at(high, components, X)
+    extent = high - low + spacing
+    order = np.argsort(-np.bincount(components), kind="stable")
+    row_width = max(extent[order[0], 0], math.sqrt((extent[:, 0] * extent[:, 1]).sum()))
+
+    offsets = np.zeros((count, 2))
+    x = y = row_height = 0.0
+    for component in order:
+        if x > 0 and x + extent[component, 0] > row_width:
+            x, y, row_height = 0.0, y - row_height, 0.0
+        offsets[component] = (x - low[component, 0], y - extent[component, 1] - low[component, 1])
+        x += extent[component, 0]
+        row_height = max(row_height, extent[component, 1])
+    return X + offsets[components]
+
+def _rescale(X):
+    """
+    Verschiebt in den Ursprung und skaliert auf [-1, 1] (wie nx.spring_layout).
+    """
+    X = X - X.mean(axis=0)
+    extent = np.abs(X).max()
+    return X / extent if extent > 0 else X
+
+def iter_layout(G, seed=LAYOUT_SEED, theta=THETA, progress_interval=PROGRESS_INTERVAL):
+    """
+    Berechnet das Mehrebenen-Layout und liefert Zwischenstände.
+
+    Liefert Tupel (pos, done): pos ist {node: numpy.ndarray} auf [-1, 1] skaliert; Knoten
+    einer groben Ebene stehen an der Position ihres groben Knotens. Zwischenstände kommen
+    höchstens alle progress_interval Sekunden, zuletzt das fertige Layout mit done=True.
+    """
+    nodes, sources, targets, weights, components = graph_arrays(G)
+    n = len(nodes)
+    if n == 0:
+        yield {}, True
+        return
+    rng = np.random.default_rng(seed)
+
+    # Ebenen: (Knotenzahl, Kanten, Masse); assignments[i] bildet Ebene i auf Ebene i + 1 ab
+    levels = [(n, sources, targets, weights, np.ones(n))]
+    assignments = []
+    while True:
+        level_n, level_sources, level_targets, level_weights, level_mass = levels[-1]
+        # Isolierte Knoten lassen sich nicht vergröbern und zählen nicht mit
+        connected = len(np.union1d(level_sources, level_targets))
+        if connected <= COARSEST_NODES:
+            break
+        assignment, *coarse = coarsen(level_n, level_sources, level_targets, level_weights, level_mass, rng)
+        if coarse[0] - (level_n - connected) > MIN_COARSENING_RATIO * connected:
+            break
+        assignments.append(assignment)
+        levels.append(tuple(coarse))
+    print(f"Layout: {n} Knoten, Ebenen: {' → '.join(str(level[0]) for level in reversed(levels))}")
+
+    # Position jedes Knotens auf jeder Ebene: Index des zugehörigen groben Knotens
+    ancestors = [np.arange(n)]
+    for assignment in assignments:
+        ancestors.append(assignment[ancestors[-1]])
+
+    # Natürliche Kantenlänge des vollen Graphen in der Einheitsfläche; grobe Knoten
+    # stoßen mit ihrer Masse ab und beanspruchen so die Fläche ihrer Knoten
+    k = 1.0 / math.sqrt(n)
+    coarsest_n = levels[-1][0]
+    X = rng.random((coarsest_n, 2))
+    last_progress = time.perf_counter()
+    for depth in range(len(levels) - 1, -1, -1):
+        level_n, level_sources, level_targets, level_weights, level_mass = levels[depth]
+        if depth == len(levels) - 1:
+            iterations, temperature = COARSEST_ITERATIONS, 0.1
+        else:
+            # Verfeinern: jeder Knoten startet (leicht gestreut) an der Position seines groben Knotens
+            X = X[assignments[depth]] + (rng.random((level_n, 2)) - 0.5) * k
+            iterations = FINEST_ITERATIONS if depth == 0 else LEVEL_ITERATIONS
+            temperature = 2.0 / math.sqrt(levels[depth + 1][0])
+        for _ in _force_directed(X, level_sources, level_targets, level_weights, level_mass, k, iterations, temperature, theta):
+            now = time.perf_counter()
+            if now - last_progress >= progress_interval:
+                last_progress = now
+                yield dict(zip(nodes, _rescale(X[ancestors[depth]]))), False
+
+    yield dict(zip(nodes, _rescale(_pack_components(X, components, 2 * k)))), True
+
+def compute_layout(G, seed=LAYOUT_SEED, theta=THETA):
+    """
+    Fertiges Layout {node: numpy.ndarray} ohne Zwischenstände.
+    """
+    for pos, done in iter_layout(G, seed=seed, theta=theta, progress_interval=math.inf):
+        if done:
+            return pos
+
+##############################################################################
+# Geografisches Layout
+##############################################################################
+def _coordinate(data, name):
+    try:
+        value = float(data[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+def geographic_layout(G, min_fraction=GEO_MIN_FRACTION):
+    """
+    Layout aus den Koordinaten der Knoten: Latitude/Longitude (Topology Zoo, als
+    abstandstreue Zylinderprojektion um die mittlere Breite) oder sonst x/y (SNDlib).
+    Knoten ohne Koordinaten stehen im Mittel ihrer platzierten Nachbarn bzw. im Schwerpunkt.
+
+    Rückgabe:
+      dict {node: numpy.ndarray} auf [-1, 1] skaliert, oder None, wenn weniger als
+      min_fraction der Knoten Koordinaten haben.
+    """
+    n = G.number_of_nodes()
+    if n == 0:
+        return None
+    for x_name, y_name in (("Longitude", "Latitude"), ("x", "y")):
+        coordinates = {}
+        for node, data in G.nodes(data=True):
+            x, y = _coordinate(data, x_name), _coordinate(data, y_name)
+            if x is not None and y is not None:
+                coordinates[node] = (x, y)
+        if len(coordinates) >= min_fraction * n:
+            break
+    else:
+        return None
+
+    nodes = list(G)
+    X = np.array([coordinates.get(node, (np.nan, np.nan)) for node in nodes], dtype=float)
+    if x_name == "Longitude":
+        X[:, 0] *= math.cos(math.radians(np.nanmean(X[:, 1])))
+
+    # Knoten ohne Koordinaten schrittweise von ihren Nachbarn aus platzieren
+    missing = [i for i, node in enumerate(nodes) if node not in coordinates]
+    if missing:
+        index = {node: i for i, node in enumerate(nodes)}
+        U = G.to_undirected(as_view=True) if G.is_directed() else G
+        for _ in range(len(missing)):
+            placed = []
+            for i in missing:
+                neighbors = [index[v] for v in U[nodes[i]] if not np.isnan(X[index[v], 0])]
+                if neighbors:
+                    placed.append((i, X[neighbors].mean(axis=0)))
+            if not placed:
+                break
+            for i, position in placed:
+                X[i] = position
+            missing = [i for i in missing if np.isnan(X[i, 0])]
+        X[missing] = np.nanmean(X, axis=0)
+
+    return dict(zip(nodes, _rescale(X)))
@@ -0,0 +1,163 @@
+# query_scheduler.py
+
+import queue
+import sqlite3
+import threading
+
+from PyQt5.QtCore import QObject, QThread, QTimer, QCoreApplication, pyqtSignal
+
+from backend.database_handler import connect_database
+
+##############################################################################
+# Langlebiger Worker-Thread mit eigener Verbindung
+##############################################################################
+class _QueryWorker(QThread):
+    results_ready = pyqtSignal(int, str, list)
+    error_occurred = pyqtSignal(int, str)
+
+    def __init__(self, database_path, scheduler):
+        super().__init__()
+        self.database_path = database_path
+        self.scheduler = scheduler
+        self.jobs = queue.Queue()
+        self.connection = None
+        self._lock = threading.Lock()
+        self._running_generation = None
+
+    def run(self):
+        # Die Verbindung gehört diesem Thread und wird für alle Abfragen wiederverwendet
+        self.connection = connect_database(self.database_path)
+        try:
+            while True:
+                job = self.jobs.get()
+                if job is None:
+                    break
+                self._execute(*job)
+        finally:
+            self.connection.close()
+
+    def _execute(self, generation, tag, query, params):
+        # Veraltete Abfragen gar nicht erst starten
+        if not self.scheduler.is_current(generation):
+            return
+        with self._lock:
+            self._running_generation = generation
+        try:
+            rows = self.connection.execute(query, params).fetchall()
+        except sqlite3.OperationalError as e:
+            # Durch interrupt() abgebrochene Abfragen einer älteren Generation verwerfen
+            if self.scheduler.is_current(generation):
+                self.error_occurred.emit(generation, str(e))
+            return
+        except Exception as e:
+            self.error_occurred.emit(generation, str(e))
+            return
+        finally:
+            with self._lock:
+                self._running_generation = None
+
+        if self.scheduler.is_current(generation):
+            self.results_ready.emit(generation, tag, rows)
+
+    def interrupt_older_than(self, generation):
+        """
+        Bricht die gerade laufende SQLite-Abfrage ab, falls sie zu einer älteren
+        Generation gehört (Connection.interrupt darf aus einem anderen Thread aufgerufen werden).
+        """
+        with self._lock:
+            if self._running_generation is not None and self._running_generation < generation:
+                self.connection.interrupt()
+
+##############################################################################
+# QueryScheduler
+##############################################################################
+class QueryScheduler(QObject):
+    """
+    Führt Datenbankabfragen der Oberfläche nacheinander in einem einzigen, langlebigen
+    Worker-Thread mit wiederverwendeter Verbindung aus.
+
+    - debounce(): Eingaben (z.B. Tastendrücke in der Schnellsuche) starten einen Timer neu;
+      die Abfrage wird erst nach debounce_ms ohne weitere Eingabe gestellt.
+    - new_generation(): Jede neue Suche erhält eine Generationsnummer. Ergebnisse älterer
+      Generationen werden verworfen, noch wartende Abfragen übersprungen und eine gerade
+      laufende Abfrage per Connection.interrupt() abgebrochen.
+
+    Verwendung:
+      generation = scheduler.new_generation()
+      scheduler.submit(generation, "count", "SELECT COUNT(*) FROM analysis_results", [])
+      scheduler.results_ready.connect(lambda generation, tag, rows: ...)
+    """
+
+    results_ready = pyqtSignal(int, str, list)
+    error_occurred = pyqtSignal(int, str)
+
+    def __init__(self, database_path, debounce_ms=300, parent=None):
+        super().__init__(parent)
+        self._generation = 0
+        self._callback = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._run_debounced)
+
+        self._worker = _QueryWorker(database_path, self)
+        self._worker.results_ready.connect(self._forward_results)
+        self._worker.error_occurred.connect(self._forward_error)
+        self._worker.start()
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def debounce(self, callback):
+        """
+        Ruft callback erst auf, wenn debounce_ms lang kein weiterer Aufruf erfolgt ist.
+        """
+        self._callback = callback
+        self._timer.start()
+
+    def _run_debounced(self):
+        callback, self._callback = self._callback, None
+        if callback is not None:
+            callback()
+
+    def new_generation(self):
+        """
+        Beginnt eine neue Generation und macht alle älteren Abfragen ungültig.
+        Ein noch ausstehender debounce()-Aufruf wird verworfen.
+        """
+        self._timer.stop()
+        self._callback = None
+        self._generation += 1
+        self._worker.interrupt_older_than(self._generation)
+        return self._generation
+
+    def is_current(self, generation):
+        return generation == self._generation
+
+    def submit(self, generation, tag, query, params=None):
+        """
+        Stellt eine Abfrage in die Warteschlange des Worker-Threads. Das Ergebnis kommt
+        über results_ready(generation, tag, rows), sofern die Generation dann noch aktuell ist.
+        """
+        self._worker.jobs.put((generation, tag, query, list(params or [])))
+
+    def _forward_results(self, generation, tag, rows):
+        # Signale können nach einer neueren Generation ankommen
+        if self.is_current(generation):
+            self.results_ready.emit(generation, tag, rows)
+
+    def _forward_error(self, generation, message):
+        if self.is_current(generation):
+            self.error_occurred.emit(generation, message)
+
+    def shutdown(self):
+        """
+        Beendet den Worker-Thread (laufende Abfrage wird abgebrochen).
+        """
+        if self._worker.isRunning():
+            self._generation += 1
+            self._worker.interrupt_older_than(self._generation)
+            self._worker.jobs.put(None)
+            self._worker.wait()
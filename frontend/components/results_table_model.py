@@ -0,0 +1,225 @@
+# results_table_model.py
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+
+from backend.database_handler import get_connection
+from backend.search_index import SEARCH_TABLE
+
+##############################################################################
+# Tabellenmodell mit seitenweisem Nachladen (Keyset-Paginierung)
+##############################################################################
+class ResultsTableModel(QAbstractTableModel):
+    """
+    Tabellenmodell für "analysis_results", das nur die angezeigten Spalten abfragt und
+    die Zeilen seitenweise nachlädt, sobald die Tabelle ans Ende gescrollt wird
+    (canFetchMore/fetchMore). Es werden keine QTableWidgetItems erzeugt; die Zellen
+    werden erst beim Zeichnen in data() als Text geliefert.
+
+    Die Seiten werden per Keyset-Paginierung gelesen: Statt OFFSET setzt jede Seite
+    hinter dem Schlüssel (Sortierwert, id) der letzten geladenen Zeile fort. Damit kostet
+    jede Seite über den Index der Sortierspalte gleich viel, egal wie weit gescrollt wurde.
+    Sortiert wird absteigend nach der Sortierspalte (NULL-Werte stehen wie in SQLite am Ende)
+    oder, bei einer Volltextsuche, aufsteigend nach der Relevanz (FTS5-"rank", bm25).
+    """
+
+    error_occurred = pyqtSignal(str)
+
+    PAGE_SIZE = 200
+
+    def __init__(self, database_path, parent=None):
+        super().__init__(parent)
+        self.database_path = database_path
+        self._columns = []
+        self._column_index = {}
+        self._conditions = []
+        self._params = []
+        self._sort_column = "id"
+        self._search = None
+        self._rows = []
+        self._exhausted = True
+
+    ##########################################################################
+    # Abfrage setzen
+    ##########################################################################
+    def set_query(self, columns, conditions, params, sort_column, first_page=None, search=None):
+        """
+        Setzt Spalten, Filter und Sortierung neu und lädt die erste Seite.
+
+        Parameter:
+          columns (list): Anzuzeigende Spalten in Anzeigereihenfolge.
+          conditions (list): SQL-Bedingungen (werden mit AND verknüpft).
+          params (list): Parameter zu den Bedingungen.
+          sort_column (str): Spalte, nach der absteigend sortiert wird.
+          first_page (list): Bereits (z.B. im QueryScheduler) gelesene erste Seite,
+                             Ergebnis der Abfrage aus first_page_query(); sonst wird sie hier gelesen.
+          search (str): FTS5-Abfrage (siehe backend.search_index.fts_query); die Zeilen werden
+                        dann nach Relevanz statt nach sort_column sortiert.
+        """
+        self.beginResetModel()
+        self._columns = list(columns)
+        # Jede Zeile ist ein Tupel (id, Sortierwert, *Spalten)
+        self._column_index = {column: i + 2 for i, column in enumerate(self._columns)}
+        self._conditions = list(conditions)
+        self._params = list(params)
+        self._sort_column = sort_column
+        self._search = search
+        self._rows = []
+        self._exhausted = False
+        if first_page is not None:
+            self._rows = list(first_page)
+            self._exhausted = len(first_page) < self.PAGE_SIZE
+        self.endResetModel()
+        if first_page is None:
+            self.fetchMore(QModelIndex())
+
+    @classmethod
+    def first_page_query(cls, columns, conditions, params, sort_column, search=None):
+        """
+        Abfrage (query, params) der ersten Seite für die Argumente von set_query().
+        """
+        return cls._build_page_query(columns, conditions, params, sort_column, search, None)
+
+    def _page_query(self):
+        last_row = self._rows[-1] if self._rows else None
+        return self._build_page_query(
+            self._columns, self._conditions, self._params, self._sort_column, self._search, last_row
+        )
+
+    @classmethod
+    def _build_page_query(cls, columns, conditions, params, sort_column, search, last_row, limit=True):
+        """
+        Abfrage der Seite hinter last_row (None = erste Seite); mit limit=False ohne
+        LIMIT, d.h. alle folgenden Zeilen.
+        """
+        if search is not None:
+            return cls._build_search_page_query(columns, conditions, params, search, last_row, limit)
+        conditions = list(conditions)
+        params = list(params)
+        sort = sort_column
+        if last_row is not None:
+            last_id, last_value = last_row[0], last_row[1]
+            if last_value is None:
+                conditions.append(f"({sort} IS NULL AND id < ?)")
+                params.append(last_id)
+            else:
+                conditions.append(f"({sort} < ? OR ({sort} = ? AND id < ?) OR {sort} IS NULL)")
+                params.extend([last_value, last_value, last_id])
+
+        query = f"SELECT id, {', '.join([sort] + list(columns))} FROM analysis_results"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {sort} DESC, id DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(cls.PAGE_SIZE)
+        return query, params
+
+    @classmethod
+    def _build_search_page_query(cls, columns, conditions, params, search, last_row, limit):
+        # Kleinerer rank = relevanter; bei gleichem rank nach id
+        conditions = [f"{SEARCH_TABLE} MATCH ?"] + list(conditions)
+        params = [search] + list(params)
+        if last_row is not None:
+            conditions.append(f"({SEARCH_TABLE}.rank > ? OR ({SEARCH_TABLE}.rank = ? AND id > ?))")
+            params.extend([last_row[1], last_row[1], last_row[0]])
+
+        query = (
+            f"SELECT id, {', '.join([f'{SEARCH_TABLE}.rank'] + list(columns))} "
+            f"FROM analysis_results JOIN {SEARCH_TABLE} ON {SEARCH_TABLE}.rowid = analysis_results.id "
+            f"WHERE {' AND '.join(conditions)} "
+            f"ORDER BY {SEARCH_TABLE}.rank, id"
+        )
+        if limit:
+            query += " LIMIT ?"
+            params.append(cls.PAGE_SIZE)
+        return query, params
+
+    ##########################################################################
+    # Nachladen
+    ##########################################################################
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        query, params = self._page_query()
+        try:
+            page = get_connection(self.database_path).execute(query, params).fetchall()
+        except Exception as e:
+            self._exhausted = True
+            self.error_occurred.emit(str(e))
+            return
+
+        if len(page) < self.PAGE_SIZE:
+            self._exhausted = True
+        if page:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+            self._rows.extend(page)
+            self.endInsertRows()
+
+    ##########################################################################
+    # QAbstractTableModel
+    ##########################################################################
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._columns[section]
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        value = self._rows[index.row()][index.column() + 2]
+        # NULL steht für nicht anwendbare oder nicht berechnete Metriken
+        return "N/A" if value is None else str(value)
+
+    ##########################################################################
+    # Zugriff für AnalysisSection
+    ##########################################################################
+    def columns(self):
+        return list(self._columns)
+
+    def value(self, row, column):
+        """
+        Rohwert einer geladenen Zeile in der angegebenen Spalte.
+        """
+        return self._rows[row][self._column_index[column]]
+
+    def loaded_rows(self):
+        """
+        Alle bisher geladenen Zeilen als Dictionaries {Spalte: Anzeigetext}.
+        """
+        return self._as_dicts(self._rows)
+
+    def all_rows(self):
+        """
+        Alle Zeilen zu Filter, Suche und Sortierung der aktuellen Abfrage (nicht nur die
+        bisher geladenen Seiten) als Dictionaries {Spalte: Anzeigetext}. Die bereits
+        geladenen Zeilen werden übernommen, der Rest wird ohne LIMIT nachgelesen.
+        """
+        if self._exhausted:
+            return self.loaded_rows()
+        last_row = self._rows[-1] if self._rows else None
+        query, params = self._build_page_query(
+            self._columns, self._conditions, self._params, self._sort_column, self._search, last_row, limit=False
+        )
+        remaining = get_connection(self.database_path).execute(query, params).fetchall()
+        return self._as_dicts(self._rows + remaining)
+
+    def _as_dicts(self, rows):
+        return [
+            {
+                column: "N/A" if row[i] is None else str(row[i])
+                for column, i in self._column_index.items()
+            }
+            for row in rows
+        ]
@@ -1,6 +1,28 @@
 import json
+from PyQt5.QtCore import QThread, pyqtSignal
 from PyQt5.QtWidgets import QToolBar, QAction, QFileDialog, QMessageBox
 
+from frontend.components.analysis_section import DATABASE_PATH
+
+class ExportWorker(QThread):
+    """
+    Führt den spaltenorientierten Export im Hintergrund aus, damit die GUI reaktionsfähig bleibt.
+    """
+    finished_export = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, database_path, target):
+        super().__init__()
+        self.database_path = database_path
+        self.target = target
+
+    def run(self):
+        try:
+            from backend.export import export_results
+            self.finished_export.emit(export_results(self.database_path, self.target))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
 class Toolbar(QToolBar):
     def __init__(self, parent):
         super().__init__("Hauptmenü")
@@ -16,6 +38,12 @@ class Toolbar(QToolBar):
         self.export_json_action.triggered.connect(self.export_as_json)
         self.addAction(self.export_json_action)
 
+        # Alle Analyseergebnisse spaltenorientiert exportieren (Parquet bzw. .npz)
+        self.export_columnar_action = QAction("🗄 Ergebnisse exportieren", self)
+        self.export_columnar_action.triggered.connect(self.export_columnar)
+        self.addAction(self.export_columnar_action)
+        self.export_worker = None
+
         # Bericht als PDF speichern
         self.export_pdf_action = QAction("📄 PDF speichern", self)
         self.export_pdf_action.triggered.connect(self.export_as_pdf)
@@ -45,6 +73,39 @@ class Toolbar(QToolBar):
                 json.dump(data, f, indent=4)
             QMessageBox.information(self, "Erfolg", "Bericht erfolgreich als JSON gespeichert!")
 
+    def export_columnar(self):
+        """
+        Exportiert "analysis_results" und "node_metrics" aus der Datenbank (nicht nur die
+        angezeigten Zeilen) blockweise als Parquet bzw., ohne pyarrow, als NumPy-Archiv.
+        """
+        if self.export_worker is not None and self.export_worker.isRunning():
+            QMessageBox.information(self, "Export", "Es läuft bereits ein Export.")
+            return
+        # NumPy/pyarrow erst beim ersten Export laden (schnellerer Programmstart)
+        from backend.export import PYARROW_AVAILABLE
+        if PYARROW_AVAILABLE:
+            file_filter = "Parquet-Dateien (*.parquet);;NumPy-Archive (*.npz)"
+        else:
+            file_filter = "NumPy-Archive (*.npz)"
+        file_name, _ = QFileDialog.getSaveFileName(self, "Ergebnisse exportieren", "", file_filter)
+        if file_name:
+            self.export_columnar_action.setEnabled(False)
+            self.export_worker = ExportWorker(DATABASE_PATH, file_name)
+            self.export_worker.finished_export.connect(self.on_export_finished)
+            self.export_worker.error_occurred.connect(self.on_export_error)
+            self.export_worker.start()
+
+    def on_export_finished(self, info):
+        self.export_columnar_action.setEnabled(True)
+        rows = ", ".join(f"{table}: {count}" for table, count in info["rows"].items())
+        QMessageBox.information(
+            self, "Erfolg", f"Ergebnisse exportiert ({rows} Zeilen):\n" + "\n".join(info["files"])
+        )
+
+    def on_export_error(self, message):
+        self.export_columnar_action.setEnabled(True)
+        QMessageBox.critical(self, "Fehler", f"Export fehlgeschlagen: {message}")
+
     def export_as_pdf(self):
         file_name, _ = QFileDialog.getSaveFileName(self, "PDF speichern", "", "PDF-Dateien (*.pdf)")
         if file_name:
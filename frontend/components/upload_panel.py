@@ -8,7 +8,7 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import QThread, pyqtSignal
 
-from backend import pipeline
+from backend.utils import get_file_extension
 
 def guess_data_source_by_extension(filename):
     """
@@ -16,10 +16,10 @@ def guess_data_source_by_extension(filename):
       .graphml -> "TopologyZoo"
       .xml     -> "SNDlib"
       .cch     -> "Rocketfuel"
-      .txt     -> "CAIDA_AS"
+      .txt     -> "CAIDA_AS" (auch .txt.gz / .txt.bz2)
     Ansonsten -> "Unbekannt".
     """
-    ext = os.path.splitext(filename)[1].lower()
+    ext = get_file_extension(filename)
     if ext == ".graphml":
         return "TopologyZoo"
     elif ext == ".xml":
@@ -34,16 +34,43 @@ def guess_data_source_by_extension(filename):
 
 class AnalysisThread(QThread):
     finished = pyqtSignal()
+    file_finished = pyqtSignal(str, bool)  # (Dateiname, erfolgreich)
 
     def __init__(self, file_paths):
         super().__init__()
         self.file_paths = file_paths
+        # Pipeline (NetworkX, Analyzer) erst bei der ersten Analyse laden (schnellerer Programmstart)
+        from backend import pipeline
+        # Die GUI läuft mit mehreren Threads; Worker- und Metrikprozesse daher nicht per fork starten
+        self.mp_context = pipeline.thread_safe_mp_context()
+        self.cancel_event = pipeline.create_cancel_event(self.mp_context)
+        self.cancelled = False
 
     def run(self):
-        # Pipeline-Aufruf 
-        pipeline.process_files(self.file_paths)
+        # Pipeline-Aufruf: mehrere Dateien werden parallel auf alle CPU-Kerne verteilt,
+        # der Status jeder Datei wird gemeldet, sobald sie fertig ist.
+        from backend import pipeline
+        pipeline.process_files(
+            self.file_paths,
+            parallel=True,
+            on_result=self.on_file_result,
+            cancel_event=self.cancel_event,
+            mp_context=self.mp_context,
+        )
         self.finished.emit()
 
+    def cancel(self):
+        """
+        Bricht die laufende Analyse ab: Es werden keine weiteren Dateien gestartet und
+        laufende Metrikberechnungen beendet.
+        """
+        self.cancelled = True
+        self.cancel_event.set()
+
+    def on_file_result(self, file_path, result):
+        success = result is not None and "error" not in result
+        self.file_finished.emit(os.path.basename(file_path), success)
+
 
 class UploadPanel(QWidget):
     def __init__(self, parent=None):
@@ -62,7 +89,7 @@ class UploadPanel(QWidget):
         button_layout.addWidget(self.upload_button)
 
         self.analyze_button = QPushButton("🔍 Analyse starten")
-        self.analyze_button.clicked.connect(self.start_analysis)
+        self.analyze_button.clicked.connect(self.toggle_analysis)
         button_layout.addWidget(self.analyze_button)
 
         layout.addLayout(button_layout)
@@ -84,7 +111,7 @@ class UploadPanel(QWidget):
         """
         files, _ = QFileDialog.getOpenFileNames(
             self, "Dateien auswählen", "",
-            "Unterstützte Dateien (*.graphml *.xml *.cch *.txt);;Alle Dateien (*)"
+            "Unterstützte Dateien (*.graphml *.xml *.cch *.txt *.txt.gz *.txt.bz2);;Alle Dateien (*)"
         )
         if files:
             destination_folder = "temp_uploads"
@@ -130,6 +157,17 @@ class UploadPanel(QWidget):
         item_status = QTableWidgetItem(status)
         self.files_table.setItem(row_count, 2, item_status)
 
+    def toggle_analysis(self):
+        """
+        Startet die Analyse bzw. bricht eine laufende Analyse ab.
+        """
+        if getattr(self, "analysis_thread", None) is not None and self.analysis_thread.isRunning():
+            self.analysis_thread.cancel()
+            self.analyze_button.setEnabled(False)
+            self.status_label.setText("⏹ Analyse wird abgebrochen...")
+        else:
+            self.start_analysis()
+
     def start_analysis(self):
         """
         Startet die Analyse asynchron.
@@ -145,17 +183,41 @@ class UploadPanel(QWidget):
 
         self.analysis_thread = AnalysisThread(self.uploaded_files)
         self.analysis_thread.finished.connect(self.analysis_finished)
+        self.analysis_thread.file_finished.connect(self.file_analysis_finished)
         self.analysis_thread.start()
+        self.analyze_button.setText("⏹ Analyse abbrechen")
         self.status_label.setText("🔍 Analyse gestartet...")
 
+    def file_analysis_finished(self, filename, success):
+        """
+        Wird für jede einzelne Datei aufgerufen, sobald ihre Analyse abgeschlossen ist.
+        """
+        if success:
+            status = "analysiert"
+        elif self.analysis_thread.cancelled:
+            status = "⏹ abgebrochen"
+        else:
+            status = "⚠ Fehler"
+        for row in range(self.files_table.rowCount()):
+            item = self.files_table.item(row, 0)
+            if item and item.text() == filename:
+                self.files_table.setItem(row, 2, QTableWidgetItem(status))
+
     def analysis_finished(self):
         """
         Wird aufgerufen, wenn die Analyse abgeschlossen ist.
         Setzt den Status aller Dateien auf '✔️ analysiert'.
         """
-        self.status_label.setText("✅ Analyse abgeschlossen!")
+        cancelled = self.analysis_thread.cancelled
+        self.analyze_button.setText("🔍 Analyse starten")
+        self.analyze_button.setEnabled(True)
+        self.status_label.setText("⏹ Analyse abgebrochen." if cancelled else "✅ Analyse abgeschlossen!")
         for row in range(self.files_table.rowCount()):
-            self.files_table.setItem(row, 2, QTableWidgetItem("analysiert"))
+            # Bereits einzeln gemeldete Dateien (z.B. mit Fehler) nicht überschreiben
+            item = self.files_table.item(row, 2)
+            if item is None or item.text() == "🔄 in Analyse...":
+                status = "⏹ abgebrochen" if cancelled else "analysiert"
+                self.files_table.setItem(row, 2, QTableWidgetItem(status))
         # Greife auf das AnalysisSection des SingleGraphTab zu, das über das Parent-Widget erreichbar ist.
         if hasattr(self.parent, "single_graph_tab") and hasattr(self.parent.single_graph_tab, "analysis_section"):
             self.parent.single_graph_tab.analysis_section.load_analysis_results()
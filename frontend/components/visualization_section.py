@@ -1,18 +1,20 @@
 # frontend/components/visualization_section.py
 
 import os
-import networkx as nx
-import numpy as np
-import matplotlib.pyplot as plt
+import time
+from collections import OrderedDict
 
 from PyQt5.QtCore import QThread, pyqtSignal
-from PyQt5.QtWidgets import QWidget, QVBoxLayout
+from PyQt5.QtGui import QCursor
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QToolTip
 
 # --- Funktionen zum Einlesen der GraphML-Datei ---
 def load_graph(graphml_path):
     """
     Lädt den Graphen aus einer GraphML-Datei mithilfe von NetworkX.
     """
+    # NetworkX erst bei der ersten Visualisierung laden (schnellerer Programmstart)
+    import networkx as nx
     try:
         G = nx.read_graphml(graphml_path)
         print(f"Graph geladen: {G.number_of_nodes()} Knoten, {G.number_of_edges()} Kanten")
@@ -21,82 +23,93 @@ def load_graph(graphml_path):
         print("Fehler beim Laden der GraphML-Datei:", e)
         return None
 
-# --- Funktion zur Layout-Berechnung für Detailmodus (z.B. spring_layout) ---
-def compute_layout(G):
+# --- Funktion zur Layout-Berechnung für Detailmodus ---
+def compute_layout(G, progress=None, cancelled=None):
     """
-    Berechnet ein Layout für den Graphen (z. B. spring_layout).
-    Bei großen Netzwerken können Parameter wie 'k' und 'iterations' angepasst werden.
+    Berechnet ein kraftbasiertes Layout für den Graphen (Barnes-Hut, Mehrebenen-Verfahren,
+    siehe frontend/components/layout_engine.py).
+
+    Parameter:
+      progress (callable): Erhält Zwischenstände {node: (x, y)} während der Berechnung.
+      cancelled (callable): Liefert True, wenn die Berechnung abgebrochen werden soll.
+
+    Rückgabe:
+      dict {node: (x, y)} oder None bei einem Fehler bzw. Abbruch.
     """
+    from frontend.components.layout_engine import iter_layout
     try:
-        pos = nx.spring_layout(G, k=0.1, iterations=50)
-        return pos
+        for pos, done in iter_layout(G):
+            if done:
+                return pos
+            if cancelled is not None and cancelled():
+                return None
+            if progress is not None:
+                progress(pos)
     except Exception as e:
         print("Fehler bei der Layout-Berechnung:", e)
         return None
 
-# --- Funktion zur Layout-Berechnung für aggregierte Darstellung (Platzhalter) ---
+# --- Funktion zur Layout-Berechnung für aggregierte Darstellung ---
 def compute_aggregated_layout(G):
     """
-    Berechnet ein aggregiertes Layout für große Netzwerke.
-    Hier kann später ein Clustering-Algorithmus (z. B. Louvain) integriert werden,
-    um Cluster zu bilden und diese als 'Super-Knoten' anzuzeigen.
-    Aktuell nutzen wir als Platzhalter das normale Layout.
+    Berechnet ein aggregiertes Layout für große Netzwerke: Communities (Louvain bzw.
+    Label Propagation) werden als 'Super-Knoten' angeordnet, ihre Knoten darin verteilt
+    (siehe frontend/components/community_layout.py).
+
+    Rückgabe:
+      AggregatedLayout oder None bei einem Fehler.
     """
-    # Hier sollte ein echter Aggregationsprozess erfolgen.
-    # Als Platzhalter verwenden wir einfach compute_layout.
-    return compute_layout(G)
+    from frontend.components.community_layout import compute_aggregated_layout as aggregate
+    try:
+        return aggregate(G)
+    except Exception as e:
+        print("Fehler bei der Berechnung des aggregierten Layouts:", e)
+        return None
 
 # --- QThread für asynchrone Layout-Berechnung ---
 class LayoutWorker(QThread):
-    layout_ready = pyqtSignal(dict)
+    # Zwischenstände des Detailmodus (dict)
+    layout_progress = pyqtSignal(object)
+    # dict (Detailmodus) bzw. AggregatedLayout (aggregierter Modus), None bei einem Fehler
+    layout_ready = pyqtSignal(object)
     
-    def __init__(self, G, mode="detail"):
+    def __init__(self, G, mode="detail", cache_key=None):
         super().__init__()
         self.G = G
         self.mode = mode  # "detail" oder "aggregated"
+        # Schlüssel im Layout-Cache (siehe layout_cache.py), None = ohne Cache
+        self.cache_key = cache_key
         
     def run(self):
+        from frontend.components.layout_cache import load_layout, store_layout
+        if self.cache_key is not None:
+            pos = load_layout(self.cache_key, self.G)
+            if pos is not None:
+                print("Layout aus dem Cache geladen.")
+                self.layout_ready.emit(pos)
+                return
+
         if self.mode == "detail":
-            pos = compute_layout(self.G)
+            pos = compute_layout(self.G, progress=self.layout_progress.emit, cancelled=self.isInterruptionRequested)
         else:
             pos = compute_aggregated_layout(self.G)
+        if pos is not None and self.cache_key is not None:
+            store_layout(self.cache_key, self.G, pos)
         self.layout_ready.emit(pos)
 
-# --- Matplotlib-Canvas zur Darstellung des Graphen ---
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-
-class MatplotlibCanvas(FigureCanvas):
-    def __init__(self, G, pos, parent=None):
-        self.figure = Figure()
-        super(MatplotlibCanvas, self).__init__(self.figure)
-        self.setParent(parent)
-        self.G = G
-        self.pos = pos
-        self._draw_graph()
-    
-    def _draw_graph(self):
-        """
-        Zeichnet den Graphen:
-          - Knoten werden als Punkte dargestellt.
-          - Kanten werden als Linien gezeichnet.
-        """
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        # Zeichne den Graphen mithilfe von networkx und matplotlib
-        nx.draw_networkx(
-            self.G, pos=self.pos, ax=ax,
-            node_color='blue', edge_color='gray',
-            node_size=50, with_labels=False
-        )
-        ax.set_axis_off()
-        self.draw()
-
 # --- PyQt-Widget zur Einbettung des Matplotlib-Canvas ---
 class VisualizationSection(QWidget):
     # Schwellenwert, ab dem der aggregierte Modus verwendet wird z.b NODE_THRESHOLD =500
     NODE_THRESHOLD = 500
 
+    # Zwischenstände des Layouts kosten Rechenzeit im GUI-Thread, die der Berechnung fehlt:
+    # nach einem Zwischenstand, dessen Zeichnen t Sekunden dauerte, wird der nächste erst
+    # nach PROGRESS_PAUSE_FACTOR * t Sekunden angezeigt
+    PROGRESS_PAUSE_FACTOR = 4
+
+    # Anzahl zuletzt geöffneter Graphen, die im Speicher bleiben (erneutes Öffnen ohne Einlesen)
+    RECENT_GRAPHS = 3
+
     def __init__(self, parent=None):
         """
         Dieses Widget integriert die Visualisierung in die GUI.
@@ -108,6 +121,46 @@ class VisualizationSection(QWidget):
         self.pos = None
         self.canvas = None
         self.mode = None  # "detail" oder "aggregated"
+        self.title = ""
+        # Geöffnete Datei: vollständiger Graph und Hash des Dateiinhalts (Schlüssel des Layout-Caches)
+        self.root_graph = None
+        self.content_hash = None
+        # Dateiname der geöffneten Datei und ihre gespeicherten Knotenmetriken (beim ersten
+        # Zeigen auf einen Knoten aus der Datenbank gelesen)
+        self.file_name = None
+        self._node_metrics = None
+        # (Pfad, Größe, Änderungszeit) -> (Graph, Hash) der zuletzt geöffneten Dateien
+        self.recent_graphs = OrderedDict()
+        # Zuletzt berechnetes geografisches Layout (Graph, Layout oder None)
+        self._geo_cache = (None, None)
+        # Drill-down: zuvor angezeigte Ansichten (G, Layout, Modus, Titel) für "Zurück"
+        self.history = []
+
+        # Kopfzeile mit der aktuellen Ansicht und "Zurück" (nur nach einem Drill-down sichtbar)
+        header = QHBoxLayout()
+        self.back_button = QPushButton("◀ Zurück")
+        self.back_button.clicked.connect(self.go_back)
+        self.back_button.setVisible(False)
+        header.addWidget(self.back_button)
+        self.view_label = QLabel("")
+        header.addWidget(self.view_label, stretch=1)
+        # Im aggregierten Modus: alle Knoten einzeln anordnen (kraftbasiertes Layout)
+        self.detail_button = QPushButton("Alle Knoten anzeigen")
+        self.detail_button.clicked.connect(self.show_all_nodes)
+        self.detail_button.setVisible(False)
+        header.addWidget(self.detail_button)
+        # Wechsel zwischen geografischem und berechnetem Layout (nur bei Knotenkoordinaten)
+        self.geo_button = QPushButton("")
+        self.geo_button.clicked.connect(self.toggle_geographic)
+        self.geo_button.setVisible(False)
+        header.addWidget(self.geo_button)
+        self.layout().addLayout(header)
+        # Metriken des zuletzt angeklickten Knotens
+        self.node_label = QLabel("")
+        self.node_label.setVisible(False)
+        self.layout().addWidget(self.node_label)
+        self.layout_worker = None
+        self._next_progress_update = 0.0
 
     def load_graph_from_path(self, graphml_path):
         """
@@ -117,36 +170,254 @@ class VisualizationSection(QWidget):
           - Berechnet das Layout asynchron.
           - Aktualisiert den Canvas (entfernt den alten und fügt einen neuen hinzu).
         """
-        new_G = load_graph(graphml_path)
+        new_G, content_hash = self._open_graph(graphml_path)
         if new_G is None:
             print("Fehler: Neuer Graph konnte nicht geladen werden.")
             return
 
+        self.history = []
+        self.root_graph = new_G
+        self.content_hash = content_hash
+        self.file_name = os.path.basename(graphml_path)
+        self._node_metrics = None
+        self.show_graph(new_G, os.path.basename(graphml_path))
+
+    def _open_graph(self, graphml_path):
+        """
+        Liest die GraphML-Datei ein, sofern sie nicht unverändert unter den zuletzt
+        geöffneten Graphen ist.
+
+        Rückgabe:
+          tuple: (Graph oder None, SHA-256 des Dateiinhalts)
+        """
+        from backend.result_cache import file_content_hash
+        try:
+            stat = os.stat(graphml_path)
+        except OSError as e:
+            print("Fehler beim Laden der GraphML-Datei:", e)
+            return None, None
+        key = (os.path.abspath(graphml_path), stat.st_size, stat.st_mtime_ns)
+        if key in self.recent_graphs:
+            self.recent_graphs.move_to_end(key)
+            print("Graph aus dem Speicher übernommen.")
+            return self.recent_graphs[key]
+
+        G = load_graph(graphml_path)
+        if G is None:
+            return None, None
+        entry = (G, file_content_hash(graphml_path))
+        self.recent_graphs[key] = entry
+        while len(self.recent_graphs) > self.RECENT_GRAPHS:
+            self.recent_graphs.popitem(last=False)
+        return entry
+
+    def _geographic_layout(self, G):
+        """
+        Geografisches Layout des Graphen (siehe layout_engine.geographic_layout) oder None.
+        """
+        if self._geo_cache[0] is not G:
+            from frontend.components.layout_engine import geographic_layout
+            self._geo_cache = (G, geographic_layout(G))
+        return self._geo_cache[1]
+
+    def show_graph(self, G, title, mode=None):
+        """
+        Zeigt den Graphen an. Ohne vorgegebenen Modus wird das geografische Layout verwendet,
+        falls die Knoten Koordinaten haben, sonst bestimmt die Knotenzahl den Modus.
+        Berechnete Layouts werden aus dem Layout-Cache geladen bzw. dort abgelegt.
+        """
+        # Eine noch laufende Berechnung wird nicht mehr gebraucht
+        if self.layout_worker is not None:
+            self.layout_worker.requestInterruption()
+
+        if mode in (None, "geo"):
+            geo = self._geographic_layout(G)
+            if geo is not None:
+                print("Geografisches Layout aus den Knotenkoordinaten.")
+                self.layout_worker = None
+                self.G, self.pos, self.mode, self.title = G, geo, "geo", title
+                self._show_canvas()
+                return
+            mode = None
+
         # Bestimme den Modus basierend auf der Knotenzahl:
-        if new_G.number_of_nodes() < self.NODE_THRESHOLD:
-            self.mode = "detail"
+        if mode == "detail" or (mode is None and G.number_of_nodes() < self.NODE_THRESHOLD):
+            mode = "detail"
             print("Detailmodus aktiviert.")
         else:
-            self.mode = "aggregated"
-            print("Aggregierter Modus aktiviert (Clustering/Sampling wird angewendet).")
-        
+            mode = "aggregated"
+            print("Aggregierter Modus aktiviert (Communities werden als Super-Knoten dargestellt).")
+        self.title = title
+        self.view_label.setText(f"{title} – Layout wird berechnet...")
+
+        from frontend.components.layout_cache import layout_cache_key
+        cache_key = None
+        if self.content_hash is not None:
+            cache_key = layout_cache_key(self.content_hash, mode, None if G is self.root_graph else G)
+
         # Starte asynchron die Layout-Berechnung im entsprechenden Modus
-        self.layout_worker = LayoutWorker(new_G, mode=self.mode)
+        self.layout_worker = LayoutWorker(G, mode=mode, cache_key=cache_key)
+        self.layout_worker.layout_progress.connect(self.on_layout_progress)
         self.layout_worker.layout_ready.connect(self.on_layout_ready)
         self.layout_worker.start()
 
+    def on_layout_progress(self, pos):
+        """
+        Zeigt einen Zwischenstand der Layout-Berechnung (Detailmodus) an.
+        """
+        if self.sender() is not self.layout_worker:
+            return
+        start = time.perf_counter()
+        if start < self._next_progress_update:
+            return
+        self._update_view(pos)
+        self.view_label.setText(f"{self.title} – Layout wird berechnet (Zwischenstand)...")
+        end = time.perf_counter()
+        self._next_progress_update = end + self.PROGRESS_PAUSE_FACTOR * (end - start)
+
     def on_layout_ready(self, pos):
         """
         Callback, wenn das Layout asynchron berechnet wurde.
         Hier wird der Matplotlib-Canvas erstellt und in das Widget eingebettet.
         """
+        if self.sender() is not self.layout_worker:
+            return  # Ergebnis einer inzwischen ersetzten Berechnung
+        if pos is None:
+            self.view_label.setText(f"{self.title} – Layout konnte nicht berechnet werden.")
+            return
+        if self.layout_worker.mode == "aggregated" and len(pos.communities) == 1:
+            # Nur eine Community (z.B. lauter isolierte Knoten): Aggregieren zeigt nichts Neues
+            self.show_graph(self.layout_worker.G, self.title, mode="detail")
+            return
+        self._update_view(pos)
+        self.view_label.setText(f"{self.title} ({self.G.number_of_nodes()} Knoten)")
+        print("Graph und Layout wurden aktualisiert im Modus:", self.mode)
+
+    def _update_view(self, pos):
+        """
+        Übernimmt Graph und Layout des laufenden LayoutWorkers. Zeigt der Canvas bereits
+        diesen Graphen (Zwischenstand), werden nur die Positionen aktualisiert.
+        """
+        from frontend.components.graph_canvas import MatplotlibCanvas
+        same_graph = self.G is self.layout_worker.G and self.mode == self.layout_worker.mode
         self.pos = pos
         self.G = self.layout_worker.G  # Aktualisiere den Graphen
+        self.mode = self.layout_worker.mode
+        if same_graph and isinstance(self.canvas, MatplotlibCanvas):
+            self.canvas.update_positions(pos)
+        else:
+            self._show_canvas()
+
+    def _show_canvas(self):
+        # matplotlib erst beim ersten Zeichnen laden (schnellerer Programmstart)
+        from frontend.components.graph_canvas import AggregatedCanvas, MatplotlibCanvas
         # Entferne den alten Canvas, falls vorhanden
         if self.canvas is not None:
             self.layout().removeWidget(self.canvas)
             self.canvas.setParent(None)
         # Erstelle einen neuen Canvas und füge ihn dem Layout hinzu
-        self.canvas = MatplotlibCanvas(self.G, self.pos, parent=self)
+        if self.mode == "aggregated":
+            self.canvas = AggregatedCanvas(self.G, self.pos, parent=self)
+            self.canvas.cluster_clicked.connect(self.drill_down)
+        else:
+            self.canvas = MatplotlibCanvas(self.G, self.pos, parent=self, equal_aspect=self.mode == "geo")
+            self.canvas.node_hovered.connect(self.on_node_hovered)
+            self.canvas.node_clicked.connect(self.on_node_clicked)
         self.layout().addWidget(self.canvas)
-        print("Graph und Layout wurden aktualisiert im Modus:", self.mode)
+        self.node_label.setVisible(False)
+        self.view_label.setText(f"{self.title} ({self.G.number_of_nodes()} Knoten)")
+        self.back_button.setVisible(bool(self.history))
+        self.detail_button.setVisible(self.mode == "aggregated")
+        self.geo_button.setText("Kraftbasiertes Layout" if self.mode == "geo" else "Geografisches Layout")
+        self.geo_button.setVisible(self.mode == "geo" or self._geographic_layout(self.G) is not None)
+
+    def toggle_geographic(self):
+        """
+        Wechselt zwischen dem geografischen und dem berechneten Layout der aktuellen Ansicht.
+        """
+        if self.G is None:
+            return
+        if self.mode == "geo":
+            mode = "detail" if self.G.number_of_nodes() < self.NODE_THRESHOLD else "aggregated"
+        else:
+            mode = "geo"
+        self.show_graph(self.G, self.title, mode)
+
+    def drill_down(self, community):
+        """
+        Öffnet eine Community des aggregierten Layouts als eigenen Graphen
+        (Detailmodus bzw. erneut aggregiert, falls sie groß ist).
+        """
+        members = self.pos.communities[community]
+        self.history.append((self.G, self.pos, self.mode, self.title))
+        subgraph = self.G.subgraph(members).copy()
+        # Besteht die Ansicht nur aus einer Community, führt ein erneutes Aggregieren nicht weiter
+        mode = "detail" if len(members) == self.G.number_of_nodes() else None
+        self.show_graph(subgraph, f"{self.title} › Community {community + 1}", mode)
+
+    def show_all_nodes(self):
+        """
+        Zeigt den aktuell aggregierten Graphen mit allen Knoten (Detailmodus); "Zurück"
+        kehrt zur aggregierten Ansicht zurück.
+        """
+        if self.mode != "aggregated":
+            return
+        self.history.append((self.G, self.pos, self.mode, self.title))
+        self.show_graph(self.G, f"{self.title} › alle Knoten", mode="detail")
+
+    def go_back(self):
+        """
+        Zeigt die Ansicht vor dem letzten Drill-down wieder an (ohne Neuberechnung).
+        """
+        if not self.history:
+            return
+        self.G, self.pos, self.mode, self.title = self.history.pop()
+        if self.layout_worker is not None:
+            self.layout_worker.requestInterruption()
+        self.layout_worker = None
+        self._show_canvas()
+
+    ##############################################################################
+    # Knotenmetriken unter dem Mauszeiger
+    ##############################################################################
+    def _stored_node_metrics(self):
+        """
+        Knotenmetriken der neuesten Analyse der geöffneten Datei {node_id: {metric: value}}.
+        """
+        if self._node_metrics is None:
+            from backend.database_handler import load_node_metrics
+            from frontend.components.analysis_section import DATABASE_PATH
+            try:
+                self._node_metrics = load_node_metrics(DATABASE_PATH, self.file_name)
+            except Exception as e:
+                print("Fehler beim Laden der Knotenmetriken:", e)
+                self._node_metrics = {}
+        return self._node_metrics
+
+    def _node_description(self, node):
+        lines = [f"Knoten {node}", f"Grad: {self.G.degree(node)}"]
+        metrics = self._stored_node_metrics().get(str(node))
+        if metrics:
+            lines += [f"{metric}: {value:.4g}" for metric, value in sorted(metrics.items()) if value is not None]
+        else:
+            lines.append("Keine gespeicherten Knotenmetriken (Datei nicht analysiert)")
+        return lines
+
+    def on_node_hovered(self, node):
+        """
+        Zeigt die Metriken des Knotens unter dem Mauszeiger als Tooltip an.
+        """
+        if node is None:
+            QToolTip.hideText()
+        else:
+            QToolTip.showText(QCursor.pos(), "\n".join(self._node_description(node)), self.canvas)
+
+    def on_node_clicked(self, node):
+        """
+        Zeigt die Metriken des angeklickten Knotens unter der Kopfzeile an.
+        """
+        if node is None:
+            self.node_label.setVisible(False)
+            return
+        self.node_label.setText(" | ".join(self._node_description(node)))
+        self.node_label.setVisible(True)
@@ -1,5 +1,6 @@
 import os
 import sys
+import multiprocessing
 from PyQt5.QtWidgets import QApplication
 from backend.database_handler import initialize_database
 from frontend.gui_main import NetworkAnalysisGUI
@@ -16,6 +17,9 @@ def ensure_temp_uploads():
         print(f"'{temp_dir}' existiert bereits.")
 
 if __name__ == "__main__":
+    # Notwendig für die parallele Analyse (ProcessPoolExecutor) in der PyInstaller-Version
+    multiprocessing.freeze_support()
+
     # Sicherstellen, dass der temp_uploads/ Ordner existiert.
     ensure_temp_uploads()
 
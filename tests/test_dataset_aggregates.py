@@ -0,0 +1,111 @@
+import random
+import statistics
+
+import pytest
+
+from backend.database_handler import connect_database
+from backend.dataset_aggregates import GRAPH_COUNT, aggregate_query, rebuild_statements
+from backend.schema import migrate
+
+@pytest.fixture
+def connection(tmp_path):
+    connection = connect_database(str(tmp_path / "aggregates.db"))
+    migrate(connection)
+    yield connection
+    connection.close()
+
+def _insert(connection, project, nodes, density):
+    cursor = connection.execute(
+        "INSERT INTO analysis_results (Project_name, File_name, number_of_nodes, density) VALUES (?, ?, ?, ?)",
+        (project, f"{project}-{nodes}.graphml", nodes, density),
+    )
+    return cursor.lastrowid
+
+def _expected(connection, project, metric):
+    values = [row[0] for row in connection.execute(
+        f"SELECT {metric} FROM analysis_results WHERE Project_name = ? AND {metric} IS NOT NULL", (project,)
+    )]
+    if not values:
+        return None
+    return {
+        "count": len(values),
+        "mean": statistics.fmean(values),
+        "min": min(values),
+        "max": max(values),
+        "variance": statistics.variance(values) if len(values) > 1 else None,
+    }
+
+def _actual(connection, project, metric):
+    query = aggregate_query(
+        [(metric, statistic, statistic) for statistic in ("count", "mean", "min", "max", "variance")],
+        by_project=False,
+    )
+    row = connection.execute(query, (project,)).fetchone()
+    if row[0] is None:
+        return None
+    return dict(zip(("count", "mean", "min", "max", "variance"), row))
+
+def _assert_matches(connection, project, metric):
+    expected = _expected(connection, project, metric)
+    actual = _actual(connection, project, metric)
+    if expected is None:
+        assert actual is None
+        return
+    assert actual["count"] == expected["count"]
+    assert actual["min"] == expected["min"]
+    assert actual["max"] == expected["max"]
+    assert actual["mean"] == pytest.approx(expected["mean"], rel=1e-9)
+    if expected["variance"] is None:
+        assert actual["variance"] is None
+    else:
+        assert actual["variance"] == pytest.approx(expected["variance"], rel=1e-6, abs=1e-12)
+
+def test_triggers_follow_inserts_and_deletes(connection):
+    rng = random.Random(7)
+    ids = []
+    for _ in range(60):
+        project = rng.choice(["Zoo", "SNDlib"])
+        density = rng.random() if rng.random() > 0.2 else None
+        ids.append(_insert(connection, project, rng.randint(2, 500), density))
+    connection.commit()
+    for project in ("Zoo", "SNDlib"):
+        for metric in ("number_of_nodes", "density"):
+            _assert_matches(connection, project, metric)
+
+    # Löschen in zufälliger Reihenfolge, darunter Minimum und Maximum
+    rng.shuffle(ids)
+    for graph_id in ids[:45]:
+        connection.execute("DELETE FROM analysis_results WHERE id = ?", (graph_id,))
+        for project in ("Zoo", "SNDlib"):
+            _assert_matches(connection, project, "number_of_nodes")
+            _assert_matches(connection, project, "density")
+
+def test_update_moves_graph_between_datasets(connection):
+    graph_id = _insert(connection, "Zoo", 10, 0.5)
+    _insert(connection, "Zoo", 20, 0.25)
+    connection.execute("UPDATE analysis_results SET Project_name = 'Rocketfuel' WHERE id = ?", (graph_id,))
+
+    for project in ("Zoo", "Rocketfuel"):
+        _assert_matches(connection, project, "number_of_nodes")
+    assert _actual(connection, "Zoo", GRAPH_COUNT)["count"] == 1
+    assert _actual(connection, "Rocketfuel", GRAPH_COUNT)["count"] == 1
+
+def test_empty_dataset_is_removed(connection):
+    graph_id = _insert(connection, "Zoo", 10, 0.5)
+    connection.execute("DELETE FROM analysis_results WHERE id = ?", (graph_id,))
+    assert connection.execute("SELECT COUNT(*) FROM dataset_aggregates").fetchone()[0] == 0
+
+def test_rebuild_matches_triggers(connection):
+    rng = random.Random(3)
+    for _ in range(30):
+        _insert(connection, rng.choice(["Zoo", "CAIDA", None]), rng.randint(2, 50), rng.random())
+    connection.execute("DELETE FROM analysis_results WHERE id % 4 = 0")
+    incremental = connection.execute("SELECT * FROM dataset_aggregates ORDER BY project_name, metric").fetchall()
+
+    for statement in rebuild_statements():
+        connection.execute(statement)
+    rebuilt = connection.execute("SELECT * FROM dataset_aggregates ORDER BY project_name, metric").fetchall()
+
+    assert [row[:3] for row in incremental] == [row[:3] for row in rebuilt]
+    for before, after in zip(incremental, rebuilt):
+        assert before[3:] == pytest.approx(after[3:], rel=1e-9, abs=1e-9)
@@ -0,0 +1,54 @@
+import networkx as nx
+import pytest
+
+from backend.analyzers.distance_metrics import compute_distance_metrics
+
+GRAPHS = {
+    "petersen": nx.petersen_graph(),
+    "path": nx.path_graph(7),
+    "disconnected": nx.disjoint_union(nx.cycle_graph(4), nx.path_graph(3)),
+    "random": nx.gnp_random_graph(40, 0.1, seed=1),
+    "directed_cycle": nx.DiGraph(nx.cycle_graph(6, create_using=nx.DiGraph)),
+    "directed_random": nx.gnp_random_graph(30, 0.08, seed=2, directed=True),
+    "multigraph": nx.MultiGraph([(0, 1), (0, 1), (1, 2), (2, 3), (3, 0), (2, 2)]),
+}
+
+def _connected(G):
+    return nx.is_strongly_connected(G) if G.is_directed() else nx.is_connected(G)
+
+@pytest.mark.parametrize("name", GRAPHS)
+def test_matches_networkx(name):
+    G = GRAPHS[name]
+    metrics = compute_distance_metrics(G)
+
+    if _connected(G):
+        assert metrics["eccentricity"] == nx.eccentricity(G)
+        assert metrics["diameter"] == nx.diameter(G)
+        assert metrics["radius"] == nx.radius(G)
+        assert sorted(metrics["center"]) == sorted(nx.center(G))
+        assert sorted(metrics["periphery"]) == sorted(nx.periphery(G))
+    else:
+        for key in ("eccentricity", "diameter", "radius", "center", "periphery"):
+            assert metrics[key] is None
+
+    if G.is_directed():
+        assert metrics["global_efficiency"] is None
+    else:
+        assert metrics["global_efficiency"] == pytest.approx(nx.global_efficiency(G))
+
+    expected = nx.closeness_centrality(G)
+    assert metrics["closeness_centrality"].keys() == expected.keys()
+    for node, value in expected.items():
+        assert metrics["closeness_centrality"][node] == pytest.approx(value)
+
+def test_without_closeness():
+    assert compute_distance_metrics(GRAPHS["petersen"], closeness=False)["closeness_centrality"] is None
+
+def test_single_node():
+    G = nx.Graph()
+    G.add_node("a")
+    metrics = compute_distance_metrics(G)
+    assert metrics["diameter"] == 0
+    assert metrics["center"] == ["a"]
+    assert metrics["global_efficiency"] == 0
+    assert metrics["closeness_centrality"] == {"a": 0.0}
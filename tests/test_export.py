@@ -0,0 +1,78 @@
+import math
+
+import numpy as np
+import pytest
+
+from backend import export
+from backend.database_handler import close_connections, connect_database, initialize_database, save_many
+from backend.node_metrics import add_node_metrics
+
+@pytest.fixture
+def database(tmp_path):
+    database_path = str(tmp_path / "export.db")
+    initialize_database(database_path)
+    results_list = []
+    for i in range(5):
+        results = {
+            "project_name": "Zoo" if i % 2 else "SNDlib",
+            "file_name": f"Grafik_{i}_ü.graphml",
+            "number_of_nodes": 10 + i,
+            "node_connectivity": "N/A" if i == 3 else i,
+            "density": 0.1 * i,
+            "centrality_mode": None if i == 0 else "exact",
+        }
+        results_list.append(add_node_metrics(results, pagerank={f"n{j}": j / 10 for j in range(i + 1)}))
+    save_many(database_path, results_list)
+    close_connections()
+    return database_path
+
+def _rows(database_path, query):
+    connection = connect_database(database_path)
+    try:
+        return connection.execute(query).fetchall()
+    finally:
+        connection.close()
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_npz_round_trip(database, tmp_path, compress):
+    summary = export.export_results(database, str(tmp_path / "out.npz"), "npz", chunk_rows=2, compress=compress)
+    assert summary["rows"] == {"analysis_results": 5, "node_metrics": 15}
+
+    tables = export.load_npz_export(summary["files"][0])
+    results = tables["analysis_results"]
+    expected = _rows(database, "SELECT id, Project_name, File_name, number_of_nodes, node_connectivity, density, "
+                               "centrality_mode FROM analysis_results ORDER BY id")
+
+    assert list(results["id"]) == [row[0] for row in expected]
+    assert list(results["Project_name"]) == [row[1] for row in expected]
+    assert list(results["File_name"]) == [row[2] for row in expected]
+    assert list(results["number_of_nodes"]) == [row[3] for row in expected]
+    # NULL in int-Spalten als Maske, in real-Spalten als NaN, in Textspalten als None
+    assert isinstance(results["node_connectivity"], np.ma.MaskedArray)
+    assert results["node_connectivity"].tolist() == [row[4] for row in expected]
+    assert [None if math.isnan(value) else value for value in results["density"]] == pytest.approx(
+        [row[5] for row in expected]
+    )
+    assert list(results["centrality_mode"]) == [row[6] for row in expected]
+    # Die JSON-Spalten mit Werten je Knoten werden nicht exportiert
+    assert "pagerank" not in results
+
+    node_metrics = tables["node_metrics"]
+    expected_nodes = _rows(database, "SELECT graph_id, node_id, metric, value FROM node_metrics")
+    exported_nodes = list(zip(node_metrics["graph_id"].tolist(), node_metrics["node_id"],
+                              node_metrics["metric"], node_metrics["value"].tolist()))
+    assert sorted(exported_nodes) == sorted(expected_nodes)
+
+def test_parquet_round_trip(database, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    summary = export.export_results(database, str(tmp_path / "out.parquet"), "parquet", chunk_rows=2)
+    assert summary["files"] == sorted([str(tmp_path / "out.parquet"), str(tmp_path / "out_node_metrics.parquet")])
+
+    results = pq.read_table(str(tmp_path / "out.parquet")).to_pydict()
+    expected = _rows(database, "SELECT File_name, node_connectivity FROM analysis_results ORDER BY id")
+    assert list(zip(results["File_name"], results["node_connectivity"])) == expected
+    assert pq.read_table(str(tmp_path / "out_node_metrics.parquet")).num_rows == 15
+
+def test_unknown_format(database, tmp_path):
+    with pytest.raises(ValueError):
+        export.export_results(database, str(tmp_path / "out.csv"), "csv")
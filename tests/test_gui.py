@@ -0,0 +1,32 @@
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QWidget
+
+from backend.database_handler import close_connections, get_connection, initialize_database
+from backend.search_index import has_search_index
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+def test_quick_search_uses_index_created_later(app, tmp_path, monkeypatch):
+    from frontend.components import analysis_section
+    database_path = str(tmp_path / "gui.db")
+    monkeypatch.setattr(analysis_section, "DATABASE_PATH", database_path)
+    section = analysis_section.AnalysisSection(QWidget())
+    section.search_input.setText("abil")
+
+    # Noch nicht migrierte Datenbank: LIKE-Suche
+    assert section.build_search()[0] == "like"
+
+    # Die Pipeline legt den Volltextindex nach dem Start der GUI an
+    initialize_database(database_path)
+    if not has_search_index(get_connection(database_path)):
+        pytest.skip("SQLite ohne FTS5")
+    assert section.build_search()[0] == "fts"
+    close_connections()
@@ -0,0 +1,129 @@
+import os
+import subprocess
+import sys
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from frontend.components import layout_cache
+from frontend.components.community_layout import compute_aggregated_layout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _positions(G):
+    return {node: (float(i), float(i % 3)) for i, node in enumerate(sorted(G, key=str))}
+
+def _assert_same_positions(actual, expected):
+    assert actual.keys() == expected.keys()
+    for node, xy in expected.items():
+        assert tuple(actual[node]) == pytest.approx(xy)
+
+def test_cache_key():
+    G = nx.path_graph(["a", "b", "c", "d"])
+    reordered = nx.Graph()
+    reordered.add_nodes_from(["d", "b", "a", "c"])
+    key = layout_cache.layout_cache_key("hash", "detail", G)
+
+    assert layout_cache.layout_cache_key("hash", "detail", reordered) == key
+    assert layout_cache.layout_cache_key("other", "detail", G) != key
+    assert layout_cache.layout_cache_key("hash", "aggregated", G) != key
+    assert layout_cache.layout_cache_key("hash", "detail", G.subgraph(["a", "b"])) != key
+    assert layout_cache.layout_cache_key("hash", "detail") != key
+
+def test_cache_key_changes_with_layout_parameters(monkeypatch):
+    from frontend.components import layout_engine
+    key = layout_cache.layout_cache_key("hash", "detail")
+    name = next(name for name in dir(layout_engine) if name.isupper() and isinstance(getattr(layout_engine, name), int))
+    monkeypatch.setattr(layout_engine, name, getattr(layout_engine, name) + 1)
+    assert layout_cache.layout_cache_key("hash", "detail") != key
+
+def test_round_trip_independent_of_node_order(tmp_path):
+    G = nx.les_miserables_graph()
+    pos = _positions(G)
+    layout_cache.store_layout("k", G, pos, directory=str(tmp_path))
+
+    # Gleicher Graph, Knoten in anderer Reihenfolge (wie bei subgraph() in einer neuen Sitzung)
+    reordered = nx.Graph()
+    reordered.add_nodes_from(reversed(list(G)))
+    reordered.add_edges_from(G.edges())
+    _assert_same_positions(layout_cache.load_layout("k", reordered, directory=str(tmp_path)), pos)
+
+    # Anderer Graph unter demselben Schlüssel: kein Treffer
+    assert layout_cache.load_layout("k", nx.path_graph(3), directory=str(tmp_path)) is None
+    assert layout_cache.load_layout("missing", G, directory=str(tmp_path)) is None
+
+def test_aggregated_round_trip(tmp_path):
+    G = nx.les_miserables_graph()
+    layout = compute_aggregated_layout(G)
+    layout_cache.store_layout("k", G, layout, directory=str(tmp_path))
+    loaded = layout_cache.load_layout("k", G, directory=str(tmp_path))
+
+    assert sorted(map(sorted, loaded.communities)) == sorted(map(sorted, layout.communities))
+    np.testing.assert_allclose(loaded.centers, layout.centers)
+    np.testing.assert_allclose(loaded.radii, layout.radii)
+    _assert_same_positions(loaded.pos, {node: tuple(xy) for node, xy in layout.pos.items()})
+    assert loaded.quotient.number_of_edges() == layout.quotient.number_of_edges()
+
+_DRILL_DOWN = """
+import sys
+import networkx as nx
+from frontend.components import layout_cache
+G = nx.les_miserables_graph()
+members = set(list(G)[:10])
+subgraph = G.subgraph(members).copy()
+key = layout_cache.layout_cache_key("hash", "detail", subgraph)
+if sys.argv[1] == "store":
+    pos = {node: (float(i), 0.0) for i, node in enumerate(sorted(subgraph, key=str))}
+    layout_cache.store_layout(key, subgraph, pos, directory=sys.argv[2])
+else:
+    pos = layout_cache.load_layout(key, subgraph, directory=sys.argv[2])
+    assert pos is not None, "Cache-Fehltreffer"
+    assert all(pos[node][0] == i for i, node in enumerate(sorted(subgraph, key=str)))
+"""
+
+def test_drill_down_hit_across_sessions(tmp_path):
+    for action, seed in (("store", "1"), ("load", "2")):
+        environment = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=ROOT)
+        subprocess.run([sys.executable, "-c", _DRILL_DOWN, action, str(tmp_path)],
+                       check=True, env=environment, cwd=ROOT)
+
+def test_corrupt_entry_is_removed(tmp_path):
+    G = nx.path_graph(4)
+    (tmp_path / "k.npz").write_bytes(b"kein npz")
+    assert layout_cache.load_layout("k", G, directory=str(tmp_path)) is None
+    assert not (tmp_path / "k.npz").exists()
+
+def _entries(directory):
+    return sorted(name[:-4] for name in os.listdir(directory) if name.endswith(".npz"))
+
+def test_eviction_by_count_keeps_recently_used(tmp_path):
+    directory = str(tmp_path)
+    G = nx.path_graph(20)
+    pos = _positions(G)
+    for i, key in enumerate("abc"):
+        layout_cache.store_layout(key, G, pos, directory=directory, max_entries=3)
+        os.utime(os.path.join(directory, f"{key}.npz"), (1000 + i, 1000 + i))
+
+    # Treffer auf "a" macht es zum zuletzt verwendeten Eintrag; "b" wird verdrängt
+    assert layout_cache.load_layout("a", G, directory=directory) is not None
+    layout_cache.store_layout("d", G, pos, directory=directory, max_entries=3)
+    assert _entries(directory) == ["a", "c", "d"]
+
+def test_eviction_by_size(tmp_path):
+    directory = str(tmp_path)
+    G = nx.path_graph(200)
+    pos = _positions(G)
+    layout_cache.store_layout("a", G, pos, directory=directory)
+    size = os.path.getsize(os.path.join(directory, "a.npz"))
+    os.utime(os.path.join(directory, "a.npz"), (1000, 1000))
+
+    layout_cache.store_layout("b", G, pos, directory=directory, max_bytes=int(size * 1.5))
+    assert _entries(directory) == ["b"]
+
+def test_failed_write_leaves_no_files(tmp_path, monkeypatch):
+    def fail(*args, **kwargs):
+        raise OSError("Datenträger voll")
+    monkeypatch.setattr(layout_cache.os, "replace", fail)
+    layout_cache.store_layout("k", nx.path_graph(3), _positions(nx.path_graph(3)), directory=str(tmp_path))
+    assert os.listdir(tmp_path) == []
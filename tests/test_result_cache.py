@@ -0,0 +1,116 @@
+import pytest
+
+from backend import result_cache
+from backend.analyzers import settings
+from backend.database_handler import close_connections, get_connection, initialize_database, save_many
+from backend.node_metrics import add_node_metrics
+
+@pytest.fixture
+def graph_file(tmp_path):
+    path = tmp_path / "Abilene.graphml"
+    path.write_text("<graphml>a</graphml>")
+    return path
+
+@pytest.fixture
+def database(tmp_path):
+    database_path = str(tmp_path / "cache.db")
+    initialize_database(database_path)
+    yield database_path
+    close_connections()
+
+def _key(path):
+    return result_cache.compute_cache_key(str(path))[0]
+
+def test_cache_key_is_stable(graph_file, tmp_path):
+    copy = tmp_path / "copy.graphml"
+    copy.write_bytes(graph_file.read_bytes())
+    # Gleicher Inhalt unter anderem Namen ergibt denselben Schlüssel
+    assert _key(graph_file) == _key(graph_file) == _key(copy)
+
+def test_cache_key_changes_with_content(graph_file):
+    key = _key(graph_file)
+    graph_file.write_text("<graphml>b</graphml>")
+    assert _key(graph_file) != key
+
+def test_cache_key_changes_with_extension(graph_file, tmp_path):
+    other = tmp_path / "Abilene.xml"
+    other.write_bytes(graph_file.read_bytes())
+    assert _key(other) != _key(graph_file)
+
+@pytest.mark.parametrize("name, value", [
+    ("ANALYZER_VERSION", settings.ANALYZER_VERSION + 1),
+    ("APPROXIMATION_SAMPLE_SIZE", settings.APPROXIMATION_SAMPLE_SIZE * 2),
+    ("SKIPPED_METRICS", ("is_planar",)),
+    ("METRIC_TIME_BUDGETS", {}),
+])
+def test_cache_key_changes_with_settings(graph_file, monkeypatch, name, value):
+    key = _key(graph_file)
+    monkeypatch.setattr(settings, name, value)
+    assert _key(graph_file) != key
+
+@pytest.mark.parametrize("name, value", [
+    ("RESULT_CACHE_ENABLED", not settings.RESULT_CACHE_ENABLED),
+    ("SPARSE_BATCH_SIZE", settings.SPARSE_BATCH_SIZE * 2),
+])
+def test_cache_key_ignores_runtime_settings(graph_file, monkeypatch, name, value):
+    key = _key(graph_file)
+    monkeypatch.setattr(settings, name, value)
+    assert _key(graph_file) == key
+
+def test_cache_entry_skips_errors_and_timeouts():
+    assert result_cache.cache_entry("k", "h", "Topology Zoo", None) is None
+    assert result_cache.cache_entry("k", "h", "Topology Zoo", {"error": "kaputt"}) is None
+    assert result_cache.cache_entry("k", "h", "Topology Zoo", {"timed_out_metrics": ["is_planar"]}) is None
+
+    results = add_node_metrics({"project_name": "Zoo", "timed_out_metrics": []}, pagerank={"a": 1.0})
+    entry = result_cache.cache_entry("k", "h", "Topology Zoo", results)
+    assert entry[0] == "k"
+    assert "node_metrics" not in entry[4]
+    assert entry[4]["pagerank_max"] == 1.0
+
+def test_lookup_and_restore_use_stored_node_metrics(graph_file, database):
+    results = add_node_metrics(
+        {"project_name": "Zoo", "file_name": "Abilene.graphml", "number_of_nodes": 2},
+        pagerank={"a": 0.25, "b": 0.75},
+    )
+    cache_key, content_hash, cached = result_cache.lookup(str(graph_file), database)
+    assert cached is None
+    save_many(database, [results], [result_cache.cache_entry(cache_key, content_hash, "Topology Zoo", results)])
+
+    _, _, cached = result_cache.lookup(str(graph_file), database)
+    assert cached is not None
+    restored, needs_row = result_cache.restore(database, cached[1], "uploads/Renamed.graphml", save=False)
+    assert needs_row
+    assert restored["file_name"] == "Renamed.graphml"
+    assert restored["node_metrics"] == {"pagerank": {"a": 0.25, "b": 0.75}}
+
+def test_lookup_misses_after_results_are_deleted(graph_file, database):
+    results = add_node_metrics({"project_name": "Zoo", "file_name": "Abilene.graphml"}, pagerank={"a": 1.0})
+    cache_key, content_hash, _ = result_cache.lookup(str(graph_file), database)
+    save_many(database, [results], [result_cache.cache_entry(cache_key, content_hash, "Topology Zoo", results)])
+
+    connection = get_connection(database)
+    with connection:
+        connection.execute("DELETE FROM analysis_results")
+    assert result_cache.lookup(str(graph_file), database)[2] is None
+
+def test_same_file_name_in_one_batch(tmp_path, database):
+    """
+    Gleichnamige Dateien aus verschiedenen Verzeichnissen im selben save_many-Aufruf:
+    Jeder Cache-Eintrag verweist auf die Knotenwerte seiner eigenen Zeile.
+    """
+    entries, rows = [], []
+    for directory, pagerank in (("a", {"x": 1.0}), ("b", {"y": 0.5, "z": 0.5})):
+        path = tmp_path / directory / "Abilene.graphml"
+        path.parent.mkdir()
+        path.write_text(f"<graphml>{directory}</graphml>")
+        results = add_node_metrics({"project_name": "Zoo", "file_name": "Abilene.graphml"}, pagerank=pagerank)
+        cache_key, content_hash, _ = result_cache.lookup(str(path), database)
+        rows.append(results)
+        entries.append(result_cache.cache_entry(cache_key, content_hash, "Topology Zoo", results))
+    save_many(database, rows, entries)
+
+    for directory, pagerank in (("a", {"x": 1.0}), ("b", {"y": 0.5, "z": 0.5})):
+        _, _, cached = result_cache.lookup(str(tmp_path / directory / "Abilene.graphml"), database)
+        restored, _ = result_cache.restore(database, cached[1], f"{directory}.graphml", save=False)
+        assert restored["node_metrics"] == {"pagerank": pagerank}
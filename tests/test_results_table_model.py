@@ -0,0 +1,66 @@
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from backend.database_handler import close_connections, get_connection, initialize_database, save_many
+from backend.search_index import fts_query, has_search_index
+from frontend.components.results_table_model import ResultsTableModel
+
+COLUMNS = ["File_name", "number_of_nodes", "density"]
+
+@pytest.fixture
+def database(tmp_path):
+    database_path = str(tmp_path / "table.db")
+    initialize_database(database_path)
+    save_many(database_path, [
+        {
+            "project_name": "Zoo" if i % 3 else "SNDlib",
+            "file_name": f"graph_{i}.graphml",
+            "number_of_nodes": i % 17,
+            "density": None if i % 5 == 0 else i / 1000,
+            "node_labels": "Frankfurt" if i % 2 else "Berlin",
+        }
+        for i in range(2 * ResultsTableModel.PAGE_SIZE + 57)
+    ])
+    yield database_path
+    close_connections()
+
+def _expected(database_path, conditions, params):
+    query = f"SELECT {', '.join(COLUMNS)} FROM analysis_results"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY number_of_nodes DESC, id DESC"
+    return [
+        {column: "N/A" if value is None else str(value) for column, value in zip(COLUMNS, row)}
+        for row in get_connection(database_path).execute(query, params)
+    ]
+
+@pytest.mark.parametrize("conditions, params", [
+    ([], []),
+    (["Project_name = ?"], ["Zoo"]),
+])
+def test_all_rows_includes_unloaded_pages(database, conditions, params):
+    model = ResultsTableModel(database)
+    model.set_query(COLUMNS, conditions, params, "number_of_nodes")
+    expected = _expected(database, conditions, params)
+
+    assert len(model.loaded_rows()) == ResultsTableModel.PAGE_SIZE
+    assert model.all_rows() == expected
+    # Seitenweises Nachladen liefert dieselben Zeilen
+    while model.canFetchMore():
+        model.fetchMore()
+    assert model.loaded_rows() == expected
+
+def test_all_rows_with_search(database):
+    if not has_search_index(get_connection(database)):
+        pytest.skip("SQLite ohne FTS5")
+    model = ResultsTableModel(database)
+    model.set_query(COLUMNS, ["Project_name = ?"], ["Zoo"], "number_of_nodes", search=fts_query("frank"))
+    rows = model.all_rows()
+
+    while model.canFetchMore():
+        model.fetchMore()
+    assert rows == model.loaded_rows()
+    assert len(rows) == sum(
+        1 for i in range(2 * ResultsTableModel.PAGE_SIZE + 57) if i % 2 and i % 3
+    )
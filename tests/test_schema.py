@@ -0,0 +1,138 @@
+import json
+
+from backend.database_handler import connect_database
+from backend.schema import SCHEMA_VERSION, migrate, schema_version
+
+# Tabelle "analysis_results" vor Einführung der Migrationen (Metriken als TEXT, Knotenwerte als JSON)
+LEGACY_SCHEMA = """
+    CREATE TABLE analysis_results (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        Project_name TEXT,
+        File_name TEXT,
+        is_directed BOOLEAN,
+        number_of_nodes INTEGER,
+        number_of_edges INTEGER,
+        is_connected BOOLEAN,
+        is_strongly_connected BOOLEAN,
+        is_weakly_connected BOOLEAN,
+        node_connectivity TEXT,
+        edge_connectivity TEXT,
+        global_efficiency TEXT,
+        local_efficiency TEXT,
+        graph_center TEXT,
+        degree_centrality TEXT,
+        betweenness_centrality TEXT,
+        closeness_centrality TEXT,
+        pagerank TEXT,
+        diameter TEXT,
+        radius TEXT,
+        periphery TEXT,
+        density REAL,
+        is_tree BOOLEAN,
+        is_forest BOOLEAN,
+        is_bipartite BOOLEAN,
+        is_planar BOOLEAN,
+        is_multigraph BOOLEAN
+    )
+"""
+
+def _legacy_database(path):
+    connection = connect_database(str(path))
+    connection.execute(LEGACY_SCHEMA)
+    connection.execute(
+        """
+        INSERT INTO analysis_results (
+            Project_name, File_name, is_directed, number_of_nodes, number_of_edges, is_connected,
+            node_connectivity, edge_connectivity, global_efficiency, pagerank, degree_centrality,
+            diameter, radius, density, is_tree
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        ("Zoo", "Abilene.graphml", 0, 3, 2, 1, "1", "N/A", "0.8333", json.dumps({"a": 0.25, "b": 0.5, "c": 0.25}),
+         json.dumps({"a": 0.5, "b": 1.0, "c": 0.5}), "2", "Timeout", 0.6667, 1),
+    )
+    connection.commit()
+    return connection
+
+def test_migrate_legacy_database(tmp_path):
+    connection = _legacy_database(tmp_path / "legacy.db")
+    assert schema_version(connection) == 0
+
+    assert migrate(connection) == 0
+    assert schema_version(connection) == SCHEMA_VERSION
+
+    # Version 2: Zahlenwerte typisiert, "N/A"/"Timeout" als NULL
+    row = connection.execute(
+        "SELECT id, typeof(node_connectivity), node_connectivity, edge_connectivity, "
+        "global_efficiency, diameter, radius FROM analysis_results"
+    ).fetchone()
+    graph_id = row[0]
+    assert row[1:] == ("integer", 1, None, 0.8333, 2, None)
+
+    # Version 1: JSON-Spalten in "node_metrics" übertragen und zusammengefasst
+    node_rows = connection.execute(
+        "SELECT node_id, value FROM node_metrics WHERE graph_id = ? AND metric = 'pagerank' ORDER BY node_id",
+        (graph_id,),
+    ).fetchall()
+    assert node_rows == [("a", 0.25), ("b", 0.5), ("c", 0.25)]
+    pagerank_max, degree_mean = connection.execute(
+        "SELECT pagerank_max, degree_centrality_mean FROM analysis_results"
+    ).fetchone()
+    assert pagerank_max == 0.5
+    assert abs(degree_mean - 2 / 3) < 1e-12
+
+    # Version 3 und 5: Indizes
+    indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_analysis_results_project_file", "idx_analysis_results_pagerank_max"} <= indexes
+
+    # Version 4: Kennzahlen je Datensatz aus dem Bestand berechnet
+    aggregate = connection.execute(
+        "SELECT value_count, value_sum FROM dataset_aggregates WHERE project_name = 'Zoo' AND metric = 'number_of_nodes'"
+    ).fetchone()
+    assert aggregate == (1, 3)
+
+    # Version 6: Bestehende Einträge im Volltextindex (falls SQLite FTS5 unterstützt)
+    has_fts = connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'graph_search'").fetchone()
+    if has_fts:
+        hits = connection.execute("SELECT rowid FROM graph_search WHERE graph_search MATCH '\"abilene\"*'").fetchall()
+        assert hits == [(graph_id,)]
+    connection.close()
+
+def test_migrate_is_idempotent(tmp_path):
+    connection = connect_database(str(tmp_path / "new.db"))
+    assert migrate(connection) == 0
+    tables = connection.execute("SELECT name, sql FROM sqlite_master ORDER BY name").fetchall()
+
+    assert migrate(connection) == SCHEMA_VERSION
+    assert connection.execute("SELECT name, sql FROM sqlite_master ORDER BY name").fetchall() == tables
+    connection.close()
+
+def test_node_metrics_survive_table_rebuild(tmp_path):
+    """
+    Version 2 legt "analysis_results" neu an; die Verweise aus "node_metrics" dürfen dabei
+    weder gelöscht werden noch ins Leere zeigen.
+    """
+    connection = _legacy_database(tmp_path / "legacy.db")
+    migrate(connection)
+    dangling = connection.execute(
+        "SELECT COUNT(*) FROM node_metrics WHERE graph_id NOT IN (SELECT id FROM analysis_results)"
+    ).fetchone()[0]
+    assert dangling == 0
+    assert connection.execute("SELECT COUNT(*) FROM node_metrics").fetchone()[0] == 6
+    connection.close()
+
+def test_deleted_ids_are_not_reused(tmp_path):
+    """
+    Version 2 legt "analysis_results" neu an; ids gelöschter Zeilen dürfen danach nicht
+    erneut vergeben werden (Einträge im Ergebnis-Cache verweisen per graph_id darauf).
+    """
+    for remaining in (1, 0):
+        connection = _legacy_database(tmp_path / f"legacy_{remaining}.db")
+        for _ in range(2):
+            connection.execute("INSERT INTO analysis_results (Project_name, File_name) VALUES ('Zoo', 'x.graphml')")
+        connection.execute("DELETE FROM analysis_results WHERE id > ?", (remaining,))
+        connection.commit()
+
+        migrate(connection)
+        cursor = connection.execute("INSERT INTO analysis_results (Project_name, File_name) VALUES ('Zoo', 'y.graphml')")
+        assert cursor.lastrowid == 4
+        connection.close()
@@ -0,0 +1,58 @@
+import networkx as nx
+import pytest
+
+from backend.database_handler import close_connections, get_connection, initialize_database, save_many
+from backend.search_index import SEARCH_TABLE, fts_query, has_search_index, node_label_text
+
+def test_fts_query():
+    assert fts_query("frank zoo") == '"frank"* AND "zoo"*'
+    assert fts_query("  Frankfurt  ") == '"Frankfurt"*'
+
+def test_fts_query_without_words():
+    assert fts_query("") is None
+    assert fts_query(' "* () - ') is None
+
+def test_fts_query_ignores_fts_syntax():
+    # Operatoren und Anführungszeichen der Eingabe werden nicht als FTS5-Syntax ausgewertet
+    assert fts_query('a" OR b NEAR(c)') == '"a"* AND "OR"* AND "b"* AND "NEAR"* AND "c"*'
+
+def test_node_label_text():
+    G = nx.Graph()
+    G.add_node("Berlin")
+    G.add_node("17", label="Frankfurt", Country="Germany")
+    G.add_node(42, name="r1.example.net", loc="@Stockholm,+Sweden")
+    assert node_label_text(G).split(" ") == sorted(
+        ["Berlin", "Frankfurt", "Germany", "r1.example.net", "@Stockholm,+Sweden"]
+    )
+
+@pytest.fixture
+def database(tmp_path):
+    database_path = str(tmp_path / "search.db")
+    initialize_database(database_path)
+    if not has_search_index(get_connection(database_path)):
+        pytest.skip("SQLite ohne FTS5")
+    yield database_path
+    close_connections()
+
+def _search(database_path, text):
+    rows = get_connection(database_path).execute(
+        f"SELECT file FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH ? ORDER BY file", (fts_query(text),)
+    )
+    return [row[0] for row in rows]
+
+def test_search_by_project_file_and_node(database):
+    save_many(database, [
+        {"project_name": "Topology Zoo", "file_name": "Abilene.graphml", "node_labels": "Denver Kansas"},
+        {"project_name": "SNDlib", "file_name": "germany50.graphml", "node_labels": "Frankfurt Berlin"},
+    ])
+    assert _search(database, "abil") == ["Abilene.graphml"]
+    assert _search(database, "frank") == ["germany50.graphml"]
+    assert _search(database, "topology den") == ["Abilene.graphml"]
+    assert _search(database, "sndlib denver") == []
+
+def test_search_index_follows_deletes(database):
+    save_many(database, [{"project_name": "Zoo", "file_name": "Abilene.graphml", "node_labels": "Denver"}])
+    connection = get_connection(database)
+    with connection:
+        connection.execute("DELETE FROM analysis_results")
+    assert _search(database, "denver") == []
@@ -0,0 +1,64 @@
+import networkx as nx
+import pytest
+
+from backend.analyzers import sparse_backend
+from backend.analyzers.distance_metrics import compute_distance_metrics
+
+pytestmark = pytest.mark.skipif(not sparse_backend.SCIPY_AVAILABLE, reason="SciPy/NumPy nicht installiert")
+
+def _weighted():
+    G = nx.gnp_random_graph(25, 0.2, seed=5)
+    for i, (u, v) in enumerate(G.edges()):
+        G[u][v]["weight"] = 1 + i % 3
+    return G
+
+GRAPHS = {
+    "karate": nx.karate_club_graph(),
+    "disconnected": nx.disjoint_union(nx.cycle_graph(5), nx.star_graph(3)),
+    "bipartite": nx.complete_bipartite_graph(3, 4),
+    "directed": nx.gnp_random_graph(30, 0.1, seed=3, directed=True),
+    "multigraph": nx.MultiGraph([(0, 1), (0, 1), (1, 2), (2, 0), (2, 3), (3, 3)]),
+    "weighted": _weighted(),
+    "string_nodes": nx.relabel_nodes(nx.path_graph(6), lambda n: f"n{n}"),
+}
+
+def _assert_close(actual, expected):
+    assert actual.keys() == expected.keys()
+    for node, value in expected.items():
+        assert actual[node] == pytest.approx(value, abs=1e-6)
+
+@pytest.mark.parametrize("name", GRAPHS)
+def test_matches_networkx(name):
+    G = GRAPHS[name]
+    csr = sparse_backend.CSRGraph(G)
+
+    _assert_close(csr.degree_centrality(), nx.degree_centrality(G))
+    _assert_close(csr.pagerank(), nx.pagerank(G))
+    assert csr.density() == pytest.approx(nx.density(G))
+    assert csr.is_bipartite() == nx.is_bipartite(G)
+
+@pytest.mark.parametrize("name", GRAPHS)
+@pytest.mark.parametrize("batch_size", [1, 4, 256])
+def test_distance_metrics_match_networkx_pass(name, batch_size):
+    G = GRAPHS[name]
+    expected = compute_distance_metrics(G)
+    actual = sparse_backend.CSRGraph(G).distance_metrics(batch_size=batch_size)
+
+    for key in ("eccentricity", "diameter", "radius"):
+        assert actual[key] == expected[key]
+    for key in ("center", "periphery"):
+        assert (actual[key] is None) == (expected[key] is None)
+        if expected[key] is not None:
+            assert sorted(actual[key]) == sorted(expected[key])
+    assert actual["global_efficiency"] == pytest.approx(expected["global_efficiency"])
+    _assert_close(actual["closeness_centrality"], expected["closeness_centrality"])
+
+def test_backend_selection(monkeypatch):
+    G = nx.path_graph(10)
+    assert sparse_backend.build_csr_backend(G, "networkx") is None
+    assert isinstance(sparse_backend.build_csr_backend(G, "sparse"), sparse_backend.CSRGraph)
+
+    monkeypatch.setattr(sparse_backend.settings, "SPARSE_NODE_THRESHOLD", 11)
+    assert sparse_backend.build_csr_backend(G, "auto") is None
+    monkeypatch.setattr(sparse_backend.settings, "SPARSE_NODE_THRESHOLD", 10)
+    assert isinstance(sparse_backend.build_csr_backend(G, "auto"), sparse_backend.CSRGraph)